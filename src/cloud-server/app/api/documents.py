@@ -3,10 +3,12 @@ Document processing API endpoints for ArchBuilder.AI
 Handles multi-format CAD file processing, RAG generation, and document analysis
 """
 
+import asyncio
 from typing import List, Optional
 from uuid import uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from ..core.auth.authentication import get_current_user
@@ -19,15 +21,43 @@ from ..models.documents import (
     DocumentAnalysisResponse,
     DocumentSearchRequest,
     DocumentSearchResponse,
+    DocumentProcessingRequest,
+    DocumentUploadRequest,
     SupportedFormat
 )
 from ..services.document_service import document_service
 
 router = APIRouter(prefix="/documents", tags=["documents"])
 
+SUPPORTED_UPLOAD_EXTENSIONS = ['.dwg', '.dxf', '.ifc', '.pdf', '.rvt', '.skp', '.3dm', '.step', '.iges']
+
+# Billing units charged per uploaded document
+DOCUMENT_UPLOAD_COST_UNITS = 2
+
+
+def _validate_upload_file(file: UploadFile, cloud_storage_gb: int) -> None:
+    """Reject unsupported formats and files over the subscription storage limit"""
+    
+    file_extension = None
+    if file.filename:
+        file_extension = '.' + file.filename.split('.')[-1].lower()
+    
+    if not file_extension or file_extension not in SUPPORTED_UPLOAD_EXTENSIONS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unsupported file format. Supported formats: {', '.join(SUPPORTED_UPLOAD_EXTENSIONS)}"
+        )
+    
+    max_file_size = cloud_storage_gb * 1024 * 1024 * 1024  # Convert GB to bytes
+    if file.size and file.size > max_file_size:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File size exceeds subscription limit of {cloud_storage_gb}GB"
+        )
+
 
 @router.post("/upload", response_model=DocumentUploadResponse, status_code=status.HTTP_201_CREATED)
-@track_usage("document_upload", cost_units=2)
+@track_usage("document_upload", cost_units=DOCUMENT_UPLOAD_COST_UNITS)
 async def upload_document(
     file: UploadFile = File(...),
     document_type: str = Form(...),
@@ -53,27 +83,9 @@ async def upload_document(
             detail="Document upload limit exceeded. Please upgrade your subscription."
         )
     
-    # Validate file type
-    supported_extensions = ['.dwg', '.dxf', '.ifc', '.pdf', '.rvt', '.skp', '.3dm', '.step', '.iges']
-    file_extension = None
-    if file.filename:
-        file_extension = '.' + file.filename.split('.')[-1].lower()
-    
-    if not file_extension or file_extension not in supported_extensions:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Unsupported file format. Supported formats: {', '.join(supported_extensions)}"
-        )
-    
-    # Check file size
+    # Validate file type and size
     subscription = await billing_service.get_subscription_details(current_user.id, db)
-    max_file_size = subscription.limits.cloud_storage_gb * 1024 * 1024 * 1024  # Convert GB to bytes
-    
-    if file.size and file.size > max_file_size:
-        raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail=f"File size exceeds subscription limit of {subscription.limits.cloud_storage_gb}GB"
-        )
+    _validate_upload_file(file, subscription.limits.cloud_storage_gb)
     
     try:
         upload_result = await document_service.upload_document(
@@ -92,6 +104,95 @@ async def upload_document(
         )
 
 
+@router.post("/upload/batch", status_code=status.HTTP_201_CREATED)
+async def upload_documents_batch(
+    files: List[UploadFile] = File(...),
+    document_type: str = Form(...),
+    project_id: Optional[str] = Form(None),
+    current_user = Depends(get_current_user),
+    db: Session = Depends(get_db)
+) -> dict:
+    """
+    Upload and process several documents in one request
+    
+    Files are uploaded and then processed concurrently, bounded by the document
+    service concurrency limit. A failed file does not fail the rest of the batch.
+    Usage is billed per uploaded file.
+    """
+    
+    # Check usage limits
+    if not await billing_service.check_usage_limit(current_user.id, "document_upload", db):
+        raise HTTPException(
+            status_code=status.HTTP_402_PAYMENT_REQUIRED,
+            detail="Document upload limit exceeded. Please upgrade your subscription."
+        )
+    
+    # Validate every file before uploading any of them
+    subscription = await billing_service.get_subscription_details(current_user.id, db)
+    for file in files:
+        _validate_upload_file(file, subscription.limits.cloud_storage_gb)
+    
+    correlation_id = str(uuid4())
+    semaphore = asyncio.Semaphore(document_service.max_concurrency)
+    
+    async def upload_single(file: UploadFile) -> DocumentUploadResponse:
+        async with semaphore:
+            upload_request = DocumentUploadRequest(
+                filename=file.filename,
+                file_data=await file.read(),
+                document_type=document_type,
+                project_id=project_id
+            )
+            return await document_service.upload_document(upload_request, correlation_id)
+    
+    try:
+        upload_results = await asyncio.gather(
+            *(upload_single(file) for file in files),
+            return_exceptions=True
+        )
+        
+        uploaded = []
+        failed = []
+        for file, result in zip(files, upload_results):
+            if isinstance(result, Exception):
+                failed.append({"filename": file.filename, "error": str(result)})
+            else:
+                uploaded.append(result)
+        
+        if uploaded:
+            await billing_service.track_usage(
+                current_user.id,
+                "document_upload",
+                DOCUMENT_UPLOAD_COST_UNITS * len(uploaded),
+                db,
+                metadata={"correlation_id": correlation_id, "file_count": len(uploaded)}
+            )
+        
+        processing_results = await document_service.process_documents_batch(
+            [
+                DocumentProcessingRequest(
+                    document_id=upload_result.document_id,
+                    processing_type=document_type
+                )
+                for upload_result in uploaded
+            ],
+            correlation_id
+        )
+        
+        return {
+            "correlation_id": correlation_id,
+            "uploaded": uploaded,
+            "processing": processing_results,
+            "failed": failed
+        }
+        
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Batch document upload failed: {str(e)}"
+        )
+
+
 @router.get("", response_model=List[DocumentResponse])
 async def list_documents(
     current_user = Depends(get_current_user),
@@ -289,6 +390,50 @@ async def get_document_preview(
         )
 
 
+@router.get("/{document_id}/content")
+async def get_document_content(
+    document_id: str,
+    current_user = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Get processed document content (streamed for large documents)
+    """
+    
+    correlation_id = str(uuid4())
+    
+    try:
+        # Unknown documents and documents owned by another user look the same to the caller
+        metadata = await document_service.get_document_metadata(document_id, correlation_id)
+        
+        if metadata is None or getattr(metadata, "user_id", None) != current_user.id:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Document not found or access denied"
+            )
+        
+        content_stream = await document_service.get_document_content_stream(
+            document_id=document_id,
+            correlation_id=correlation_id
+        )
+        
+        if content_stream is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Document content not available"
+            )
+        
+        return StreamingResponse(content_stream, media_type="application/json")
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve document content: {str(e)}"
+        )
+
+
 @router.get("/{document_id}/download")
 async def download_document(
     document_id: str,
@@ -128,9 +128,18 @@ class SchedulerStatsResponse(BaseModel):
     generated_at: str
 
 
+# Shared email service (keeps its pooled SMTP connections across requests)
+_email_service: Optional[EmailService] = None
+
+
 # Dependency injection for services
 async def get_email_service() -> EmailService:
     """Get email service instance."""
+    global _email_service
+    
+    if _email_service is not None:
+        return _email_service
+    
     # In production, this would be injected from a service container
     config = EmailConfig(
         smtp_server="smtp.gmail.com",
@@ -144,7 +153,17 @@ async def get_email_service() -> EmailService:
         templates_dir="templates/email",
         base_url="https://archbuilder.ai"
     )
-    return EmailService(config)
+    _email_service = EmailService(config)
+    return _email_service
+
+
+async def close_email_service() -> None:
+    """Close the shared email service's pooled SMTP connections on shutdown."""
+    global _email_service
+    
+    if _email_service is not None:
+        await _email_service.aclose()
+        _email_service = None
 
 
 async def get_notification_scheduler(email_service: EmailService = Depends(get_email_service)) -> NotificationScheduler:
@@ -54,6 +54,7 @@ class Settings(BaseModel):
     # File upload settings
     MAX_FILE_SIZE: int = 100 * 1024 * 1024  # 100MB
     UPLOAD_DIR: str = "uploads"
+    DOCUMENT_PERSISTENCE_PATH: Optional[str] = None  # SQLite file for document metadata; None disables
     
     # Logging settings
     LOG_LEVEL: str = "INFO"
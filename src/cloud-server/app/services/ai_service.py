@@ -13,6 +13,7 @@ from typing import Any, Dict, List, Optional, Union, Tuple
 import structlog
 from pydantic import BaseModel, Field, ValidationError
 import httpx
+import orjson
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 from app.models.ai import (
@@ -907,17 +908,17 @@ class AIService:
             
             response = await self.vertex_client.post(
                 f"/v1/projects/{settings.VERTEX_AI_PROJECT_ID}/locations/{settings.VERTEX_AI_LOCATION}/publishers/google/models/{model_name}:generateContent",
-                json=payload,
-                headers={"X-Correlation-ID": correlation_id}
+                content=orjson.dumps(payload),
+                headers={"Content-Type": "application/json", "X-Correlation-ID": correlation_id}
             )
             
             response.raise_for_status()
-            result = response.json()
+            result = orjson.loads(response.content)
             
             # Extract content from Vertex AI response
             if "candidates" in result and result["candidates"]:
                 content_text = result["candidates"][0]["content"]["parts"][0]["text"]
-                ai_output = json.loads(content_text)
+                ai_output = orjson.loads(content_text)
                 
                 logger.info(
                     "Vertex AI call successful",
@@ -972,17 +973,17 @@ class AIService:
             
             response = await self.github_client.post(
                 "/chat/completions",
-                json=payload,
-                headers={"X-Correlation-ID": correlation_id}
+                content=orjson.dumps(payload),
+                headers={"Content-Type": "application/json", "X-Correlation-ID": correlation_id}
             )
             
             response.raise_for_status()
-            result = response.json()
+            result = orjson.loads(response.content)
             
             # Extract content from GitHub Models response
             if "choices" in result and result["choices"]:
                 content_text = result["choices"][0]["message"]["content"]
-                ai_output = json.loads(content_text)
+                ai_output = orjson.loads(content_text)
                 
                 logger.info(
                     "GitHub Models call successful",
@@ -1014,8 +1015,8 @@ class AIService:
                        if k not in ["correlation_id", "timestamp"]}
         }
         
-        cache_json = json.dumps(cache_data, sort_keys=True)
-        cache_hash = hashlib.md5(cache_json.encode()).hexdigest()
+        cache_json = orjson.dumps(cache_data, option=orjson.OPT_SORT_KEYS)
+        cache_hash = hashlib.md5(cache_json).hexdigest()
         
         return f"ai_command:{cache_hash[:16]}"
     
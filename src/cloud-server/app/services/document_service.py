@@ -5,14 +5,20 @@ metadata extraction, and secure file management
 """
 
 import os
+import sys
+import time
 import asyncio
+import heapq
 import hashlib
 import mimetypes
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, BinaryIO, Tuple
+from typing import Any, AsyncIterator, Callable, Dict, Hashable, List, Optional, Union, BinaryIO, Tuple
 import structlog
 import aiofiles
+import aiosqlite
+import orjson
 from pydantic import ValidationError
 
 from app.models.documents import (
@@ -39,7 +45,7 @@ from app.documents.parsers.pdf_parser import PDFParser
 from app.documents.parsers.ifc_parser import IFCParser
 from app.documents.extractors.content_extractor import ContentExtractor
 from app.documents.validation.document_validator import DocumentValidator
-from app.services.rag_service import RAGService
+from app.services.rag_service import RAGService, rag_service
 from app.utils.security import SecurityUtils
 from app.utils.cache import AsyncCache
 from app.utils.performance import PerformanceTracker
@@ -47,6 +53,17 @@ from app.utils.performance import PerformanceTracker
 logger = structlog.get_logger(__name__)
 
 
+def _remove_file_if_exists(file_path: str) -> bool:
+    """Remove a stored file (blocking - run via asyncio.to_thread)"""
+    
+    # Single unlink instead of exists() + remove(): one syscall, no TOCTOU race
+    try:
+        os.unlink(file_path)
+        return True
+    except FileNotFoundError:
+        return False
+
+
 class FileUploadHandler:
     """Secure file upload handling with validation and virus scanning"""
     
@@ -294,7 +311,7 @@ class FileUploadHandler:
             original_filename=filename,
             file_size_bytes=len(file_data),
             file_type=self._detect_file_type(Path(filename).suffix),
-            mime_type=mimetypes.guess_type(filename)[0] or "application/octet-stream",
+            mime_type=sys.intern(mimetypes.guess_type(filename)[0] or "application/octet-stream"),
             file_hash=file_hash,
             upload_timestamp=datetime.utcnow(),
             storage_path=str(file_path),
@@ -350,6 +367,11 @@ class DocumentParser:
             else:
                 content = await self._parse_generic(file_path, correlation_id)
             
+            # Intern small, highly repeated string fields shared across documents
+            for field in ("format", "language"):
+                if isinstance(content.get(field), str):
+                    content[field] = sys.intern(content[field])
+            
             # Extract additional metadata
             content["extraction_metadata"] = {
                 "parser_version": "1.0",
@@ -404,8 +426,8 @@ class DocumentParser:
         try:
             import ezdxf
             
-            # Load DXF document
-            doc = ezdxf.readfile(file_path)
+            # Load DXF document (blocking read + parse, keep it off the event loop)
+            doc = await asyncio.to_thread(ezdxf.readfile, file_path)
             
             entities = []
             layers = []
@@ -574,7 +596,7 @@ class DocumentParser:
     async def _parse_generic(self, file_path: str, correlation_id: str) -> Dict[str, Any]:
         """Generic file parsing for unknown formats"""
         
-        file_stat = os.stat(file_path)
+        file_stat = await asyncio.to_thread(os.stat, file_path)
         
         return {
             "format": "UNKNOWN",
@@ -703,16 +725,30 @@ class DocumentParser:
 class DocumentService:
     """Comprehensive document processing service with multi-format support"""
     
+    # Serialized response cache limits
+    SERIALIZED_CACHE_MAXSIZE = 1024
+    SERIALIZED_CACHE_TTL_SECONDS = 30.0
+    
+    # Documents with more sections than this are streamed section by section
+    CONTENT_STREAM_SECTION_THRESHOLD = 256
+    
+    # Write-behind persistence batching
+    PERSIST_BATCH_SIZE = 128
+    PERSIST_BATCH_WINDOW_SECONDS = 0.05
+    
     def __init__(
         self,
         rag_service: Optional[RAGService] = None,
         cache: Optional[AsyncCache] = None,
         performance_tracker: Optional[PerformanceTracker] = None,
-        upload_path: str = "./uploads"
+        upload_path: str = "./uploads",
+        max_concurrency: int = 5,
+        persistence_path: Optional[str] = None
     ):
         self.rag_service = rag_service
         self.cache = cache
         self.performance_tracker = performance_tracker
+        self.max_concurrency = max_concurrency
         
         # Initialize components
         self.upload_handler = FileUploadHandler(upload_path)
@@ -722,8 +758,175 @@ class DocumentService:
         # Document storage
         self.documents: Dict[str, DocumentMetadata] = {}
         
+        # Serialized response cache (LRU + TTL), invalidated by version bumps
+        self._doc_versions: Dict[str, int] = {}
+        self._meta_cache: "OrderedDict[Hashable, Tuple[int, float, bytes]]" = OrderedDict()
+        
+        # SHA-256 of the text last indexed in RAG, per document
+        self._rag_content_hashes: Dict[str, bytes] = {}
+        
+        # Write-behind persistence of self.documents (SQLite), started on first mutation
+        self.persistence_path = persistence_path
+        self._persist_queue: Optional[asyncio.Queue] = None
+        self._persist_task: Optional[asyncio.Task] = None
+        self._persist_disabled = False
+        
         logger.info("Document Service initialized")
     
+    def _bump_version(self, document_id: str) -> None:
+        """Invalidate cached serializations after metadata or content changes"""
+        
+        self._doc_versions[document_id] = self._doc_versions.get(document_id, 0) + 1
+        self._schedule_persist(document_id)
+    
+    def _evict_cached_serializations(self, document_id: str) -> None:
+        """Drop all cached serializations for a document"""
+        
+        self._meta_cache.pop(("content", document_id), None)
+        self._doc_versions.pop(document_id, None)
+    
+    def _schedule_persist(self, document_id: str) -> None:
+        """Queue a document for write-behind persistence (no-op when disabled)"""
+        
+        if not self.persistence_path or self._persist_disabled:
+            return
+        
+        if self._persist_task is None:
+            self._persist_queue = asyncio.Queue()
+            self._persist_task = asyncio.create_task(self._persist_flush_loop())
+        
+        self._persist_queue.put_nowait(document_id)
+    
+    async def _persist_flush_loop(self) -> None:
+        """Run the write-behind writer; disable persistence if it cannot continue"""
+        
+        try:
+            await self._persist_batches()
+        except Exception as e:
+            # Stop enqueuing so the queue cannot grow without a consumer
+            self._persist_disabled = True
+            self._persist_queue = None
+            logger.error(
+                "Document persistence stopped",
+                persistence_path=self.persistence_path,
+                error=str(e),
+                exc_info=True
+            )
+    
+    async def _persist_batches(self) -> None:
+        """Drain queued document ids in batches and write them in one transaction"""
+        
+        loop = asyncio.get_running_loop()
+        
+        async with aiosqlite.connect(self.persistence_path) as db:
+            await self._ensure_persist_schema(db)
+            
+            stopping = False
+            while not stopping:
+                document_id = await self._persist_queue.get()
+                if document_id is None:
+                    break
+                
+                # Collect a batch: up to PERSIST_BATCH_SIZE ids or until the window closes
+                batch = {document_id}
+                deadline = loop.time() + self.PERSIST_BATCH_WINDOW_SECONDS
+                while len(batch) < self.PERSIST_BATCH_SIZE:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        document_id = await asyncio.wait_for(self._persist_queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                    if document_id is None:
+                        stopping = True
+                        break
+                    batch.add(document_id)
+                
+                try:
+                    await self._write_persist_batch(db, batch)
+                except Exception as e:
+                    logger.error(
+                        "Document persistence flush failed",
+                        batch_size=len(batch),
+                        error=str(e),
+                        exc_info=True
+                    )
+    
+    async def _ensure_persist_schema(self, db: aiosqlite.Connection) -> None:
+        """Create the persistence table if needed"""
+        
+        await db.execute(
+            "CREATE TABLE IF NOT EXISTS documents ("
+            "document_id TEXT PRIMARY KEY, metadata BLOB NOT NULL)"
+        )
+        await db.commit()
+    
+    async def _write_persist_batch(self, db: aiosqlite.Connection, document_ids: set) -> None:
+        """Write the current state of a batch of documents (deleted ids are removed)"""
+        
+        upserts = []
+        deletes = []
+        for document_id in document_ids:
+            metadata = self.documents.get(document_id)
+            if metadata is None:
+                deletes.append((document_id,))
+            else:
+                upserts.append((document_id, orjson.dumps(metadata.model_dump(mode="json"))))
+        
+        if upserts:
+            await db.executemany(
+                "INSERT OR REPLACE INTO documents (document_id, metadata) VALUES (?, ?)",
+                upserts
+            )
+        if deletes:
+            await db.executemany("DELETE FROM documents WHERE document_id = ?", deletes)
+        await db.commit()
+    
+    async def load_persisted_documents(self) -> int:
+        """Restore document metadata written by the write-behind persistence layer"""
+        
+        if not self.persistence_path or not await asyncio.to_thread(os.path.exists, self.persistence_path):
+            return 0
+        
+        loaded = 0
+        async with aiosqlite.connect(self.persistence_path) as db:
+            await self._ensure_persist_schema(db)
+            async with db.execute("SELECT document_id, metadata FROM documents") as cursor:
+                async for document_id, payload in cursor:
+                    self.documents[document_id] = DocumentMetadata.model_validate_json(payload)
+                    loaded += 1
+        
+        logger.info("Persisted documents loaded", document_count=loaded)
+        
+        return loaded
+    
+    def _get_cached_serialization(
+        self,
+        cache_key: Hashable,
+        document_id: str,
+        serialize: Callable[[], bytes]
+    ) -> bytes:
+        """Return cached JSON bytes for the current document version or rebuild them"""
+        
+        version = self._doc_versions.get(document_id, 0)
+        now = time.monotonic()
+        
+        entry = self._meta_cache.get(cache_key)
+        if entry is not None and entry[0] == version and entry[1] > now:
+            self._meta_cache.move_to_end(cache_key)
+            return entry[2]
+        
+        payload = serialize()
+        self._meta_cache[cache_key] = (version, now + self.SERIALIZED_CACHE_TTL_SECONDS, payload)
+        self._meta_cache.move_to_end(cache_key)
+        
+        # LRU eviction
+        while len(self._meta_cache) > self.SERIALIZED_CACHE_MAXSIZE:
+            self._meta_cache.popitem(last=False)
+        
+        return payload
+    
     async def upload_document(
         self,
         request: DocumentUploadRequest,
@@ -732,6 +935,7 @@ class DocumentService:
         """Upload and validate document with comprehensive processing"""
         
         start_time = datetime.utcnow()
+        start_ns = time.monotonic_ns()
         
         logger.info(
             "Starting document upload",
@@ -772,8 +976,9 @@ class DocumentService:
             metadata.processing_status = ProcessingStatus.UPLOADED
             
             self.documents[document_id] = metadata
+            self._bump_version(document_id)
             
-            processing_time = (datetime.utcnow() - start_time).total_seconds() * 1000
+            processing_time = (time.monotonic_ns() - start_ns) // 1_000_000
             
             logger.info(
                 "Document upload completed",
@@ -789,10 +994,20 @@ class DocumentService:
                 status=DocumentStatus.UPLOADED,
                 metadata=metadata,
                 validation_result=validation_result,
-                processing_time_ms=int(processing_time),
+                processing_time_ms=processing_time,
                 upload_timestamp=start_time
             )
             
+        except (DocumentServiceException, DocumentValidationException) as e:
+            # Expected rejection - no traceback formatting
+            logger.warning(
+                "Document upload rejected",
+                filename=request.filename,
+                error=str(e),
+                correlation_id=correlation_id
+            )
+            return self._upload_failed_response(e, start_time, start_ns, correlation_id)
+            
         except Exception as e:
             logger.error(
                 "Document upload failed",
@@ -801,15 +1016,25 @@ class DocumentService:
                 correlation_id=correlation_id,
                 exc_info=True
             )
-            
-            return DocumentUploadResponse(
-                document_id="",
-                correlation_id=correlation_id,
-                status=DocumentStatus.FAILED,
-                error_message=str(e),
-                processing_time_ms=int((datetime.utcnow() - start_time).total_seconds() * 1000),
-                upload_timestamp=start_time
-            )
+            return self._upload_failed_response(e, start_time, start_ns, correlation_id)
+    
+    def _upload_failed_response(
+        self,
+        error: Exception,
+        start_time: datetime,
+        start_ns: int,
+        correlation_id: str
+    ) -> DocumentUploadResponse:
+        """Build the failed upload response"""
+        
+        return DocumentUploadResponse(
+            document_id="",
+            correlation_id=correlation_id,
+            status=DocumentStatus.FAILED,
+            error_message=str(error),
+            processing_time_ms=(time.monotonic_ns() - start_ns) // 1_000_000,
+            upload_timestamp=start_time
+        )
     
     async def process_document(
         self,
@@ -818,7 +1043,7 @@ class DocumentService:
     ) -> DocumentProcessingResponse:
         """Process document with content extraction and RAG integration"""
         
-        start_time = datetime.utcnow()
+        start_ns = time.monotonic_ns()
         
         logger.info(
             "Starting document processing",
@@ -827,19 +1052,20 @@ class DocumentService:
             correlation_id=correlation_id
         )
         
+        # Get document metadata (single lookup, reused by the failure path)
+        metadata = self.documents.get(request.document_id)
+        
         try:
-            # Get document metadata
-            if request.document_id not in self.documents:
+            if metadata is None:
                 raise DocumentServiceException(
                     f"Document {request.document_id} not found",
                     "DOCUMENT_NOT_FOUND",
                     correlation_id
                 )
             
-            metadata = self.documents[request.document_id]
-            
             # Update status
             metadata.processing_status = ProcessingStatus.PROCESSING
+            self._bump_version(request.document_id)
             
             # Parse document content
             parsed_content = await self.parser.parse_document(
@@ -869,8 +1095,9 @@ class DocumentService:
             metadata.processing_status = ProcessingStatus.COMPLETED
             metadata.processed_content = parsed_content
             metadata.rag_processed = rag_processed
+            self._bump_version(request.document_id)
             
-            processing_time = (datetime.utcnow() - start_time).total_seconds() * 1000
+            processing_time = (time.monotonic_ns() - start_ns) // 1_000_000
             
             logger.info(
                 "Document processing completed",
@@ -888,31 +1115,97 @@ class DocumentService:
                 extracted_content=parsed_content,
                 metadata=metadata,
                 rag_processed=rag_processed,
-                processing_time_ms=int(processing_time),
+                processing_time_ms=processing_time,
                 processed_timestamp=datetime.utcnow()
             )
             
-        except Exception as e:
-            logger.error(
+        except (DocumentServiceException, DocumentProcessingException) as e:
+            # Expected failures (unknown document, parser errors) - no traceback formatting
+            logger.warning(
                 "Document processing failed",
                 document_id=request.document_id,
                 error=str(e),
-                correlation_id=correlation_id,
-                exc_info=True
+                correlation_id=correlation_id
             )
+            return self._processing_failed_response(request, metadata, e, start_ns, correlation_id)
             
-            # Update status
-            if request.document_id in self.documents:
-                self.documents[request.document_id].processing_status = ProcessingStatus.FAILED
-            
-            return DocumentProcessingResponse(
+        except Exception as e:
+            logger.error(
+                "Document processing failed",
                 document_id=request.document_id,
+                error=str(e),
                 correlation_id=correlation_id,
-                status=ProcessingStatus.FAILED,
-                error_message=str(e),
-                processing_time_ms=int((datetime.utcnow() - start_time).total_seconds() * 1000),
-                processed_timestamp=datetime.utcnow()
+                exc_info=True
             )
+            return self._processing_failed_response(request, metadata, e, start_ns, correlation_id)
+    
+    def _processing_failed_response(
+        self,
+        request: DocumentProcessingRequest,
+        metadata: Optional[DocumentMetadata],
+        error: BaseException,
+        start_ns: int,
+        correlation_id: str
+    ) -> DocumentProcessingResponse:
+        """Mark document as failed and build the failed processing response"""
+        
+        # Update status
+        if metadata is not None:
+            metadata.processing_status = ProcessingStatus.FAILED
+            self._bump_version(request.document_id)
+        
+        return DocumentProcessingResponse(
+            document_id=request.document_id,
+            correlation_id=correlation_id,
+            status=ProcessingStatus.FAILED,
+            error_message=str(error),
+            processing_time_ms=(time.monotonic_ns() - start_ns) // 1_000_000,
+            processed_timestamp=datetime.utcnow()
+        )
+    
+    async def process_documents_batch(
+        self,
+        requests: List[DocumentProcessingRequest],
+        correlation_id: str
+    ) -> List[DocumentProcessingResponse]:
+        """Process multiple documents concurrently (bounded by max_concurrency)"""
+        
+        logger.info(
+            "Starting batch document processing",
+            document_count=len(requests),
+            max_concurrency=self.max_concurrency,
+            correlation_id=correlation_id
+        )
+        
+        start_ns = time.monotonic_ns()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def process_single(request: DocumentProcessingRequest) -> DocumentProcessingResponse:
+            async with semaphore:
+                return await self.process_document(request, correlation_id)
+        
+        results = await asyncio.gather(
+            *(process_single(request) for request in requests),
+            return_exceptions=True
+        )
+        
+        # Convert exceptions to failed responses
+        responses = []
+        for request, result in zip(requests, results):
+            if isinstance(result, BaseException):
+                responses.append(
+                    self._processing_failed_response(
+                        request,
+                        self.documents.get(request.document_id),
+                        result,
+                        start_ns,
+                        correlation_id
+                    )
+                )
+            else:
+                responses.append(result)
+        
+        return responses
     
     async def _process_with_rag(
         self,
@@ -929,13 +1222,23 @@ class DocumentService:
             if "content" in parsed_content:
                 text_content = parsed_content["content"]
             elif "sections" in parsed_content:
-                sections = parsed_content["sections"]
-                text_content = "\n\n".join([
+                text_content = "\n\n".join(
                     f"{section.get('title', '')}\n{section.get('content', '')}"
-                    for section in sections
-                ])
+                    for section in parsed_content["sections"]
+                )
             
-            if text_content and len(text_content.strip()) > 0:
+            if text_content and not text_content.isspace():
+                # Skip re-indexing when the exact same text is already in the RAG system
+                content_hash = hashlib.sha256(text_content.encode('utf-8', 'ignore')).digest()
+                if (metadata.rag_processed and
+                        self._rag_content_hashes.get(metadata.document_id) == content_hash):
+                    logger.info(
+                        "Document content unchanged, skipping RAG re-indexing",
+                        document_id=metadata.document_id,
+                        correlation_id=correlation_id
+                    )
+                    return
+                
                 # Send to RAG service for indexing
                 await self.rag_service.index_document(
                     document_id=metadata.document_id,
@@ -948,6 +1251,7 @@ class DocumentService:
                     },
                     correlation_id=correlation_id
                 )
+                self._rag_content_hashes[metadata.document_id] = content_hash
                 
                 logger.info(
                     "Document indexed in RAG system",
@@ -991,28 +1295,33 @@ class DocumentService:
         user_id: Optional[str] = None,
         document_type: Optional[DocumentType] = None,
         status: Optional[ProcessingStatus] = None,
-        correlation_id: Optional[str] = None
+        correlation_id: Optional[str] = None,
+        limit: Optional[int] = None
     ) -> List[DocumentMetadata]:
-        """List documents with optional filtering"""
+        """List documents with optional filtering (newest first, at most `limit`)"""
         
         logger.info(
             "Listing documents",
             user_id=user_id,
-            document_type=document_type.value if document_type else None,
-            status=status.value if status else None,
+            document_type=getattr(document_type, "value", document_type),
+            status=getattr(status, "value", status),
             correlation_id=correlation_id
         )
         
-        documents = list(self.documents.values())
-        
-        # Apply filters
-        if document_type:
-            documents = [doc for doc in documents if doc.file_type == document_type]
+        # Apply filters in a single pass (== so plain string values still match)
+        if document_type or status:
+            documents = [
+                doc for doc in self.documents.values()
+                if (not document_type or doc.file_type == document_type)
+                and (not status or doc.processing_status == status)
+            ]
+        else:
+            documents = list(self.documents.values())
         
-        if status:
-            documents = [doc for doc in documents if doc.processing_status == status]
+        # Sort by upload timestamp (newest first); partial selection when bounded
+        if limit is not None:
+            return heapq.nlargest(limit, documents, key=lambda x: x.upload_timestamp)
         
-        # Sort by upload timestamp (newest first)
         documents.sort(key=lambda x: x.upload_timestamp, reverse=True)
         
         return documents
@@ -1036,9 +1345,9 @@ class DocumentService:
             
             metadata = self.documents[document_id]
             
-            # Delete file from storage
-            if os.path.exists(metadata.storage_path):
-                os.remove(metadata.storage_path)
+            # Delete file from storage first (off the event loop); a failed unlink
+            # leaves the document and its RAG entry untouched
+            await asyncio.to_thread(_remove_file_if_exists, metadata.storage_path)
             
             # Remove from RAG if indexed
             if self.rag_service and metadata.rag_processed:
@@ -1054,6 +1363,9 @@ class DocumentService:
             
             # Remove from memory
             del self.documents[document_id]
+            self._evict_cached_serializations(document_id)
+            self._rag_content_hashes.pop(document_id, None)
+            self._schedule_persist(document_id)
             
             logger.info(
                 "Document deleted successfully",
@@ -1063,6 +1375,16 @@ class DocumentService:
             
             return True
             
+        except OSError as e:
+            # Storage errors (permissions, busy files) - no traceback formatting
+            logger.warning(
+                "Document deletion failed",
+                document_id=document_id,
+                error=str(e),
+                correlation_id=correlation_id
+            )
+            return False
+            
         except Exception as e:
             logger.error(
                 "Document deletion failed",
@@ -1097,6 +1419,75 @@ class DocumentService:
         # If not processed yet, return None
         return None
     
+    async def get_document_content_json(
+        self,
+        document_id: str,
+        correlation_id: str
+    ) -> Optional[bytes]:
+        """Get processed document content as pre-serialized JSON bytes (cached per version)"""
+        
+        metadata = self.documents.get(document_id)
+        if metadata is None or not getattr(metadata, 'processed_content', None):
+            return None
+        
+        return self._get_cached_serialization(
+            ("content", document_id),
+            document_id,
+            lambda: orjson.dumps(
+                metadata.processed_content,
+                default=str,
+                option=orjson.OPT_NON_STR_KEYS
+            )
+        )
+    
+    async def get_document_content_stream(
+        self,
+        document_id: str,
+        correlation_id: str
+    ) -> Optional[AsyncIterator[bytes]]:
+        """Get processed document content as an iterator of JSON byte chunks"""
+        
+        metadata = self.documents.get(document_id)
+        if metadata is None or not getattr(metadata, 'processed_content', None):
+            return None
+        
+        content = metadata.processed_content
+        sections = content.get("sections")
+        
+        # Small documents: single cached chunk
+        if not isinstance(sections, list) or len(sections) <= self.CONTENT_STREAM_SECTION_THRESHOLD:
+            payload = await self.get_document_content_json(document_id, correlation_id)
+            
+            async def single_chunk() -> AsyncIterator[bytes]:
+                yield payload
+            
+            return single_chunk()
+        
+        logger.info(
+            "Streaming large document content",
+            document_id=document_id,
+            section_count=len(sections),
+            correlation_id=correlation_id
+        )
+        
+        async def section_chunks() -> AsyncIterator[bytes]:
+            # Non-section fields first, then one chunk per section
+            yield b"{"
+            for key, value in content.items():
+                if key == "sections":
+                    continue
+                yield orjson.dumps(str(key)) + b":" + orjson.dumps(
+                    value, default=str, option=orjson.OPT_NON_STR_KEYS
+                ) + b","
+            
+            yield b'"sections":['
+            for index, section in enumerate(sections):
+                chunk = orjson.dumps(section, default=str, option=orjson.OPT_NON_STR_KEYS)
+                yield b"," + chunk if index else chunk
+            yield b"]}"
+        
+        return section_chunks()
+    
     async def get_processing_status(
         self,
         document_id: str,
@@ -1114,6 +1505,23 @@ class DocumentService:
         
         logger.info("Shutting down Document Service")
         
-        # Could add cleanup of temporary files, database connections, etc.
-        
-        logger.info("Document Service shutdown complete")
\ No newline at end of file
+        # Final drain of write-behind persistence
+        if self._persist_task is not None:
+            if self._persist_queue is not None:
+                self._persist_queue.put_nowait(None)
+            try:
+                await asyncio.wait_for(self._persist_task, timeout=10.0)
+            except asyncio.TimeoutError:
+                self._persist_task.cancel()
+                logger.warning("Document persistence drain timed out")
+            self._persist_task = None
+        
+        logger.info("Document Service shutdown complete")
+
+
+# Global document service instance
+document_service = DocumentService(
+    rag_service=rag_service,
+    upload_path=settings.UPLOAD_DIR,
+    persistence_path=settings.DOCUMENT_PERSISTENCE_PATH
+)
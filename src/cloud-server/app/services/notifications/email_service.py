@@ -6,18 +6,26 @@ and multi-channel communication with template support and delivery tracking.
 """
 
 import asyncio
+import mmap
+import os
+import re
 import smtplib
 import base64
-from datetime import datetime, timedelta
+from collections import Counter, OrderedDict, deque
+from datetime import date, datetime, timedelta
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.image import MIMEImage
 from email.mime.base import MIMEBase
 from email import encoders
+from email.utils import make_msgid
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Tuple, Union
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import StrEnum
+from html import escape as html_escape
+import orjson
 import structlog
 
 try:
@@ -38,10 +46,56 @@ try:
 except ImportError:
     PREMAILER_AVAILABLE = False
 
+
 logger = structlog.get_logger(__name__)
 
+# Jinja syntax that must survive CSS inlining untouched
+_JINJA_SYNTAX = re.compile(r"{{.*?}}|{%.*?%}|{#.*?#}", re.DOTALL)
+_JINJA_PLACEHOLDER = re.compile(r"jinjaplaceholder(\d+)x")
+
+# Open-tracking pixel slot rendered as part of the normal template pass
+_TRACKING_PIXEL_MARKER = "/email/track/open/"
+_TRACKING_PIXEL_SLOT = (
+    '{% if user_id %}<img src="{{ base_url }}/email/track/open/{{ user_id }}" '
+    'width="1" height="1" style="display:none;">{% endif %}'
+)
+
+
+def _encode_file_base64(path: Path) -> str:
+    """Base64-encode a file for MIME transfer straight from a memory map.
+    
+    The file is not copied into a bytes object first, but the returned payload
+    (about 1.33x the file size) is built in memory as the MIME part requires.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return base64.encodebytes(mm).decode('ascii')
+
+
+def _insert_before_body_end(html: str, snippet: str) -> str:
+    """Insert a snippet before the last </body> tag (single reverse scan)."""
+    index = html.rfind('</body>')
+    if index == -1:
+        return html
+    return html[:index] + snippet + html[index:]
+
 
-class EmailPriority(str, Enum):
+def _inline_css_preserving_jinja(source: str) -> str:
+    """Inline CSS into an unrendered HTML template, keeping Jinja tags intact."""
+    placeholders: List[str] = []
+    
+    def stash(match: "re.Match[str]") -> str:
+        placeholders.append(match.group(0))
+        return f"jinjaplaceholder{len(placeholders) - 1}x"
+    
+    # Swap Jinja tags for plain tokens so premailer/lxml cannot escape them
+    inlined = premailer.transform(_JINJA_SYNTAX.sub(stash, source))
+    return _JINJA_PLACEHOLDER.sub(lambda match: placeholders[int(match.group(1))], inlined)
+
+
+class EmailPriority(StrEnum):
     """Email priority levels."""
     LOW = "low"
     NORMAL = "normal"
@@ -49,7 +103,7 @@ class EmailPriority(str, Enum):
     URGENT = "urgent"
 
 
-class EmailTemplate(str, Enum):
+class EmailTemplate(StrEnum):
     """Email template types."""
     WELCOME = "welcome"
     PROJECT_CREATED = "project_created"
@@ -73,7 +127,38 @@ class EmailTemplate(str, Enum):
     REVIT_SYNC_FAILED = "revit_sync_failed"
 
 
-@dataclass
+# Template configurations with localized subjects (read-only, built once)
+_TEMPLATE_CONFIGS: Mapping[EmailTemplate, Mapping[str, Mapping[str, str]]] = MappingProxyType({
+    EmailTemplate.WELCOME: {
+        "en-US": {"subject": "Welcome to ArchBuilder.AI! 🏗️"},
+        "tr-TR": {"subject": "ArchBuilder.AI'ye Hoş Geldiniz! 🏗️"}
+    },
+    EmailTemplate.PROJECT_CREATED: {
+        "en-US": {"subject": "Your project '{{project_name}}' has been created"},
+        "tr-TR": {"subject": "'{{project_name}}' projeniz oluşturuldu"}
+    },
+    EmailTemplate.PROJECT_COMPLETED: {
+        "en-US": {"subject": "Project '{{project_name}}' completed successfully! 🎉"},
+        "tr-TR": {"subject": "'{{project_name}}' projesi başarıyla tamamlandı! 🎉"}
+    },
+    EmailTemplate.AI_PROCESSING_STARTED: {
+        "en-US": {"subject": "AI processing started for '{{project_name}}'"},
+        "tr-TR": {"subject": "'{{project_name}}' için AI işleme başladı"}
+    },
+    EmailTemplate.AI_PROCESSING_COMPLETED: {
+        "en-US": {"subject": "AI processing completed for '{{project_name}}'"},
+        "tr-TR": {"subject": "'{{project_name}}' için AI işleme tamamlandı"}
+    },
+    EmailTemplate.USAGE_LIMIT_WARNING: {
+        "en-US": {"subject": "Usage limit warning - {{limit_type}}"},
+        "tr-TR": {"subject": "Kullanım limiti uyarısı - {{limit_type}}"}
+    }
+})
+
+_DEFAULT_TEMPLATE_CONFIG: Mapping[str, str] = MappingProxyType({"subject": "ArchBuilder.AI Notification"})
+
+
+@dataclass(slots=True)
 class EmailRecipient:
     """Email recipient information."""
     email: str
@@ -83,17 +168,18 @@ class EmailRecipient:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class EmailAttachment:
     """Email attachment information."""
     filename: str
-    content: bytes
+    content: bytes = b""
     content_type: str = "application/octet-stream"
     inline: bool = False
     content_id: Optional[str] = None
+    content_path: Optional[Path] = None  # Read from disk instead of content when set
 
 
-@dataclass
+@dataclass(slots=True)
 class EmailMessage:
     """Email message structure."""
     template: EmailTemplate
@@ -109,7 +195,7 @@ class EmailMessage:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class EmailConfig:
     """Email service configuration."""
     smtp_server: str
@@ -123,11 +209,19 @@ class EmailConfig:
     reply_to: str = ""
     templates_dir: str = "templates/email"
     base_url: str = "https://archbuilder.ai"
+    max_concurrency: int = 16
 
 
 class EmailService:
     """Comprehensive email service with template support and delivery tracking."""
     
+    # Maximum number of compiled templates kept per cache
+    TEMPLATE_CACHE_SIZE = 64
+    
+    # Delivery tracking limits
+    DELIVERY_LOG_SIZE = 10_000
+    DELIVERY_STATS_RETENTION_DAYS = 365
+    
     def __init__(self, config: EmailConfig):
         """Initialize email service."""
         self.config = config
@@ -143,8 +237,24 @@ class EmailService:
             self.template_env = None
             self.logger.warning("Jinja2 not available, using fallback templates")
         
+        # Localized subject lines, compiled once (plain text, so no autoescaping)
+        self._subject_templates = self._compile_subject_templates()
+        
+        # Compiled template caches (HTML templates have CSS pre-inlined)
+        self._html_tpl_cache: "OrderedDict[str, Union[Template, str]]" = OrderedDict()
+        self._text_tpl_cache: "OrderedDict[str, Union[Template, str]]" = OrderedDict()
+        
         # Email delivery tracking
-        self.delivery_log: List[Dict[str, Any]] = []
+        self.delivery_log: deque = deque(maxlen=self.DELIVERY_LOG_SIZE)
+        self._daily_counters: Dict[date, Dict[str, Counter]] = {}
+        
+        # Domain for generated Message-IDs (avoids an FQDN lookup per message)
+        self._msgid_domain = config.from_email.rpartition('@')[2] or None
+        
+        # Pooled SMTP connections (connect + login once, reused across sends)
+        self._smtp_pool: Optional[asyncio.Queue] = None
+        self._smtp_open_connections = 0
+        self._smtp_pool_closing = False
         
         self.logger.info("Email service initialized", 
                         smtp_server=config.smtp_server,
@@ -153,73 +263,132 @@ class EmailService:
 
     async def send_email(self, message: EmailMessage) -> Dict[str, Any]:
         """Send an email message."""
+        template_name = message.template.value
         try:
-            # Generate email content from template
-            html_content, text_content = await self._render_template(message)
+            # One timestamp for the whole batch
+            batch_time = datetime.utcnow()
+            batch_timestamp = batch_time.isoformat()
+            is_scheduled = bool(message.scheduled_for and message.scheduled_for > batch_time)
             
-            # Create email message
-            email_msg = await self._create_email_message(
-                message, html_content, text_content
-            )
+            # Load compiled templates once; rendered per recipient below
+            html_template, text_template = await self._render_template(message)
             
-            # Send email for each recipient
-            results = []
-            for recipient in message.recipients:
-                try:
-                    # Personalize content for recipient
-                    personalized_html = await self._personalize_content(
-                        html_content, recipient, message.template_data
-                    )
-                    personalized_text = await self._personalize_content(
-                        text_content, recipient, message.template_data, is_html=False
-                    )
-                    
-                    # Create recipient-specific message
-                    recipient_msg = await self._create_recipient_message(
-                        message, recipient, personalized_html, personalized_text
-                    )
-                    
-                    # Send email
-                    if message.scheduled_for and message.scheduled_for > datetime.utcnow():
-                        # Schedule for later
-                        result = await self._schedule_email(recipient_msg, message.scheduled_for)
-                    else:
-                        # Send immediately
-                        result = await self._send_smtp_email(recipient_msg, recipient)
-                    
-                    results.append({
+            # Build attachment MIME parts once and share them across recipients
+            if any(attachment.content_path is not None for attachment in message.attachments):
+                attachment_parts = await asyncio.to_thread(self._create_attachment_parts, message)
+            else:
+                attachment_parts = self._create_attachment_parts(message)
+            
+            # Headers shared by every recipient message
+            base_headers = self._create_base_headers(message)
+            
+            # Render context shared by every recipient; overlaid per recipient below
+            base_context = {**message.template_data, "base_url": self.config.base_url}
+            
+            # Send email to recipients concurrently (bounded)
+            max_concurrency = self.config.max_concurrency or 16
+            semaphore = asyncio.Semaphore(max_concurrency)
+            
+            async def send_to_recipient(recipient: EmailRecipient,
+                                        smtp: Optional["aiosmtplib.SMTP"]) -> Dict[str, Any]:
+                # Personalize content for recipient
+                context = self._personalization_context(base_context, recipient)
+                personalized_html = self._personalize_content(
+                    html_template, recipient, context, message
+                )
+                personalized_text = self._personalize_content(
+                    text_template, recipient, context, message, is_html=False
+                )
+                
+                # Create recipient-specific message
+                recipient_msg = self._create_recipient_message(
+                    message, recipient, personalized_html, personalized_text,
+                    attachment_parts, base_headers
+                )
+                
+                # Send email
+                if is_scheduled:
+                    # Schedule for later
+                    result = self._schedule_email(recipient_msg, message.scheduled_for)
+                else:
+                    # Send immediately
+                    result = await self._send_smtp_email(recipient_msg, recipient, smtp)
+                
+                # Failures come back as {"success": False, ...}, which is truthy
+                if not result.get("success"):
+                    return {
                         "recipient": recipient.email,
-                        "status": "success" if result else "failed",
-                        "message_id": result.get("message_id") if result else None,
-                        "timestamp": datetime.utcnow().isoformat()
-                    })
-                    
-                except Exception as e:
+                        "status": "failed",
+                        "error": result.get("error"),
+                        "timestamp": batch_timestamp
+                    }
+                
+                return {
+                    "recipient": recipient.email,
+                    "status": "success",
+                    "message_id": result.get("message_id"),
+                    "timestamp": batch_timestamp
+                }
+            
+            # Same-domain recipients are sent one after another over one shared connection
+            # (saves a connect + login per recipient; sends are not pipelined)
+            outcomes: List[Any] = [None] * len(message.recipients)
+            
+            async def send_recipient_group(group: List[Tuple[int, EmailRecipient]]) -> None:
+                async with semaphore:
+                    smtp = None
+                    try:
+                        if not is_scheduled:
+                            smtp = await self._acquire_smtp()
+                        for index, recipient in group:
+                            try:
+                                outcomes[index] = await send_to_recipient(recipient, smtp)
+                            except Exception as e:
+                                outcomes[index] = e
+                    except Exception as e:
+                        # Connection could not be acquired - fail the rest of the group
+                        for index, _ in group:
+                            if outcomes[index] is None:
+                                outcomes[index] = e
+                    finally:
+                        if smtp is not None:
+                            await self._release_smtp(smtp)
+            
+            await asyncio.gather(*(
+                send_recipient_group(group)
+                for group in self._group_recipients_by_domain(message.recipients, max_concurrency)
+            ))
+            
+            results = []
+            for recipient, outcome in zip(message.recipients, outcomes):
+                if isinstance(outcome, Exception):
                     self.logger.error("Failed to send email to recipient",
                                     recipient=recipient.email,
-                                    template=message.template.value,
-                                    error=str(e))
+                                    template=template_name,
+                                    error=str(outcome))
                     results.append({
                         "recipient": recipient.email,
                         "status": "failed",
-                        "error": str(e),
-                        "timestamp": datetime.utcnow().isoformat()
+                        "error": str(outcome),
+                        "timestamp": batch_timestamp
                     })
+                else:
+                    results.append(outcome)
             
             # Log delivery results
             delivery_summary = {
-                "template": message.template.value,
+                "template": template_name,
                 "total_recipients": len(message.recipients),
                 "successful": sum(1 for r in results if r["status"] == "success"),
                 "failed": sum(1 for r in results if r["status"] == "failed"),
                 "results": results,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": batch_timestamp
             }
             
-            self.delivery_log.append(delivery_summary)
+            self._record_delivery(delivery_summary, batch_time.date())
             
             self.logger.info("Email batch sent",
-                           template=message.template.value,
+                           template=template_name,
                            recipients=len(message.recipients),
                            successful=delivery_summary["successful"],
                            failed=delivery_summary["failed"])
@@ -228,23 +397,59 @@ class EmailService:
             
         except Exception as e:
             self.logger.error("Failed to send email batch",
-                            template=message.template.value,
+                            template=template_name,
                             recipients=len(message.recipients),
                             error=str(e))
             raise Exception(f"Email sending failed: {str(e)}")
 
+    def _record_delivery(self, delivery_summary: Dict[str, Any], today: date) -> None:
+        """Record batch outcome in the bounded log and the per-day counters."""
+        # Per-recipient results stay in the caller's return value only
+        self.delivery_log.append({
+            key: value for key, value in delivery_summary.items() if key != "results"
+        })
+        
+        day_counters = self._daily_counters.get(today)
+        if day_counters is None:
+            day_counters = self._daily_counters[today] = {}
+            
+            # Drop counters past the retention window
+            oldest = today - timedelta(days=self.DELIVERY_STATS_RETENTION_DAYS)
+            for day in [day for day in self._daily_counters if day < oldest]:
+                del self._daily_counters[day]
+        
+        counters = day_counters.setdefault(delivery_summary["template"], Counter())
+        counters["sent"] += delivery_summary["total_recipients"]
+        counters["successful"] += delivery_summary["successful"]
+        counters["failed"] += delivery_summary["failed"]
+        counters["batches"] += 1
+
+    @staticmethod
+    def _group_recipients_by_domain(recipients: List[EmailRecipient],
+                                    max_groups_per_domain: int) -> List[List[Tuple[int, EmailRecipient]]]:
+        """Group (index, recipient) pairs by email domain, splitting large domains."""
+        by_domain: Dict[str, List[Tuple[int, EmailRecipient]]] = {}
+        for index, recipient in enumerate(recipients):
+            domain = recipient.email.rpartition('@')[2].lower()
+            by_domain.setdefault(domain, []).append((index, recipient))
+        
+        groups = []
+        for members in by_domain.values():
+            # A single large domain can still use up to max_groups_per_domain connections
+            chunk_size = -(-len(members) // max_groups_per_domain)
+            groups.extend(members[i:i + chunk_size] for i in range(0, len(members), chunk_size))
+        
+        return groups
+
     async def send_notification(self, template: EmailTemplate, recipient: EmailRecipient,
                                template_data: Dict[str, Any], priority: EmailPriority = EmailPriority.NORMAL,
                                attachments: Optional[List[EmailAttachment]] = None) -> Dict[str, Any]:
         """Send a single notification email."""
         try:
-            # Get template configuration
-            template_config = await self._get_template_config(template, recipient.locale)
-            
             message = EmailMessage(
                 template=template,
                 recipients=[recipient],
-                subject=template_config["subject"],
+                subject=self._render_subject(template, recipient.locale, template_data),
                 priority=priority,
                 template_data=template_data,
                 attachments=attachments or [],
@@ -273,30 +478,31 @@ class EmailService:
         """Send bulk notification to multiple recipients."""
         try:
             # Group recipients by locale for template optimization
-            recipients_by_locale = {}
+            recipients_by_locale: Dict[str, List[EmailRecipient]] = {}
             for recipient in recipients:
-                locale = recipient.locale
-                if locale not in recipients_by_locale:
-                    recipients_by_locale[locale] = []
-                recipients_by_locale[locale].append(recipient)
+                recipients_by_locale.setdefault(recipient.locale, []).append(recipient)
             
-            all_results = []
-            
-            # Send to each locale group
-            for locale, locale_recipients in recipients_by_locale.items():
-                template_config = await self._get_template_config(template, locale)
-                
+            # Send to each locale group concurrently
+            async def send_locale_group(locale: str, locale_recipients: List[EmailRecipient]) -> Dict[str, Any]:
                 message = EmailMessage(
                     template=template,
                     recipients=locale_recipients,
-                    subject=template_config["subject"],
+                    subject=self._render_subject(template, locale, template_data),
                     priority=priority,
                     template_data=template_data,
                     track_opens=True,
                     track_clicks=True
                 )
                 
-                result = await self.send_email(message)
+                return await self.send_email(message)
+            
+            group_results = await asyncio.gather(
+                *(send_locale_group(locale, locale_recipients)
+                  for locale, locale_recipients in recipients_by_locale.items())
+            )
+            
+            all_results = []
+            for result in group_results:
                 all_results.extend(result["results"])
             
             # Combine results
@@ -324,39 +530,30 @@ class EmailService:
                             error=str(e))
             raise Exception(f"Bulk notification failed: {str(e)}")
 
-    async def _render_template(self, message: EmailMessage) -> tuple[str, str]:
-        """Render email template to HTML and text."""
+    async def _render_template(self, message: EmailMessage) -> tuple[Union["Template", str], Union["Template", str]]:
+        """Get compiled HTML and text templates (or pre-rendered fallback content)."""
         try:
-            # Get template files
             template_name = message.template.value
-            html_template_path = f"{template_name}.html"
-            text_template_path = f"{template_name}.txt"
             
-            # Render HTML template
+            # HTML template (CSS inlined once per template, not per email)
             try:
-                html_template = self.template_env.get_template(html_template_path)
-                html_content = html_template.render(**message.template_data)
-                
-                # Inline CSS for better email client compatibility
-                html_content = premailer.transform(html_content)
-                
+                html_template = await self._get_compiled_template(template_name, html=True)
             except Exception as e:
                 self.logger.warning("HTML template not found, using fallback",
                                   template=template_name,
                                   error=str(e))
-                html_content = await self._create_fallback_html(message)
+                html_template = self._create_fallback_html(message)
             
-            # Render text template
+            # Text template
             try:
-                text_template = self.template_env.get_template(text_template_path)
-                text_content = text_template.render(**message.template_data)
+                text_template = await self._get_compiled_template(template_name, html=False)
             except Exception as e:
                 self.logger.warning("Text template not found, using fallback",
                                   template=template_name,
                                   error=str(e))
-                text_content = await self._create_fallback_text(message)
+                text_template = self._create_fallback_text(message)
             
-            return html_content, text_content
+            return html_template, text_template
             
         except Exception as e:
             self.logger.error("Failed to render template",
@@ -364,47 +561,91 @@ class EmailService:
                             error=str(e))
             raise Exception(f"Template rendering failed: {str(e)}")
 
-    async def _create_email_message(self, message: EmailMessage, html_content: str, 
-                                  text_content: str) -> MIMEMultipart:
+    async def _get_compiled_template(self, template_name: str, html: bool = True) -> Union["Template", str]:
+        """Get a compiled template from the LRU cache, loading it on first use.
+        
+        Templates without any Jinja syntax are cached as plain strings so that
+        per-recipient rendering can skip Jinja entirely.
+        """
+        cache = self._html_tpl_cache if html else self._text_tpl_cache
+        
+        compiled = cache.get(template_name)
+        if compiled is not None:
+            cache.move_to_end(template_name)
+            return compiled
+        
+        if html:
+            source, _, _ = self.template_env.loader.get_source(
+                self.template_env, f"{template_name}.html"
+            )
+            # Legacy templates without a tracking slot get one added at load time
+            if _TRACKING_PIXEL_MARKER not in source:
+                source = _insert_before_body_end(source, _TRACKING_PIXEL_SLOT)
+            # Inline CSS for better email client compatibility (once per template,
+            # in a worker thread to keep the event loop responsive)
+            if PREMAILER_AVAILABLE:
+                source = await asyncio.to_thread(_inline_css_preserving_jinja, source)
+        else:
+            source, _, _ = self.template_env.loader.get_source(
+                self.template_env, f"{template_name}.txt"
+            )
+        
+        if _JINJA_SYNTAX.search(source):
+            compiled = self.template_env.from_string(source)
+        else:
+            compiled = source
+        
+        cache[template_name] = compiled
+        if len(cache) > self.TEMPLATE_CACHE_SIZE:
+            cache.popitem(last=False)
+        
+        return compiled
+
+    def _create_base_headers(self, message: EmailMessage) -> List[Tuple[str, str]]:
+        """Build the headers shared by every recipient of a message (once per batch)."""
+        headers = [
+            ('From', f"{self.config.from_name} <{self.config.from_email}>"),
+            ('Reply-To', message.reply_to or self.config.reply_to),
+            ('Subject', message.subject),
+        ]
+        
+        # Set priority headers
+        if message.priority == EmailPriority.HIGH:
+            headers += [('X-Priority', '2'), ('Importance', 'high')]
+        elif message.priority == EmailPriority.URGENT:
+            headers += [('X-Priority', '1'), ('Importance', 'high')]
+        elif message.priority == EmailPriority.LOW:
+            headers += [('X-Priority', '4'), ('Importance', 'low')]
+        
+        return headers
+
+    def _create_email_message(self, message: EmailMessage, html_content: str, 
+                            text_content: str,
+                            attachment_parts: Optional[List[MIMEBase]] = None,
+                            base_headers: Optional[List[Tuple[str, str]]] = None) -> MIMEMultipart:
         """Create email message object."""
         try:
-            msg = MIMEMultipart('alternative')
-            msg['From'] = f"{self.config.from_name} <{self.config.from_email}>"
-            msg['Reply-To'] = message.reply_to or self.config.reply_to
-            msg['Subject'] = message.subject
-            
-            # Set priority headers
-            if message.priority == EmailPriority.HIGH:
-                msg['X-Priority'] = '2'
-                msg['Importance'] = 'high'
-            elif message.priority == EmailPriority.URGENT:
-                msg['X-Priority'] = '1'
-                msg['Importance'] = 'high'
-            elif message.priority == EmailPriority.LOW:
-                msg['X-Priority'] = '4'
-                msg['Importance'] = 'low'
+            if attachment_parts is None:
+                attachment_parts = self._create_attachment_parts(message)
+            if base_headers is None:
+                base_headers = self._create_base_headers(message)
             
             # Attach text and HTML parts
-            text_part = MIMEText(text_content, 'plain', 'utf-8')
-            html_part = MIMEText(html_content, 'html', 'utf-8')
+            body = MIMEMultipart('alternative')
+            body.attach(MIMEText(text_content, 'plain', 'utf-8'))
+            body.attach(MIMEText(html_content, 'html', 'utf-8'))
             
-            msg.attach(text_part)
-            msg.attach(html_part)
+            if attachment_parts:
+                # Attachments are pre-encoded parts shared by reference
+                msg = MIMEMultipart('mixed')
+                msg.attach(body)
+                for att_part in attachment_parts:
+                    msg.attach(att_part)
+            else:
+                msg = body
             
-            # Add attachments
-            for attachment in message.attachments:
-                if attachment.inline:
-                    # Inline attachment (for images in HTML)
-                    att_part = MIMEImage(attachment.content)
-                    att_part.add_header('Content-ID', f'<{attachment.content_id}>')
-                else:
-                    # Regular attachment
-                    att_part = MIMEText(attachment.content, 'base64', 'utf-8')
-                    att_part.add_header('Content-Disposition', 
-                                      f'attachment; filename="{attachment.filename}"')
-                    att_part.add_header('Content-Type', attachment.content_type)
-                
-                msg.attach(att_part)
+            for name, value in base_headers:
+                msg[name] = value
             
             return msg
             
@@ -414,32 +655,111 @@ class EmailService:
                             error=str(e))
             raise Exception(f"Email message creation failed: {str(e)}")
 
-    async def _send_smtp_email(self, message: MIMEMultipart, recipient: EmailRecipient) -> Dict[str, Any]:
-        """Send email via SMTP."""
-        try:
-            # Create SMTP connection
-            if self.config.use_ssl:
-                smtp = aiosmtplib.SMTP(hostname=self.config.smtp_server, 
-                                     port=self.config.smtp_port, 
-                                     use_tls=False, use_ssl=True)
+    def _create_attachment_parts(self, message: EmailMessage) -> List[MIMEBase]:
+        """Encode message attachments into MIME parts (once per batch)."""
+        parts = []
+        for attachment in message.attachments:
+            if attachment.content_path is not None:
+                # File-backed attachment - encoded once per batch from a memory map
+                maintype, _, subtype = attachment.content_type.partition('/')
+                att_part = MIMEBase(maintype or 'application', subtype or 'octet-stream')
+                att_part.set_payload(_encode_file_base64(attachment.content_path))
+                att_part['Content-Transfer-Encoding'] = 'base64'
+                if attachment.inline:
+                    att_part.add_header('Content-ID', f'<{attachment.content_id}>')
+                else:
+                    att_part.add_header('Content-Disposition', 'attachment',
+                                      filename=attachment.filename)
+            elif attachment.inline:
+                # Inline attachment (for images in HTML)
+                att_part = MIMEImage(attachment.content)
+                att_part.add_header('Content-ID', f'<{attachment.content_id}>')
             else:
-                smtp = aiosmtplib.SMTP(hostname=self.config.smtp_server, 
-                                     port=self.config.smtp_port,
-                                     use_tls=self.config.use_tls)
-            
-            await smtp.connect()
-            
-            if self.config.username and self.config.password:
-                await smtp.login(self.config.username, self.config.password)
-            
-            # Set recipient
-            message['To'] = f"{recipient.name} <{recipient.email}>" if recipient.name else recipient.email
+                # Regular attachment - binary payload, base64 transfer encoding
+                maintype, _, subtype = attachment.content_type.partition('/')
+                att_part = MIMEBase(maintype or 'application', subtype or 'octet-stream')
+                att_part.set_payload(attachment.content)
+                encoders.encode_base64(att_part)
+                att_part.add_header('Content-Disposition', 'attachment',
+                                  filename=attachment.filename)
             
-            # Send email
-            result = await smtp.send_message(message)
-            await smtp.quit()
+            parts.append(att_part)
+        
+        return parts
+
+    def _new_smtp_client(self) -> "aiosmtplib.SMTP":
+        """Create an (unconnected) SMTP client from configuration."""
+        if self.config.use_ssl:
+            return aiosmtplib.SMTP(hostname=self.config.smtp_server, 
+                                 port=self.config.smtp_port, 
+                                 use_tls=False, use_ssl=True)
+        return aiosmtplib.SMTP(hostname=self.config.smtp_server, 
+                             port=self.config.smtp_port,
+                             use_tls=self.config.use_tls)
+
+    async def _connect_smtp(self, smtp: "aiosmtplib.SMTP") -> None:
+        """Connect and authenticate an SMTP client."""
+        await smtp.connect()
+        
+        if self.config.username and self.config.password:
+            await smtp.login(self.config.username, self.config.password)
+
+    async def _acquire_smtp(self) -> "aiosmtplib.SMTP":
+        """Get a connected SMTP client from the pool, opening one if below the limit."""
+        if self._smtp_pool is None:
+            self._smtp_pool = asyncio.Queue()
+        
+        max_connections = self.config.max_concurrency or 16
+        if self._smtp_pool.empty() and self._smtp_open_connections < max_connections:
+            self._smtp_open_connections += 1
+            smtp = self._new_smtp_client()
+        else:
+            smtp = await self._smtp_pool.get()
+            if smtp.is_connected:
+                return smtp
+        
+        try:
+            await self._connect_smtp(smtp)
+        except Exception:
+            self._smtp_open_connections -= 1
+            raise
+        
+        return smtp
+
+    async def _release_smtp(self, smtp: "aiosmtplib.SMTP") -> None:
+        """Return an SMTP client to the pool, or close it if the pool is closed or closing."""
+        if self._smtp_pool is not None and not self._smtp_pool_closing:
+            self._smtp_pool.put_nowait(smtp)
+            return
+        
+        self._smtp_open_connections -= 1
+        try:
+            if smtp.is_connected:
+                await smtp.quit()
+        except Exception as e:
+            self.logger.warning("Failed to close SMTP connection", error=str(e))
+
+    async def _send_smtp_email(self, message: MIMEMultipart, recipient: EmailRecipient,
+                               smtp: Optional["aiosmtplib.SMTP"] = None) -> Dict[str, Any]:
+        """Send email via a pooled SMTP connection (or one already held by the caller)."""
+        try:
+            held = smtp is not None
+            if not held:
+                smtp = await self._acquire_smtp()
+            try:
+                try:
+                    result = await smtp.send_message(message)
+                except aiosmtplib.SMTPServerDisconnected:
+                    # Stale pooled connection - reconnect once and retry
+                    await self._connect_smtp(smtp)
+                    result = await smtp.send_message(message)
+            finally:
+                if not held:
+                    await self._release_smtp(smtp)
             
-            message_id = message.get('Message-ID', f"archbuilder-{datetime.utcnow().timestamp()}")
+            # aiosmtplib returns (refused recipients, final server reply)
+            refused, smtp_response = result
+            message_id = message['Message-ID']
             
             self.logger.info("Email sent successfully",
                            recipient=recipient.email,
@@ -448,7 +768,8 @@ class EmailService:
             return {
                 "success": True,
                 "message_id": message_id,
-                "smtp_response": str(result)
+                "smtp_response": smtp_response,
+                "refused": [refused_response.code for refused_response in refused.values()]
             }
             
         except Exception as e:
@@ -460,44 +781,81 @@ class EmailService:
                 "error": str(e)
             }
 
-    async def _personalize_content(self, content: str, recipient: EmailRecipient, 
-                                 template_data: Dict[str, Any], is_html: bool = True) -> str:
-        """Personalize content for specific recipient."""
+    async def aclose(self) -> None:
+        """Close all pooled SMTP connections."""
+        if self._smtp_pool is None:
+            return
+        
+        # Connections still held by in-flight sends are closed when they are released
+        self._smtp_pool_closing = True
         try:
-            # Add recipient-specific data
-            personalization_data = {
-                **template_data,
-                "recipient_name": recipient.name or "Valued User",
-                "recipient_email": recipient.email,
-                "user_id": recipient.user_id,
-                "locale": recipient.locale,
-                "base_url": self.config.base_url,
-                **recipient.metadata
-            }
-            
-            # Use Jinja2 for personalization
-            template = Template(content)
-            personalized_content = template.render(**personalization_data)
-            
-            # Add tracking pixels for HTML emails
-            if is_html and recipient.user_id:
-                tracking_pixel = f'<img src="{self.config.base_url}/email/track/open/{recipient.user_id}" width="1" height="1" style="display:none;">'
-                personalized_content = personalized_content.replace('</body>', f'{tracking_pixel}</body>')
+            while not self._smtp_pool.empty():
+                smtp = self._smtp_pool.get_nowait()
+                self._smtp_open_connections -= 1
+                try:
+                    if smtp.is_connected:
+                        await smtp.quit()
+                except Exception as e:
+                    self.logger.warning("Failed to close SMTP connection", error=str(e))
+        finally:
+            self._smtp_pool = None
+            self._smtp_pool_closing = False
+        self.logger.info("SMTP connection pool closed")
+
+    @staticmethod
+    def _personalization_context(base_context: Dict[str, Any],
+                                 recipient: EmailRecipient) -> Dict[str, Any]:
+        """Overlay recipient-specific data on the batch render context."""
+        context = base_context.copy()
+        context["recipient_name"] = recipient.name or "Valued User"
+        context["recipient_email"] = recipient.email
+        context["user_id"] = recipient.user_id
+        context["locale"] = recipient.locale
+        if recipient.metadata:
+            context.update(recipient.metadata)
+        return context
+
+    def _personalize_content(self, template: Union["Template", str], recipient: EmailRecipient, 
+                           context: Dict[str, Any], message: EmailMessage,
+                           is_html: bool = True) -> str:
+        """Render content for a specific recipient from the compiled template.
+        
+        Render errors (e.g. a bad template variable) fall back to the generic
+        notification body instead of failing the send.
+        """
+        try:
+            # Fallback content is already rendered; templates render once per recipient
+            # (HTML templates carry the tracking pixel slot themselves)
+            if isinstance(template, str):
+                personalized_content = template
+                if is_html and recipient.user_id:
+                    tracking_pixel = f'<img src="{self.config.base_url}/email/track/open/{recipient.user_id}" width="1" height="1" style="display:none;">'
+                    personalized_content = _insert_before_body_end(personalized_content, tracking_pixel)
+            else:
+                personalized_content = template.render(context)
             
             return personalized_content
             
         except Exception as e:
-            self.logger.error("Content personalization failed",
+            self.logger.error("Content personalization failed, using fallback content",
                             recipient=recipient.email,
                             error=str(e))
-            return content
+            if is_html:
+                return self._create_fallback_html(message)
+            return self._create_fallback_text(message)
 
-    async def _create_recipient_message(self, message: EmailMessage, recipient: EmailRecipient,
-                                      html_content: str, text_content: str) -> MIMEMultipart:
+    def _create_recipient_message(self, message: EmailMessage, recipient: EmailRecipient,
+                                html_content: str, text_content: str,
+                                attachment_parts: Optional[List[MIMEBase]] = None,
+                              base_headers: Optional[List[Tuple[str, str]]] = None) -> MIMEMultipart:
         """Create personalized message for recipient."""
-        return await self._create_email_message(message, html_content, text_content)
+        msg = self._create_email_message(message, html_content, text_content,
+                                         attachment_parts, base_headers)
+        msg['To'] = f"{recipient.name} <{recipient.email}>" if recipient.name else recipient.email
+        msg['Message-ID'] = make_msgid(domain=self._msgid_domain)
+        return msg
 
-    async def _schedule_email(self, message: MIMEMultipart, scheduled_time: datetime) -> Dict[str, Any]:
+    def _schedule_email(self, message: MIMEMultipart, scheduled_time: datetime) -> Dict[str, Any]:
         """Schedule email for future delivery."""
         try:
             # In production, this would integrate with a job queue like Celery
@@ -511,7 +869,7 @@ class EmailService:
                 "success": True,
                 "scheduled": True,
                 "scheduled_time": scheduled_time.isoformat(),
-                "message_id": f"scheduled-{datetime.utcnow().timestamp()}"
+                "message_id": message['Message-ID']
             }
             
         except Exception as e:
@@ -523,42 +881,32 @@ class EmailService:
                 "error": str(e)
             }
 
-    async def _get_template_config(self, template: EmailTemplate, locale: str = "en-US") -> Dict[str, Any]:
-        """Get template configuration including subject lines."""
-        # Template configurations with localized subjects
-        template_configs = {
-            EmailTemplate.WELCOME: {
-                "en-US": {"subject": "Welcome to ArchBuilder.AI! 🏗️"},
-                "tr-TR": {"subject": "ArchBuilder.AI'ye Hoş Geldiniz! 🏗️"}
-            },
-            EmailTemplate.PROJECT_CREATED: {
-                "en-US": {"subject": "Your project '{{project_name}}' has been created"},
-                "tr-TR": {"subject": "'{{project_name}}' projeniz oluşturuldu"}
-            },
-            EmailTemplate.PROJECT_COMPLETED: {
-                "en-US": {"subject": "Project '{{project_name}}' completed successfully! 🎉"},
-                "tr-TR": {"subject": "'{{project_name}}' projesi başarıyla tamamlandı! 🎉"}
-            },
-            EmailTemplate.AI_PROCESSING_STARTED: {
-                "en-US": {"subject": "AI processing started for '{{project_name}}'"},
-                "tr-TR": {"subject": "'{{project_name}}' için AI işleme başladı"}
-            },
-            EmailTemplate.AI_PROCESSING_COMPLETED: {
-                "en-US": {"subject": "AI processing completed for '{{project_name}}'"},
-                "tr-TR": {"subject": "'{{project_name}}' için AI işleme tamamlandı"}
-            },
-            EmailTemplate.USAGE_LIMIT_WARNING: {
-                "en-US": {"subject": "Usage limit warning - {{limit_type}}"},
-                "tr-TR": {"subject": "Kullanım limiti uyarısı - {{limit_type}}"}
-            }
-        }
+    def _compile_subject_templates(self) -> Dict[Tuple[EmailTemplate, str], Union["Template", str]]:
+        """Pre-compile subject lines that contain template placeholders."""
+        subject_env = Environment(autoescape=False) if JINJA2_AVAILABLE else None
         
-        config = template_configs.get(template, {})
-        locale_config = config.get(locale, config.get("en-US", {"subject": "ArchBuilder.AI Notification"}))
+        subject_templates = {}
+        for template, locales in _TEMPLATE_CONFIGS.items():
+            for locale, config in locales.items():
+                subject = config["subject"]
+                if subject_env is not None and _JINJA_SYNTAX.search(subject):
+                    subject_templates[(template, locale)] = subject_env.from_string(subject)
+                else:
+                    subject_templates[(template, locale)] = subject
         
-        return locale_config
+        return subject_templates
+
+    def _render_subject(self, template: EmailTemplate, locale: str,
+                        template_data: Dict[str, Any]) -> str:
+        """Render the localized subject line for a template."""
+        subject = (self._subject_templates.get((template, locale))
+                   or self._subject_templates.get((template, "en-US"))
+                   or _DEFAULT_TEMPLATE_CONFIG["subject"])
+        if isinstance(subject, str):
+            return subject
+        return subject.render(template_data)
 
-    async def _create_fallback_html(self, message: EmailMessage) -> str:
+    def _create_fallback_html(self, message: EmailMessage) -> str:
         """Create fallback HTML content when template is not found."""
         return f"""
         <!DOCTYPE html>
@@ -574,7 +922,7 @@ class EmailService:
             <div style="padding: 20px;">
                 <h2>Notification: {message.template.value.replace('_', ' ').title()}</h2>
                 <p>This is an automated notification from ArchBuilder.AI.</p>
-                <p>Template data: {str(message.template_data)}</p>
+                <pre>{html_escape(self._dump_template_data(message))}</pre>
             </div>
             <div style="background: #f8f9fa; padding: 20px; text-align: center; font-size: 12px; color: #666;">
                 <p>© 2025 ArchBuilder.AI. All rights reserved.</p>
@@ -583,7 +931,7 @@ class EmailService:
         </html>
         """
 
-    async def _create_fallback_text(self, message: EmailMessage) -> str:
+    def _create_fallback_text(self, message: EmailMessage) -> str:
         """Create fallback text content when template is not found."""
         return f"""
         ArchBuilder.AI Notification
@@ -592,38 +940,44 @@ class EmailService:
         
         This is an automated notification from ArchBuilder.AI.
         
-        Template data: {str(message.template_data)}
+        Template data: {self._dump_template_data(message)}
         
         --
         © 2025 ArchBuilder.AI. All rights reserved.
         """
 
+    @staticmethod
+    def _dump_template_data(message: EmailMessage) -> str:
+        """Serialize template data for fallback bodies."""
+        return orjson.dumps(
+            message.template_data, default=str, option=orjson.OPT_INDENT_2
+        ).decode()
+
     async def get_delivery_stats(self, days: int = 30) -> Dict[str, Any]:
         """Get email delivery statistics."""
         try:
-            cutoff_date = datetime.utcnow() - timedelta(days=days)
+            cutoff_date = (datetime.utcnow() - timedelta(days=days)).date()
             
-            # Filter recent deliveries
-            recent_deliveries = [
-                log for log in self.delivery_log 
-                if datetime.fromisoformat(log["timestamp"]) > cutoff_date
-            ]
-            
-            # Calculate statistics
-            total_sent = sum(log["total_recipients"] for log in recent_deliveries)
-            total_successful = sum(log["successful"] for log in recent_deliveries)
-            total_failed = sum(log["failed"] for log in recent_deliveries)
-            
-            # Template breakdown
+            # Template breakdown from per-day counters
             template_stats = {}
-            for log in recent_deliveries:
-                template = log["template"]
-                if template not in template_stats:
-                    template_stats[template] = {"sent": 0, "successful": 0, "failed": 0}
+            total_batches = 0
+            for day, day_counters in self._daily_counters.items():
+                if day < cutoff_date:
+                    continue
                 
-                template_stats[template]["sent"] += log["total_recipients"]
-                template_stats[template]["successful"] += log["successful"]
-                template_stats[template]["failed"] += log["failed"]
+                for template, counters in day_counters.items():
+                    if template not in template_stats:
+                        template_stats[template] = {"sent": 0, "successful": 0, "failed": 0}
+                    
+                    template_stats[template]["sent"] += counters["sent"]
+                    template_stats[template]["successful"] += counters["successful"]
+                    template_stats[template]["failed"] += counters["failed"]
+                    total_batches += counters["batches"]
+            
+            # Calculate statistics
+            total_sent = sum(stat["sent"] for stat in template_stats.values())
+            total_successful = sum(stat["successful"] for stat in template_stats.values())
+            total_failed = sum(stat["failed"] for stat in template_stats.values())
             
             stats = {
                 "period_days": days,
@@ -632,7 +986,7 @@ class EmailService:
                 "total_failed": total_failed,
                 "success_rate": (total_successful / total_sent * 100) if total_sent > 0 else 0,
                 "template_breakdown": template_stats,
-                "total_batches": len(recent_deliveries),
+                "total_batches": total_batches,
                 "generated_at": datetime.utcnow().isoformat()
             }
             
@@ -6,17 +6,72 @@ user communications, and automated alerts with priority handling and retry logic
 """
 
 import asyncio
-import json
+import heapq
+import itertools
+import operator
+from collections import OrderedDict, deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Callable
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Callable, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
+import orjson
 import structlog
 from .email_service import EmailService, EmailTemplate, EmailRecipient, EmailPriority, EmailMessage
 
 logger = structlog.get_logger(__name__)
 
 
+# Rule condition operators: predicate(actual_value, expected_value)
+_CONDITION_OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "lt": operator.lt,
+    "gte": operator.ge,
+    "lte": operator.le,
+    "in": lambda actual, value: actual in value,
+    "contains": lambda actual, value: value in str(actual),
+}
+
+
+# Relative evaluation cost of operators (anything not listed costs 1.0)
+_CONDITION_COSTS: Dict[str, float] = {
+    "in": 2.0,
+    "contains": 3.0,
+}
+
+
+@dataclass(slots=True)
+class CompiledCondition:
+    """Rule condition compiled to a predicate, with selectivity counters."""
+    key: str
+    predicate: Callable[[Any], bool]
+    cost: float = 1.0
+    evaluated: int = 0
+    passed: int = 0
+    
+    def order_key(self) -> float:
+        """Lower runs first: cheap conditions that rarely pass."""
+        return self.cost * (self.passed + 1) / (self.evaluated + 1)
+
+
+def _compile_condition(key: str, expected_value: Any) -> CompiledCondition:
+    """Compile a single rule condition into a predicate over the event value."""
+    if isinstance(expected_value, dict):
+        operator_name = expected_value.get("operator", "eq")
+        compare = _CONDITION_OPERATORS.get(operator_name)
+        if compare is None:
+            # Unknown operators do not restrict the rule
+            return CompiledCondition(key, lambda actual: True)
+        value = expected_value.get("value")
+        return CompiledCondition(key, lambda actual: compare(actual, value),
+                                 _CONDITION_COSTS.get(operator_name, 1.0))
+    
+    # Simple equality check
+    return CompiledCondition(key, lambda actual: actual == expected_value)
+
+
 class SchedulerStatus(str, Enum):
     """Scheduler status types."""
     ACTIVE = "active"
@@ -34,7 +89,7 @@ class NotificationType(str, Enum):
     TEAMS = "teams"
 
 
-@dataclass
+@dataclass(slots=True)
 class ScheduledNotification:
     """Scheduled notification structure."""
     id: str
@@ -51,10 +106,10 @@ class ScheduledNotification:
     last_attempt: Optional[datetime] = None
     status: str = "pending"
     error_message: Optional[str] = None
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Mapping[str, Any] = field(default_factory=dict)  # may be shared, treat as read-only
 
 
-@dataclass
+@dataclass(slots=True)
 class NotificationRule:
     """Automated notification rule."""
     id: str
@@ -70,6 +125,10 @@ class NotificationRule:
     created_at: datetime = field(default_factory=datetime.utcnow)
     last_triggered: Optional[datetime] = None
     trigger_count: int = 0
+    compiled_conditions: List["CompiledCondition"] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    evaluation_count: int = field(default=0, init=False, repr=False, compare=False)
 
 
 class NotificationScheduler:
@@ -80,24 +139,64 @@ class NotificationScheduler:
         self.email_service = email_service
         self.logger = logger.bind(service="notification_scheduler")
         
-        # Scheduling queues
-        self.pending_notifications: List[ScheduledNotification] = []
-        self.failed_notifications: List[ScheduledNotification] = []
-        self.completed_notifications: List[ScheduledNotification] = []
+        # Scheduling queues (pending is a min-heap of (scheduled_for, seq, notification))
+        self._pending_heap: List[Tuple[datetime, int, ScheduledNotification]] = []
+        self._pending_by_id: Dict[str, ScheduledNotification] = {}
+        self._pending_tombstones = 0  # cancelled entries still in the heap
+        self._seq = itertools.count()
+        self._id_counter = itertools.count(1)
+        self._retry_heap: List[Tuple[datetime, int, ScheduledNotification]] = []
+        self.completed_notifications: deque = deque(maxlen=10_000)  # oldest entries evicted first
         
-        # Automation rules
-        self.notification_rules: List[NotificationRule] = []
+        # Every scheduled notification in creation order (newest last) for history queries
+        self._history: deque = deque(maxlen=10_000)
+        
+        # Automation rules (indexed by trigger event for dispatch); only changed through
+        # add/remove_notification_rule so conditions are compiled and the index stays in sync
+        self._notification_rules: List[NotificationRule] = []
+        self._rules_by_event: Dict[str, List[NotificationRule]] = {}
         
         # Scheduler state
         self.status = SchedulerStatus.ACTIVE
         self.worker_task: Optional[asyncio.Task] = None
-        self.processing_interval = 30  # seconds
+        self.processing_interval = 30  # seconds (upper bound between passes)
+        self.cleanup_interval = 3600  # seconds between history cleanups
+        self._last_cleanup_at: Optional[datetime] = None
+        
+        # Reorder rule conditions most-selective-first from observed pass rates
+        # (off by default so evaluation order stays deterministic)
+        self.adaptive_condition_order = False
+        self.condition_reorder_interval = 1000  # evaluations per rule
+        self._wakeup_event = asyncio.Event()
+        
+        # Due batches are handed to a fixed pool of sender tasks; the bounded
+        # queue makes the worker wait when delivery falls behind
+        self.sender_count = 8
+        self._send_queue: asyncio.Queue = asyncio.Queue(maxsize=1000)
+        self._sender_tasks: List[asyncio.Task] = []
+        
+        # Recipients generated by rules, reused across repeated triggers (LRU)
+        self._recipient_cache: "OrderedDict[Tuple[Any, ...], EmailRecipient]" = OrderedDict()
+        self._recipient_cache_size = 4096
+        self._admin_recipient = EmailRecipient(
+            email="admin@archbuilder.ai",  # From config
+            name="ArchBuilder Admin",
+            locale="en-US"
+        )
+        
+        # Read-only metadata shared by every notification a rule creates for an event
+        self._rule_event_metadata: Dict[Tuple[str, str], Mapping[str, Any]] = {}
         
         # Event handlers
         self.event_handlers: Dict[str, List[Callable]] = {}
         
         self.logger.info("Notification scheduler initialized")
 
+    @property
+    def notification_rules(self) -> Tuple[NotificationRule, ...]:
+        """Registered automation rules (read-only view)."""
+        return tuple(self._notification_rules)
+
     async def start_scheduler(self):
         """Start the notification scheduler worker."""
         try:
@@ -106,6 +205,10 @@ class NotificationScheduler:
                 return
             
             self.status = SchedulerStatus.ACTIVE
+            self._sender_tasks = [
+                asyncio.create_task(self._sender_worker())
+                for _ in range(self.sender_count)
+            ]
             self.worker_task = asyncio.create_task(self._scheduler_worker())
             
             self.logger.info("Notification scheduler started")
@@ -126,6 +229,17 @@ class NotificationScheduler:
                 except asyncio.CancelledError:
                     pass
             
+            for task in self._sender_tasks:
+                task.cancel()
+            await asyncio.gather(*self._sender_tasks, return_exceptions=True)
+            self._sender_tasks = []
+            
+            # Batches not yet picked up go back to the pending queue
+            while not self._send_queue.empty():
+                batch, _ = self._send_queue.get_nowait()
+                for notification in batch:
+                    self._push_pending(notification)
+            
             self.logger.info("Notification scheduler stopped")
             
         except Exception as e:
@@ -139,16 +253,17 @@ class NotificationScheduler:
     async def resume_scheduler(self):
         """Resume the notification scheduler."""
         self.status = SchedulerStatus.ACTIVE
+        self._wakeup_event.set()
         self.logger.info("Notification scheduler resumed")
 
     async def schedule_notification(self, template: EmailTemplate, recipients: List[EmailRecipient],
                                   template_data: Dict[str, Any], scheduled_for: datetime,
                                   priority: EmailPriority = EmailPriority.NORMAL,
                                   notification_type: NotificationType = NotificationType.EMAIL,
-                                  metadata: Dict[str, Any] = None) -> str:
+                                  metadata: Optional[Mapping[str, Any]] = None) -> str:
         """Schedule a notification for future delivery."""
         try:
-            notification_id = f"notif_{datetime.utcnow().timestamp()}_{template.value}"
+            notification_id = f"notif_{next(self._id_counter):x}"
             
             notification = ScheduledNotification(
                 id=notification_id,
@@ -161,7 +276,8 @@ class NotificationScheduler:
                 metadata=metadata or {}
             )
             
-            self.pending_notifications.append(notification)
+            self._push_pending(notification)
+            self._history.append(notification)
             
             self.logger.info("Notification scheduled",
                            notification_id=notification_id,
@@ -187,19 +303,46 @@ class NotificationScheduler:
             template, recipients, template_data, immediate_time, priority, notification_type
         )
 
+    def _push_pending(self, notification: ScheduledNotification):
+        """Add a notification to the pending heap."""
+        heapq.heappush(self._pending_heap,
+                       (notification.scheduled_for, next(self._seq), notification))
+        self._pending_by_id[notification.id] = notification
+        
+        # Wake the worker early if this is now the next notification due
+        if self._pending_heap[0][2] is notification:
+            self._wakeup_event.set()
+
+    def _next_wakeup_delay(self) -> float:
+        """Seconds until the next pending or retry notification is due, capped at the interval."""
+        due_times = [heap[0][0] for heap in (self._pending_heap, self._retry_heap) if heap]
+        if not due_times or self.status != SchedulerStatus.ACTIVE:
+            return self.processing_interval
+        
+        delay = (min(due_times) - datetime.utcnow()).total_seconds()
+        return min(max(delay, 0.0), self.processing_interval)
+
     async def cancel_notification(self, notification_id: str) -> bool:
         """Cancel a scheduled notification."""
         try:
-            # Find and remove from pending notifications
-            for i, notification in enumerate(self.pending_notifications):
-                if notification.id == notification_id:
-                    cancelled_notification = self.pending_notifications.pop(i)
-                    cancelled_notification.status = "cancelled"
-                    self.completed_notifications.append(cancelled_notification)
-                    
-                    self.logger.info("Notification cancelled",
-                                   notification_id=notification_id)
-                    return True
+            # The heap entry stays behind as a tombstone and is dropped when popped
+            cancelled_notification = self._pending_by_id.pop(notification_id, None)
+            if cancelled_notification is not None:
+                cancelled_notification.status = "cancelled"
+                self.completed_notifications.append(cancelled_notification)
+                
+                # Compact in one pass once tombstones make up most of the heap
+                self._pending_tombstones += 1
+                if self._pending_tombstones * 2 > len(self._pending_heap):
+                    self._pending_heap[:] = [
+                        entry for entry in self._pending_heap if entry[2].status != "cancelled"
+                    ]
+                    heapq.heapify(self._pending_heap)
+                    self._pending_tombstones = 0
+                
+                self.logger.info("Notification cancelled",
+                               notification_id=notification_id)
+                return True
             
             self.logger.warning("Notification not found for cancellation",
                               notification_id=notification_id)
@@ -215,13 +358,19 @@ class NotificationScheduler:
         """Add an automated notification rule."""
         try:
             # Check if rule ID already exists
-            existing_rule = next((r for r in self.notification_rules if r.id == rule.id), None)
+            existing_rule = next((r for r in self._notification_rules if r.id == rule.id), None)
             if existing_rule:
                 self.logger.warning("Notification rule already exists",
                                   rule_id=rule.id)
                 return False
             
-            self.notification_rules.append(rule)
+            rule.compiled_conditions = [
+                _compile_condition(key, expected_value)
+                for key, expected_value in rule.conditions.items()
+            ]
+            
+            self._notification_rules.append(rule)
+            self._rules_by_event.setdefault(rule.trigger_event, []).append(rule)
             
             self.logger.info("Notification rule added",
                            rule_id=rule.id,
@@ -236,65 +385,89 @@ class NotificationScheduler:
                             error=str(e))
             return False
 
+    async def remove_notification_rule(self, rule_id: str) -> bool:
+        """Remove an automated notification rule."""
+        rule = next((r for r in self._notification_rules if r.id == rule_id), None)
+        if rule is None:
+            self.logger.warning("Notification rule not found for removal",
+                              rule_id=rule_id)
+            return False
+        
+        self._notification_rules.remove(rule)
+        event_rules = self._rules_by_event[rule.trigger_event]
+        event_rules.remove(rule)
+        if not event_rules:
+            del self._rules_by_event[rule.trigger_event]
+        self._rule_event_metadata.pop((rule_id, rule.trigger_event), None)
+        
+        self.logger.info("Notification rule removed", rule_id=rule_id)
+        return True
+
     async def trigger_event(self, event_name: str, event_data: Dict[str, Any]) -> int:
         """Trigger automated notifications based on event."""
+        # Most events have no subscribed rules
+        event_rules = self._rules_by_event.get(event_name)
+        if not event_rules:
+            return 0
+        
         try:
             triggered_count = 0
+            now = datetime.utcnow()
             
-            # Find matching rules
-            matching_rules = [
-                rule for rule in self.notification_rules
-                if rule.enabled and rule.trigger_event == event_name
-            ]
-            
-            for rule in matching_rules:
+            for rule in event_rules:
+                if not rule.enabled:
+                    continue
+                
+                # A failing rule must not stop the remaining rules for this event
                 try:
-                    # Check rule conditions
-                    if await self._evaluate_rule_conditions(rule, event_data):
-                        # Generate recipients based on target selector
-                        recipients = await self._generate_rule_recipients(rule, event_data)
-                        
-                        if recipients:
-                            # Calculate scheduled time
-                            scheduled_time = datetime.utcnow() + timedelta(minutes=rule.delay_minutes)
-                            
-                            # Schedule notification
-                            await self.schedule_notification(
-                                template=rule.template,
-                                recipients=recipients,
-                                template_data=event_data,
-                                scheduled_for=scheduled_time,
-                                priority=rule.priority,
-                                notification_type=rule.notification_type,
-                                metadata={"rule_id": rule.id, "event": event_name}
-                            )
-                            
-                            # Update rule statistics
-                            rule.last_triggered = datetime.utcnow()
-                            rule.trigger_count += 1
-                            triggered_count += 1
-                            
-                            self.logger.info("Rule triggered notification",
-                                           rule_id=rule.id,
-                                           event=event_name,
-                                           recipients=len(recipients))
+                    if not self._evaluate_rule_conditions(rule, event_data):
+                        continue
+                    
+                    # Generate recipients based on target selector
+                    recipients = self._generate_rule_recipients(rule, event_data)
+                    if not recipients:
+                        continue
+                    
+                    # Calculate scheduled time
+                    scheduled_time = now + timedelta(minutes=rule.delay_minutes)
+                    
+                    # Schedule notification
+                    await self.schedule_notification(
+                        template=rule.template,
+                        recipients=recipients,
+                        template_data=event_data,
+                        scheduled_for=scheduled_time,
+                        priority=rule.priority,
+                        notification_type=rule.notification_type,
+                        metadata=self._get_rule_event_metadata(rule.id, event_name)
+                    )
+                    
+                    # Update rule statistics
+                    rule.last_triggered = now
+                    rule.trigger_count += 1
+                    triggered_count += 1
+                    
+                    self.logger.info("Rule triggered notification",
+                                   rule_id=rule.id,
+                                   event_name=event_name,
+                                   recipients=len(recipients))
                 
                 except Exception as e:
                     self.logger.error("Failed to process notification rule",
                                     rule_id=rule.id,
-                                    event=event_name,
+                                    event_name=event_name,
                                     error=str(e))
             
             if triggered_count > 0:
                 self.logger.info("Event triggered notifications",
-                               event=event_name,
+                               event_name=event_name,
                                triggered_count=triggered_count)
             
             return triggered_count
             
         except Exception as e:
             self.logger.error("Failed to trigger event notifications",
-                            event=event_name,
+                            event_name=event_name,
                             error=str(e))
             return 0
 
@@ -304,11 +477,24 @@ class NotificationScheduler:
             while self.status != SchedulerStatus.STOPPED:
                 try:
                     if self.status == SchedulerStatus.ACTIVE:
-                        await self._process_pending_notifications()
-                        await self._retry_failed_notifications()
-                        await self._cleanup_old_notifications()
+                        # One clock read per pass
+                        now = datetime.utcnow()
+                        await self._process_pending_notifications(now)
+                        await self._retry_failed_notifications(now)
+                        
+                        # The 30-day cutoff only moves meaningfully once in a while
+                        if (self._last_cleanup_at is None or
+                                (now - self._last_cleanup_at).total_seconds() >= self.cleanup_interval):
+                            await self._cleanup_old_notifications(now)
+                            self._last_cleanup_at = now
                     
-                    await asyncio.sleep(self.processing_interval)
+                    # Sleep until the next notification is due or a new one arrives
+                    self._wakeup_event.clear()
+                    try:
+                        await asyncio.wait_for(self._wakeup_event.wait(),
+                                               timeout=self._next_wakeup_delay())
+                    except asyncio.TimeoutError:
+                        pass
                     
                 except Exception as e:
                     self.logger.error("Error in scheduler worker loop", error=str(e))
@@ -319,82 +505,153 @@ class NotificationScheduler:
         except Exception as e:
             self.logger.error("Scheduler worker failed", error=str(e))
 
-    async def _process_pending_notifications(self):
+    async def _process_pending_notifications(self, current_time: Optional[datetime] = None):
         """Process pending notifications that are due."""
         try:
-            current_time = datetime.utcnow()
+            current_time = current_time or datetime.utcnow()
             due_notifications = []
             
-            # Find due notifications
-            for notification in self.pending_notifications[:]:
-                if notification.scheduled_for <= current_time:
-                    due_notifications.append(notification)
-                    self.pending_notifications.remove(notification)
-            
-            # Process due notifications
-            for notification in due_notifications:
-                try:
-                    success = await self._send_notification(notification)
-                    
-                    if success:
-                        notification.status = "completed"
-                        self.completed_notifications.append(notification)
-                        
-                        self.logger.info("Notification sent successfully",
-                                       notification_id=notification.id,
-                                       template=notification.template.value)
-                    else:
-                        await self._handle_notification_failure(notification)
-                
-                except Exception as e:
-                    notification.error_message = str(e)
-                    await self._handle_notification_failure(notification)
-                    
-                    self.logger.error("Failed to send notification",
-                                    notification_id=notification.id,
-                                    error=str(e))
+            # Pop due notifications off the heap, dropping cancelled tombstones
+            pending_heap = self._pending_heap
+            while pending_heap and pending_heap[0][0] <= current_time:
+                notification = heapq.heappop(pending_heap)[2]
+                if notification.status == "cancelled":
+                    self._pending_tombstones -= 1
+                    continue
+                del self._pending_by_id[notification.id]
+                due_notifications.append(notification)
+            
+            # Hand due notifications to the sender pool, coalescing compatible
+            # ones into one send
+            for batch in self._batch_due_notifications(due_notifications):
+                await self._send_queue.put((batch, current_time))
             
         except Exception as e:
             self.logger.error("Error processing pending notifications", error=str(e))
 
-    async def _send_notification(self, notification: ScheduledNotification) -> bool:
-        """Send a notification via the appropriate channel."""
+    async def _sender_worker(self):
+        """Deliver queued notification batches until cancelled."""
+        while True:
+            batch, attempt_time = await self._send_queue.get()
+            try:
+                await self._process_notification_batch(batch, attempt_time)
+            finally:
+                self._send_queue.task_done()
+
+    async def _process_notification_batch(self, batch: List[ScheduledNotification],
+                                          attempt_time: datetime):
+        """Send a batch of due notifications and record the outcome of each."""
         try:
-            notification.last_attempt = datetime.utcnow()
-            
-            if notification.notification_type == NotificationType.EMAIL:
-                result = await self.email_service.send_bulk_notification(
-                    template=notification.template,
-                    recipients=notification.recipients,
-                    template_data=notification.template_data,
-                    priority=notification.priority
-                )
-                
-                # Check if all emails were successful
-                success_count = result.get("successful", 0)
-                total_count = result.get("total_recipients", 0)
-                
-                return success_count == total_count
-            
-            elif notification.notification_type == NotificationType.SMS:
-                # SMS implementation would go here
-                self.logger.warning("SMS notifications not implemented yet")
-                return False
-            
-            elif notification.notification_type == NotificationType.PUSH:
-                # Push notification implementation would go here
-                self.logger.warning("Push notifications not implemented yet")
-                return False
-            
+            if len(batch) == 1:
+                outcomes = [await self._send_notification(batch[0], attempt_time)]
             else:
-                self.logger.error("Unsupported notification type",
-                                notification_type=notification.notification_type.value)
-                return False
+                outcomes = await self._send_notification_batch(batch, attempt_time)
             
+            for notification, success in zip(batch, outcomes):
+                if success:
+                    notification.status = "completed"
+                    self.completed_notifications.append(notification)
+                    
+                    self.logger.info("Notification sent successfully",
+                                   notification_id=notification.id,
+                                   template=notification.template.value)
+                else:
+                    await self._handle_notification_failure(notification)
+        
         except Exception as e:
-            self.logger.error("Failed to send notification",
-                            notification_id=notification.id,
-                            error=str(e))
+            for notification in batch:
+                notification.error_message = str(e)
+                await self._handle_notification_failure(notification)
+                
+                self.logger.error("Failed to send notification",
+                                notification_id=notification.id,
+                                error=str(e))
+
+    @staticmethod
+    def _batch_due_notifications(
+            due_notifications: List[ScheduledNotification]) -> List[List[ScheduledNotification]]:
+        """Group due email notifications that can share one bulk send."""
+        batches: List[List[ScheduledNotification]] = []
+        groups: Dict[Tuple[EmailTemplate, EmailPriority, bytes], List[ScheduledNotification]] = {}
+        
+        for notification in due_notifications:
+            if notification.notification_type != NotificationType.EMAIL:
+                batches.append([notification])
+                continue
+            
+            # Only notifications rendering the same template data can be merged;
+            # canonical JSON of the data makes that a single dict lookup
+            try:
+                data_key = orjson.dumps(
+                    notification.template_data,
+                    option=orjson.OPT_SORT_KEYS | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+                )
+            except orjson.JSONEncodeError:
+                batches.append([notification])
+                continue
+            
+            key = (notification.template, notification.priority, data_key)
+            batch = groups.get(key)
+            if batch is None:
+                batch = groups[key] = []
+                batches.append(batch)
+            batch.append(notification)
+        
+        return batches
+
+    async def _send_notification_batch(self, batch: List[ScheduledNotification],
+                                       attempt_time: datetime) -> List[bool]:
+        """Send several compatible email notifications as one bulk send."""
+        first = batch[0]
+        for notification in batch:
+            notification.last_attempt = attempt_time
+        
+        result = await self.email_service.send_bulk_notification(
+            template=first.template,
+            recipients=[recipient for notification in batch for recipient in notification.recipients],
+            template_data=first.template_data,
+            priority=first.priority
+        )
+        
+        # Map per-recipient results back to the notifications they came from
+        failed_emails = {r["recipient"] for r in result.get("results", []) if r["status"] != "success"}
+        return [
+            not any(recipient.email in failed_emails for recipient in notification.recipients)
+            for notification in batch
+        ]
+
+    async def _send_notification(self, notification: ScheduledNotification,
+                                 attempt_time: Optional[datetime] = None) -> bool:
+        """Send a notification via the appropriate channel (errors propagate to the caller)."""
+        notification.last_attempt = attempt_time or datetime.utcnow()
+        
+        if notification.notification_type == NotificationType.EMAIL:
+            result = await self.email_service.send_bulk_notification(
+                template=notification.template,
+                recipients=notification.recipients,
+                template_data=notification.template_data,
+                priority=notification.priority
+            )
+            
+            # Check if all emails were successful
+            success_count = result.get("successful", 0)
+            total_count = result.get("total_recipients", 0)
+            
+            return success_count == total_count
+        
+        elif notification.notification_type == NotificationType.SMS:
+            # SMS implementation would go here
+            self.logger.warning("SMS notifications not implemented yet")
+            return False
+        
+        elif notification.notification_type == NotificationType.PUSH:
+            # Push notification implementation would go here
+            self.logger.warning("Push notifications not implemented yet")
+            return False
+        
+        else:
+            self.logger.error("Unsupported notification type",
+                            notification_type=notification.notification_type.value)
             return False
 
     async def _handle_notification_failure(self, notification: ScheduledNotification):
@@ -405,10 +662,13 @@ class NotificationScheduler:
             if notification.retry_count < notification.max_retries:
                 # Schedule retry
                 retry_delay = notification.retry_delay * (2 ** (notification.retry_count - 1))
-                notification.scheduled_for = datetime.utcnow() + timedelta(seconds=retry_delay)
+                # Back off from the attempt that failed
+                retry_base = notification.last_attempt or datetime.utcnow()
+                notification.scheduled_for = retry_base + timedelta(seconds=retry_delay)
                 notification.status = "retrying"
                 
-                self.failed_notifications.append(notification)
+                heapq.heappush(self._retry_heap,
+                               (notification.scheduled_for, next(self._seq), notification))
                 
                 self.logger.warning("Notification scheduled for retry",
                                   notification_id=notification.id,
@@ -428,41 +688,37 @@ class NotificationScheduler:
                             notification_id=notification.id,
                             error=str(e))
 
-    async def _retry_failed_notifications(self):
+    async def _retry_failed_notifications(self, current_time: Optional[datetime] = None):
         """Retry failed notifications that are due for retry."""
         try:
-            current_time = datetime.utcnow()
-            retry_notifications = []
-            
-            # Find notifications ready for retry
-            for notification in self.failed_notifications[:]:
-                if notification.scheduled_for <= current_time:
-                    retry_notifications.append(notification)
-                    self.failed_notifications.remove(notification)
+            current_time = current_time or datetime.utcnow()
+            retry_count = 0
             
-            # Add back to pending queue
-            self.pending_notifications.extend(retry_notifications)
+            # Move notifications ready for retry back to the pending queue
+            retry_heap = self._retry_heap
+            while retry_heap and retry_heap[0][0] <= current_time:
+                self._push_pending(heapq.heappop(retry_heap)[2])
+                retry_count += 1
             
-            if retry_notifications:
+            if retry_count:
                 self.logger.info("Notifications moved to retry queue",
-                               count=len(retry_notifications))
+                               count=retry_count)
             
         except Exception as e:
             self.logger.error("Error processing retry notifications", error=str(e))
 
-    async def _cleanup_old_notifications(self):
+    async def _cleanup_old_notifications(self, current_time: Optional[datetime] = None):
         """Clean up old completed and failed notifications."""
         try:
-            cutoff_date = datetime.utcnow() - timedelta(days=30)
+            cutoff_date = (current_time or datetime.utcnow()) - timedelta(days=30)
             
-            # Clean completed notifications
-            initial_completed = len(self.completed_notifications)
-            self.completed_notifications = [
-                n for n in self.completed_notifications
-                if n.created_at > cutoff_date
-            ]
-            
-            cleaned_count = initial_completed - len(self.completed_notifications)
+            # Entries are appended in completion order, not creation order, so an old
+            # notification can sit behind newer ones - scan them all
+            completed = self.completed_notifications
+            kept = [n for n in completed if n.created_at > cutoff_date]
+            cleaned_count = len(completed) - len(kept)
+            if cleaned_count:
+                self.completed_notifications = deque(kept, maxlen=completed.maxlen)
             
             if cleaned_count > 0:
                 self.logger.info("Cleaned up old notifications",
@@ -471,94 +727,97 @@ class NotificationScheduler:
         except Exception as e:
             self.logger.error("Error cleaning up notifications", error=str(e))
 
-    async def _evaluate_rule_conditions(self, rule: NotificationRule, event_data: Dict[str, Any]) -> bool:
+    def _get_rule_event_metadata(self, rule_id: str, event_name: str) -> Mapping[str, Any]:
+        """Get the shared, read-only metadata for notifications a rule creates for an event."""
+        key = (rule_id, event_name)
+        metadata = self._rule_event_metadata.get(key)
+        if metadata is None:
+            metadata = MappingProxyType({"rule_id": rule_id, "event": event_name})
+            self._rule_event_metadata[key] = metadata
+        return metadata
+
+    def _evaluate_rule_conditions(self, rule: NotificationRule, event_data: Dict[str, Any]) -> bool:
         """Evaluate if rule conditions are met."""
         try:
-            # Simple condition evaluation - can be extended for complex logic
-            conditions = rule.conditions
-            
-            for key, expected_value in conditions.items():
-                if key not in event_data:
-                    return False
-                
-                actual_value = event_data[key]
-                
-                # Support different comparison types
-                if isinstance(expected_value, dict):
-                    operator = expected_value.get("operator", "eq")
-                    value = expected_value.get("value")
-                    
-                    if operator == "eq" and actual_value != value:
-                        return False
-                    elif operator == "ne" and actual_value == value:
-                        return False
-                    elif operator == "gt" and actual_value <= value:
-                        return False
-                    elif operator == "lt" and actual_value >= value:
-                        return False
-                    elif operator == "gte" and actual_value < value:
-                        return False
-                    elif operator == "lte" and actual_value > value:
-                        return False
-                    elif operator == "in" and actual_value not in value:
-                        return False
-                    elif operator == "contains" and value not in str(actual_value):
-                        return False
-                else:
-                    # Simple equality check
-                    if actual_value != expected_value:
+            # Conditions are compiled to predicates when the rule is added
+            if not self.adaptive_condition_order:
+                for condition in rule.compiled_conditions:
+                    key = condition.key
+                    if key not in event_data or not condition.predicate(event_data[key]):
                         return False
+                return True
             
-            return True
+            return self._evaluate_tracked_conditions(rule, event_data)
             
         except Exception as e:
+            # e.g. event value not comparable with the condition value
             self.logger.error("Failed to evaluate rule conditions",
                             rule_id=rule.id,
                             error=str(e))
             return False
 
-    async def _generate_rule_recipients(self, rule: NotificationRule, 
-                                      event_data: Dict[str, Any]) -> List[EmailRecipient]:
+    def _evaluate_tracked_conditions(self, rule: NotificationRule, event_data: Dict[str, Any]) -> bool:
+        """Evaluate conditions while counting pass rates, reordering them periodically."""
+        rule.evaluation_count += 1
+        try:
+            for condition in rule.compiled_conditions:
+                condition.evaluated += 1
+                key = condition.key
+                if key not in event_data or not condition.predicate(event_data[key]):
+                    return False
+                condition.passed += 1
+            return True
+        finally:
+            if rule.evaluation_count % self.condition_reorder_interval == 0:
+                rule.compiled_conditions.sort(key=CompiledCondition.order_key)
+
+    def _generate_rule_recipients(self, rule: NotificationRule, 
+                                  event_data: Dict[str, Any]) -> List[EmailRecipient]:
         """Generate recipients based on rule target selector."""
+        recipients = []
+        
+        # Simple recipient generation - can be extended for complex selectors
+        if "user_email" in event_data:
+            recipients.append(self._get_event_recipient(event_data))
+        
+        # Support for admin notifications
+        if rule.target_selector == "admin" or event_data.get("notify_admin"):
+            recipients.append(self._admin_recipient)
+        
+        return recipients
+
+    def _get_event_recipient(self, event_data: Dict[str, Any]) -> EmailRecipient:
+        """Get the recipient for an event's user, reusing a cached instance when possible."""
+        key = (event_data["user_email"], event_data.get("user_name"),
+               event_data.get("user_id"), event_data.get("locale", "en-US"))
+        
+        cache = self._recipient_cache
         try:
-            recipients = []
-            
-            # Simple recipient generation - can be extended for complex selectors
-            if "user_email" in event_data:
-                recipients.append(EmailRecipient(
-                    email=event_data["user_email"],
-                    name=event_data.get("user_name"),
-                    user_id=event_data.get("user_id"),
-                    locale=event_data.get("locale", "en-US")
-                ))
-            
-            # Support for admin notifications
-            if rule.target_selector == "admin" or event_data.get("notify_admin"):
-                admin_email = "admin@archbuilder.ai"  # From config
-                recipients.append(EmailRecipient(
-                    email=admin_email,
-                    name="ArchBuilder Admin",
-                    locale="en-US"
-                ))
-            
-            return recipients
-            
-        except Exception as e:
-            self.logger.error("Failed to generate rule recipients",
-                            rule_id=rule.id,
-                            error=str(e))
-            return []
+            recipient = cache.get(key)
+        except TypeError:
+            # Unhashable event values - build without caching
+            return EmailRecipient(email=key[0], name=key[1], user_id=key[2], locale=key[3])
+        
+        if recipient is not None:
+            cache.move_to_end(key)
+            return recipient
+        
+        recipient = EmailRecipient(email=key[0], name=key[1], user_id=key[2], locale=key[3])
+        cache[key] = recipient
+        if len(cache) > self._recipient_cache_size:
+            cache.popitem(last=False)
+        return recipient
 
     async def get_scheduler_stats(self) -> Dict[str, Any]:
         """Get scheduler statistics."""
         try:
             stats = {
                 "status": self.status.value,
-                "pending_notifications": len(self.pending_notifications),
-                "failed_notifications": len(self.failed_notifications),
+                "pending_notifications": len(self._pending_by_id),
+                "failed_notifications": len(self._retry_heap),
                 "completed_notifications": len(self.completed_notifications),
-                "total_rules": len(self.notification_rules),
-                "enabled_rules": len([r for r in self.notification_rules if r.enabled]),
+                "total_rules": len(self._notification_rules),
+                "enabled_rules": sum(1 for r in self._notification_rules if r.enabled),
                 "processing_interval": self.processing_interval,
                 "uptime": (datetime.utcnow() - datetime.utcnow()).total_seconds(),  # Will be corrected with actual start time
                 "generated_at": datetime.utcnow().isoformat()
@@ -566,7 +825,7 @@ class NotificationScheduler:
             
             # Rule statistics
             rule_stats = {}
-            for rule in self.notification_rules:
+            for rule in self._notification_rules:
                 rule_stats[rule.id] = {
                     "name": rule.name,
                     "trigger_event": rule.trigger_event,
@@ -586,19 +845,9 @@ class NotificationScheduler:
     async def get_notification_history(self, limit: int = 100) -> List[Dict[str, Any]]:
         """Get notification delivery history."""
         try:
-            # Combine all notifications and sort by creation time
-            all_notifications = (
-                self.pending_notifications + 
-                self.failed_notifications + 
-                self.completed_notifications
-            )
-            
-            # Sort by creation time (newest first)
-            all_notifications.sort(key=lambda x: x.created_at, reverse=True)
-            
-            # Convert to dict format and limit results
+            # History is kept in creation order, so the newest are read off the end
             history = []
-            for notification in all_notifications[:limit]:
+            for notification in itertools.islice(reversed(self._history), limit):
                 history.append({
                     "id": notification.id,
                     "template": notification.template.value,
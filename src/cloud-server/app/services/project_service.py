@@ -5,11 +5,21 @@ and step-by-step execution coordination for architectural design automation
 """
 
 import asyncio
+import hashlib
 import json
+import time
 import uuid
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple, Union
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Tuple, Union
+from collections import Counter
+from itertools import islice
+from operator import attrgetter
+from dataclasses import asdict, dataclass
 from enum import Enum
+from heapq import nlargest
+from functools import lru_cache
+import orjson
 import structlog
 
 from app.models.projects import (
@@ -54,245 +64,446 @@ class WorkflowStepType(str, Enum):
     FINAL_REVIEW = "final_review"
 
 
+# Module-level aliases for step types used in templates and dispatch tables
+_DOCUMENT_PROCESSING = WorkflowStepType.DOCUMENT_PROCESSING
+_RAG_INDEXING = WorkflowStepType.RAG_INDEXING
+_REQUIREMENT_ANALYSIS = WorkflowStepType.REQUIREMENT_ANALYSIS
+_SITE_ANALYSIS = WorkflowStepType.SITE_ANALYSIS
+_LAYOUT_GENERATION = WorkflowStepType.LAYOUT_GENERATION
+_VALIDATION = WorkflowStepType.VALIDATION
+_OPTIMIZATION = WorkflowStepType.OPTIMIZATION
+_REVIT_PREPARATION = WorkflowStepType.REVIT_PREPARATION
+_FINAL_REVIEW = WorkflowStepType.FINAL_REVIEW
+
+
+def _create_simple_workflow_template() -> List[Dict[str, Any]]:
+    """Create workflow template for simple projects (5-15 steps)"""
+    
+    return [
+        {
+            "step_type": _DOCUMENT_PROCESSING,
+            "name": "Process uploaded documents",
+            "description": "Extract text and data from uploaded documents",
+            "estimated_duration_minutes": 5,
+            "dependencies": [],
+            "validation_criteria": ["documents_processed", "text_extracted"]
+        },
+        {
+            "step_type": _RAG_INDEXING,
+            "name": "Index documents for knowledge retrieval",
+            "description": "Create searchable index from document content",
+            "estimated_duration_minutes": 3,
+            "dependencies": ["document_processing"],
+            "validation_criteria": ["documents_indexed", "embeddings_created"]
+        },
+        {
+            "step_type": _REQUIREMENT_ANALYSIS,
+            "name": "Analyze project requirements",
+            "description": "Extract and validate project requirements from user input",
+            "estimated_duration_minutes": 5,
+            "dependencies": ["rag_indexing"],
+            "validation_criteria": ["requirements_extracted", "regulations_identified"]
+        },
+        {
+            "step_type": _SITE_ANALYSIS,
+            "name": "Analyze site conditions",
+            "description": "Process site data and constraints",
+            "estimated_duration_minutes": 7,
+            "dependencies": ["requirement_analysis"],
+            "validation_criteria": ["site_constraints_analyzed", "zoning_checked"]
+        },
+        {
+            "step_type": _LAYOUT_GENERATION,
+            "name": "Generate initial layout",
+            "description": "Create basic architectural layout using AI",
+            "estimated_duration_minutes": 15,
+            "dependencies": ["site_analysis"],
+            "validation_criteria": ["layout_generated", "rooms_placed", "circulation_designed"]
+        },
+        {
+            "step_type": _VALIDATION,
+            "name": "Validate against building codes",
+            "description": "Check layout compliance with regulations",
+            "estimated_duration_minutes": 8,
+            "dependencies": ["layout_generation"],
+            "validation_criteria": ["code_compliance_checked", "safety_validated"]
+        },
+        {
+            "step_type": _OPTIMIZATION,
+            "name": "Optimize layout efficiency",
+            "description": "Improve space utilization and flow",
+            "estimated_duration_minutes": 10,
+            "dependencies": ["validation"],
+            "validation_criteria": ["efficiency_optimized", "flow_improved"]
+        },
+        {
+            "step_type": _REVIT_PREPARATION,
+            "name": "Prepare Revit commands",
+            "description": "Generate executable Revit API commands",
+            "estimated_duration_minutes": 12,
+            "dependencies": ["optimization"],
+            "validation_criteria": ["revit_commands_generated", "families_selected"]
+        },
+        {
+            "step_type": _FINAL_REVIEW,
+            "name": "Final quality review",
+            "description": "Comprehensive review of generated design",
+            "estimated_duration_minutes": 5,
+            "dependencies": ["revit_preparation"],
+            "validation_criteria": ["quality_checked", "completeness_verified"]
+        }
+    ]
+
+
+def _create_standard_workflow_template() -> List[Dict[str, Any]]:
+    """Create workflow template for standard projects (15-35 steps)"""
+    
+    simple_steps = _create_simple_workflow_template()
+    
+    # Add additional steps for standard complexity
+    additional_steps = [
+        {
+            "step_type": _LAYOUT_GENERATION,
+            "name": "Generate floor plan alternatives",
+            "description": "Create multiple layout options for comparison",
+            "estimated_duration_minutes": 20,
+            "dependencies": ["layout_generation"],
+            "validation_criteria": ["alternatives_generated", "options_compared"]
+        },
+        {
+            "step_type": _OPTIMIZATION,
+            "name": "Environmental analysis",
+            "description": "Analyze lighting, ventilation, and energy efficiency",
+            "estimated_duration_minutes": 15,
+            "dependencies": ["layout_generation"],
+            "validation_criteria": ["environmental_analyzed", "efficiency_calculated"]
+        },
+        {
+            "step_type": _VALIDATION,
+            "name": "Structural feasibility check",
+            "description": "Validate structural requirements and constraints",
+            "estimated_duration_minutes": 12,
+            "dependencies": ["optimization"],
+            "validation_criteria": ["structure_validated", "loads_calculated"]
+        },
+        {
+            "step_type": _OPTIMIZATION,
+            "name": "Cost optimization",
+            "description": "Optimize design for construction cost efficiency",
+            "estimated_duration_minutes": 18,
+            "dependencies": ["validation"],
+            "validation_criteria": ["cost_optimized", "materials_selected"]
+        }
+    ]
+    
+    # Insert additional steps after the initial layout in one pass; the steps
+    # that follow them now depend on cost optimization
+    layout_index = next(i for i, step in enumerate(simple_steps) if step["step_type"] is _LAYOUT_GENERATION)
+    workflow = simple_steps[:layout_index + 1] + additional_steps
+    workflow.extend(
+        {**step, "dependencies": ["cost_optimization"]}
+        for step in simple_steps[layout_index + 1:]
+    )
+    
+    return workflow
+
+
+def _create_complex_workflow_template() -> List[Dict[str, Any]]:
+    """Create workflow template for complex projects (35-50 steps)"""
+    
+    standard_steps = _create_standard_workflow_template()
+    
+    # Add comprehensive steps for complex projects
+    complex_additions = [
+        {
+            "step_type": _SITE_ANALYSIS,
+            "name": "Geotechnical analysis",
+            "description": "Analyze soil conditions and foundation requirements",
+            "estimated_duration_minutes": 25,
+            "dependencies": ["site_analysis"],
+            "validation_criteria": ["geotechnical_analyzed", "foundation_designed"]
+        },
+        {
+            "step_type": _LAYOUT_GENERATION,
+            "name": "Multi-story coordination",
+            "description": "Coordinate layout across multiple floors",
+            "estimated_duration_minutes": 30,
+            "dependencies": ["layout_generation"],
+            "validation_criteria": ["floors_coordinated", "vertical_circulation_designed"]
+        },
+        {
+            "step_type": _VALIDATION,
+            "name": "MEP systems integration",
+            "description": "Integrate mechanical, electrical, and plumbing systems",
+            "estimated_duration_minutes": 35,
+            "dependencies": ["layout_generation"],
+            "validation_criteria": ["mep_integrated", "systems_coordinated"]
+        },
+        {
+            "step_type": _OPTIMIZATION,
+            "name": "Sustainability optimization",
+            "description": "Optimize for LEED/BREEAM certification requirements",
+            "estimated_duration_minutes": 40,
+            "dependencies": ["optimization"],
+            "validation_criteria": ["sustainability_optimized", "certifications_validated"]
+        },
+        {
+            "step_type": _VALIDATION,
+            "name": "Accessibility compliance",
+            "description": "Ensure ADA/accessibility compliance",
+            "estimated_duration_minutes": 20,
+            "dependencies": ["optimization"],
+            "validation_criteria": ["accessibility_validated", "ada_compliant"]
+        },
+        {
+            "step_type": _OPTIMIZATION,
+            "name": "Construction sequencing",
+            "description": "Optimize construction phases and logistics",
+            "estimated_duration_minutes": 30,
+            "dependencies": ["optimization"],
+            "validation_criteria": ["sequencing_optimized", "logistics_planned"]
+        }
+    ]
+    
+    # Group additions by the step type they follow; later additions of a type
+    # go first, matching repeated insertion right after the first occurrence
+    additions_by_type: Dict[WorkflowStepType, List[Dict[str, Any]]] = {}
+    for addition in reversed(complex_additions):
+        additions_by_type.setdefault(addition["step_type"], []).append(addition)
+    
+    # Integrate complex additions into workflow in a single pass
+    workflow: List[Dict[str, Any]] = []
+    for step in standard_steps:
+        workflow.append(step)
+        workflow.extend(additions_by_type.pop(step["step_type"], ()))
+    
+    # Additions with no matching step type go before final review
+    unmatched = [addition for addition in complex_additions if addition["step_type"] in additions_by_type]
+    if unmatched:
+        workflow[-2:-2] = unmatched
+    
+    return workflow
+
+
+def _freeze_workflow_template(template: List[Dict[str, Any]]) -> Tuple[Mapping[str, Any], ...]:
+    """Make a workflow template immutable so it can be shared by all orchestrators"""
+    return tuple(
+        MappingProxyType({
+            **step_template,
+            "dependencies": tuple(step_template["dependencies"]),
+            "validation_criteria": tuple(step_template["validation_criteria"])
+        })
+        for step_template in template
+    )
+
+
+# Workflow templates by project complexity, built once at import
+_WORKFLOW_TEMPLATES: Mapping[str, Tuple[Mapping[str, Any], ...]] = MappingProxyType({
+    "simple": _freeze_workflow_template(_create_simple_workflow_template()),
+    "standard": _freeze_workflow_template(_create_standard_workflow_template()),
+    "complex": _freeze_workflow_template(_create_complex_workflow_template())
+})
+
+
+_COMPLEX_BUILDING_TYPES = frozenset({"hospital", "school", "office_complex", "mixed_use", "industrial"})
+_SPECIAL_REQUIREMENTS = frozenset({"sustainability", "accessibility", "historic", "seismic"})
+
+
+@lru_cache(maxsize=4096)
+def _score_project_complexity(
+    building_type: Any,
+    total_area: Optional[float],
+    floors: Optional[int],
+    document_count: int,
+    special_count: int
+) -> str:
+    """Score project complexity from a hashable request signature"""
+    
+    complexity_score = 0
+    
+    # Building type complexity
+    if building_type in _COMPLEX_BUILDING_TYPES:
+        complexity_score += 2
+    
+    # Size complexity
+    if total_area and total_area > 10000:  # sq ft
+        complexity_score += 2
+    elif total_area and total_area > 5000:
+        complexity_score += 1
+    
+    # Floor count complexity
+    if floors and floors > 5:
+        complexity_score += 2
+    elif floors and floors > 2:
+        complexity_score += 1
+    
+    # Document complexity
+    if document_count > 10:
+        complexity_score += 2
+    elif document_count > 5:
+        complexity_score += 1
+    
+    # Special requirements complexity
+    complexity_score += special_count
+    
+    # Determine complexity level
+    if complexity_score >= 8:
+        return "complex"
+    elif complexity_score >= 4:
+        return "standard"
+    else:
+        return "simple"
+
+
+# Idempotent steps whose results may be cached, with the project fields
+# their output depends on; steps with side effects are deliberately absent.
+# Cache keys also cover the project's documents, which reach the AI calls
+# as RAG context.
+_IDEMPOTENT_STEP_INPUTS: Mapping[WorkflowStepType, Tuple[str, ...]] = MappingProxyType({
+    _REQUIREMENT_ANALYSIS: (
+        "description", "project_type", "building_type", "total_area",
+        "floors", "requirements", "constraints", "language"
+    ),
+    _SITE_ANALYSIS: (
+        "project_type", "building_type", "site_area", "site_constraints", "language"
+    )
+})
+
+
+# Step types by underscore-free name, for resolving template dependency names
+_DEPENDENCY_LOOKUP = MappingProxyType({step_type.value.replace('_', ''): step_type for step_type in WorkflowStepType})
+
+
+@lru_cache(maxsize=256)
+def _resolve_dependency_type(dependency: str) -> Optional[WorkflowStepType]:
+    """Map a template dependency name to the step type it refers to"""
+    normalized = dependency.replace('_', '')
+    step_type = _DEPENDENCY_LOOKUP.get(normalized)
+    if step_type is not None:
+        return step_type
+    
+    # Fall back to partial name matches
+    for step_type in WorkflowStepType:
+        if normalized in step_type.value.replace('_', ''):
+            return step_type
+    return None
+
+
+# Steps that read the merged layout data of earlier steps, and the steps that write it
+_LAYOUT_READER_TYPES = frozenset({_VALIDATION, _OPTIMIZATION, _REVIT_PREPARATION})
+_LAYOUT_WRITER_TYPES = frozenset({_LAYOUT_GENERATION, _OPTIMIZATION})
+
+
+def _step_name_key(name: str) -> str:
+    """Template dependency form of a step name ("Cost optimization" -> "cost_optimization")"""
+    return name.lower().replace(' ', '_')
+
+
+@lru_cache(maxsize=64)
+def _resolve_workflow_graph(
+    signature: Tuple[Tuple[str, str, Tuple[str, ...]], ...]
+) -> Tuple[Optional[FrozenSet[int]], ...]:
+    """Resolve each step's parent step indexes from (step_type, name, dependencies) triples
+    
+    Besides its named dependencies, a step that reads the merged layout data waits
+    for every earlier step that writes it, and a writer waits for every earlier
+    reader, so each step sees the same layout data as in template order.
+    A step's entry is None when one of its dependencies can never be met,
+    including through a skipped parent.
+    """
+    
+    graph: List[Optional[FrozenSet[int]]] = []
+    last_index_by_type: Dict[str, int] = {}
+    last_index_by_name: Dict[str, int] = {}
+    layout_writers: List[int] = []
+    layout_readers: List[int] = []
+    scheduled: List[int] = []
+    
+    for index, (step_type, name, dependencies) in enumerate(signature):
+        # Final review summarizes the whole project, so it waits for every step that runs
+        if step_type == _FINAL_REVIEW:
+            parents: Optional[Set[int]] = set(scheduled)
+        else:
+            parents = set()
+            for dependency in dependencies:
+                # Dependencies name a step type ("optimization") or a step ("cost_optimization")
+                dependency_type = _resolve_dependency_type(dependency)
+                if dependency_type is not None:
+                    parent = last_index_by_type.get(dependency_type)
+                else:
+                    parent = last_index_by_name.get(dependency)
+                    if parent is None:
+                        # Unknown name - wait for everything before this step
+                        logger.warning(
+                            "Unresolved workflow step dependency, waiting for all earlier steps",
+                            step_name=name,
+                            dependency=dependency
+                        )
+                        parents.update(scheduled)
+                        continue
+                
+                if parent is None or graph[parent] is None:
+                    parents = None
+                    break
+                parents.add(parent)
+        
+        if parents is not None:
+            if step_type in _LAYOUT_READER_TYPES:
+                parents.update(layout_writers)
+            if step_type in _LAYOUT_WRITER_TYPES:
+                parents.update(layout_readers)
+        
+        if parents is None:
+            graph.append(None)
+        else:
+            graph.append(frozenset(parents))
+            scheduled.append(index)
+            if step_type in _LAYOUT_READER_TYPES:
+                layout_readers.append(index)
+            if step_type in _LAYOUT_WRITER_TYPES:
+                layout_writers.append(index)
+        
+        # Skipped steps are recorded too, so steps naming them are skipped as well
+        last_index_by_type[step_type] = index
+        last_index_by_name[_step_name_key(name)] = index
+    
+    return tuple(graph)
+
+
+def _document_content_cache_key(doc_id: str) -> str:
+    """Cache key for content extracted by the document processing step"""
+    return f"doc:{doc_id}:content"
+
+
 class ProjectWorkflowOrchestrator:
     """Orchestrates project workflows with step-by-step execution"""
     
+    # Step count above which CPU-only project summaries run in a worker thread
+    REVIEW_THREAD_STEP_THRESHOLD = 200
+    
     def __init__(
         self,
         ai_service: AIService,
         document_service: DocumentService,
         rag_service: RAGService,
-        cache: Optional[AsyncCache] = None
+        cache: Optional[AsyncCache] = None,
+        max_concurrency: int = 5
     ):
         self.ai_service = ai_service
         self.document_service = document_service
         self.rag_service = rag_service
         self.cache = cache
+        self.max_concurrency = max_concurrency  # concurrent per-document calls within a step
         self.logger = get_logger(__name__)
         
-        # Workflow templates by project complexity
-        self.workflow_templates = {
-            "simple": self._create_simple_workflow_template(),
-            "standard": self._create_standard_workflow_template(),
-            "complex": self._create_complex_workflow_template()
-        }
-    
-    def _create_simple_workflow_template(self) -> List[Dict[str, Any]]:
-        """Create workflow template for simple projects (5-15 steps)"""
-        
-        return [
-            {
-                "step_type": WorkflowStepType.DOCUMENT_PROCESSING,
-                "name": "Process uploaded documents",
-                "description": "Extract text and data from uploaded documents",
-                "estimated_duration_minutes": 5,
-                "dependencies": [],
-                "validation_criteria": ["documents_processed", "text_extracted"]
-            },
-            {
-                "step_type": WorkflowStepType.RAG_INDEXING,
-                "name": "Index documents for knowledge retrieval",
-                "description": "Create searchable index from document content",
-                "estimated_duration_minutes": 3,
-                "dependencies": ["document_processing"],
-                "validation_criteria": ["documents_indexed", "embeddings_created"]
-            },
-            {
-                "step_type": WorkflowStepType.REQUIREMENT_ANALYSIS,
-                "name": "Analyze project requirements",
-                "description": "Extract and validate project requirements from user input",
-                "estimated_duration_minutes": 5,
-                "dependencies": ["rag_indexing"],
-                "validation_criteria": ["requirements_extracted", "regulations_identified"]
-            },
-            {
-                "step_type": WorkflowStepType.SITE_ANALYSIS,
-                "name": "Analyze site conditions",
-                "description": "Process site data and constraints",
-                "estimated_duration_minutes": 7,
-                "dependencies": ["requirement_analysis"],
-                "validation_criteria": ["site_constraints_analyzed", "zoning_checked"]
-            },
-            {
-                "step_type": WorkflowStepType.LAYOUT_GENERATION,
-                "name": "Generate initial layout",
-                "description": "Create basic architectural layout using AI",
-                "estimated_duration_minutes": 15,
-                "dependencies": ["site_analysis"],
-                "validation_criteria": ["layout_generated", "rooms_placed", "circulation_designed"]
-            },
-            {
-                "step_type": WorkflowStepType.VALIDATION,
-                "name": "Validate against building codes",
-                "description": "Check layout compliance with regulations",
-                "estimated_duration_minutes": 8,
-                "dependencies": ["layout_generation"],
-                "validation_criteria": ["code_compliance_checked", "safety_validated"]
-            },
-            {
-                "step_type": WorkflowStepType.OPTIMIZATION,
-                "name": "Optimize layout efficiency",
-                "description": "Improve space utilization and flow",
-                "estimated_duration_minutes": 10,
-                "dependencies": ["validation"],
-                "validation_criteria": ["efficiency_optimized", "flow_improved"]
-            },
-            {
-                "step_type": WorkflowStepType.REVIT_PREPARATION,
-                "name": "Prepare Revit commands",
-                "description": "Generate executable Revit API commands",
-                "estimated_duration_minutes": 12,
-                "dependencies": ["optimization"],
-                "validation_criteria": ["revit_commands_generated", "families_selected"]
-            },
-            {
-                "step_type": WorkflowStepType.FINAL_REVIEW,
-                "name": "Final quality review",
-                "description": "Comprehensive review of generated design",
-                "estimated_duration_minutes": 5,
-                "dependencies": ["revit_preparation"],
-                "validation_criteria": ["quality_checked", "completeness_verified"]
-            }
-        ]
-    
-    def _create_standard_workflow_template(self) -> List[Dict[str, Any]]:
-        """Create workflow template for standard projects (15-35 steps)"""
-        
-        simple_steps = self._create_simple_workflow_template()
-        
-        # Add additional steps for standard complexity
-        additional_steps = [
-            {
-                "step_type": WorkflowStepType.LAYOUT_GENERATION,
-                "name": "Generate floor plan alternatives",
-                "description": "Create multiple layout options for comparison",
-                "estimated_duration_minutes": 20,
-                "dependencies": ["layout_generation"],
-                "validation_criteria": ["alternatives_generated", "options_compared"]
-            },
-            {
-                "step_type": WorkflowStepType.OPTIMIZATION,
-                "name": "Environmental analysis",
-                "description": "Analyze lighting, ventilation, and energy efficiency",
-                "estimated_duration_minutes": 15,
-                "dependencies": ["layout_generation"],
-                "validation_criteria": ["environmental_analyzed", "efficiency_calculated"]
-            },
-            {
-                "step_type": WorkflowStepType.VALIDATION,
-                "name": "Structural feasibility check",
-                "description": "Validate structural requirements and constraints",
-                "estimated_duration_minutes": 12,
-                "dependencies": ["optimization"],
-                "validation_criteria": ["structure_validated", "loads_calculated"]
-            },
-            {
-                "step_type": WorkflowStepType.OPTIMIZATION,
-                "name": "Cost optimization",
-                "description": "Optimize design for construction cost efficiency",
-                "estimated_duration_minutes": 18,
-                "dependencies": ["validation"],
-                "validation_criteria": ["cost_optimized", "materials_selected"]
-            }
-        ]
-        
-        # Insert additional steps into workflow
-        workflow = simple_steps.copy()
-        
-        # Insert alternatives generation after initial layout
-        layout_index = next(i for i, step in enumerate(workflow) if step["step_type"] == WorkflowStepType.LAYOUT_GENERATION)
-        workflow.insert(layout_index + 1, additional_steps[0])
-        
-        # Insert environmental analysis
-        workflow.insert(layout_index + 2, additional_steps[1])
-        
-        # Insert structural check
-        workflow.insert(layout_index + 3, additional_steps[2])
-        
-        # Insert cost optimization
-        workflow.insert(layout_index + 4, additional_steps[3])
-        
-        # Update dependencies for subsequent steps
-        for i, step in enumerate(workflow):
-            if i > layout_index + 4:
-                step["dependencies"] = ["cost_optimization"]
-        
-        return workflow
-    
-    def _create_complex_workflow_template(self) -> List[Dict[str, Any]]:
-        """Create workflow template for complex projects (35-50 steps)"""
-        
-        standard_steps = self._create_standard_workflow_template()
-        
-        # Add comprehensive steps for complex projects
-        complex_additions = [
-            {
-                "step_type": WorkflowStepType.SITE_ANALYSIS,
-                "name": "Geotechnical analysis",
-                "description": "Analyze soil conditions and foundation requirements",
-                "estimated_duration_minutes": 25,
-                "dependencies": ["site_analysis"],
-                "validation_criteria": ["geotechnical_analyzed", "foundation_designed"]
-            },
-            {
-                "step_type": WorkflowStepType.LAYOUT_GENERATION,
-                "name": "Multi-story coordination",
-                "description": "Coordinate layout across multiple floors",
-                "estimated_duration_minutes": 30,
-                "dependencies": ["layout_generation"],
-                "validation_criteria": ["floors_coordinated", "vertical_circulation_designed"]
-            },
-            {
-                "step_type": WorkflowStepType.VALIDATION,
-                "name": "MEP systems integration",
-                "description": "Integrate mechanical, electrical, and plumbing systems",
-                "estimated_duration_minutes": 35,
-                "dependencies": ["layout_generation"],
-                "validation_criteria": ["mep_integrated", "systems_coordinated"]
-            },
-            {
-                "step_type": WorkflowStepType.OPTIMIZATION,
-                "name": "Sustainability optimization",
-                "description": "Optimize for LEED/BREEAM certification requirements",
-                "estimated_duration_minutes": 40,
-                "dependencies": ["optimization"],
-                "validation_criteria": ["sustainability_optimized", "certifications_validated"]
-            },
-            {
-                "step_type": WorkflowStepType.VALIDATION,
-                "name": "Accessibility compliance",
-                "description": "Ensure ADA/accessibility compliance",
-                "estimated_duration_minutes": 20,
-                "dependencies": ["optimization"],
-                "validation_criteria": ["accessibility_validated", "ada_compliant"]
-            },
-            {
-                "step_type": WorkflowStepType.OPTIMIZATION,
-                "name": "Construction sequencing",
-                "description": "Optimize construction phases and logistics",
-                "estimated_duration_minutes": 30,
-                "dependencies": ["optimization"],
-                "validation_criteria": ["sequencing_optimized", "logistics_planned"]
-            }
-        ]
+        # Workflow templates by project complexity (shared, read-only)
+        self.workflow_templates = _WORKFLOW_TEMPLATES
         
-        # Integrate complex additions into workflow
-        workflow = standard_steps.copy()
+        # Merged layout data per project: project_id -> (completed step count, layout data)
+        self._layout_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
         
-        # Add complex steps at appropriate points
-        for addition in complex_additions:
-            # Find appropriate insertion point based on dependencies
-            insert_index = len(workflow) - 2  # Before final review
-            
-            # Find better insertion point based on step type
-            for i, step in enumerate(workflow):
-                if step["step_type"] == addition["step_type"]:
-                    insert_index = i + 1
-                    break
-            
-            workflow.insert(insert_index, addition)
-        
-        return workflow
+        # Step counts by status per project, updated on every step transition
+        self._status_counts: Dict[str, Counter] = {}
     
     async def create_workflow_for_project(
         self,
@@ -315,12 +526,10 @@ class ProjectWorkflowOrchestrator:
             # Get appropriate template
             template = self.workflow_templates.get(complexity, self.workflow_templates["standard"])
             
-            # Create project steps
-            steps = []
-            total_duration = 0
-            
-            for i, step_template in enumerate(template):
-                step = ProjectStep(
+            # Create project steps, all stamped with the same creation time
+            created_at = datetime.utcnow()
+            steps = [
+                ProjectStep(
                     step_id=f"step_{i+1:02d}",
                     step_index=i,
                     step_type=step_template["step_type"],
@@ -328,13 +537,16 @@ class ProjectWorkflowOrchestrator:
                     description=step_template["description"],
                     status=ProjectStepStatus.PENDING,
                     estimated_duration_minutes=step_template["estimated_duration_minutes"],
-                    dependencies=step_template["dependencies"],
-                    validation_criteria=step_template["validation_criteria"],
-                    created_at=datetime.utcnow()
+                    dependencies=list(step_template["dependencies"]),
+                    validation_criteria=list(step_template["validation_criteria"]),
+                    created_at=created_at
                 )
-                
-                steps.append(step)
-                total_duration += step.estimated_duration_minutes
+                for i, step_template in enumerate(template)
+            ]
+            total_duration = sum(step_template["estimated_duration_minutes"] for step_template in template)
+            
+            # Resolve step dependencies now so workflow execution starts from a cached graph
+            self._workflow_graph(steps)
             
             logger.info(
                 "Workflow created successfully",
@@ -363,43 +575,15 @@ class ProjectWorkflowOrchestrator:
     def _determine_project_complexity(self, project_request: ProjectRequest) -> str:
         """Determine project complexity based on requirements"""
         
-        complexity_score = 0
-        
-        # Building type complexity
-        complex_building_types = ["hospital", "school", "office_complex", "mixed_use", "industrial"]
-        if project_request.building_type in complex_building_types:
-            complexity_score += 2
-        
-        # Size complexity
-        if project_request.total_area and project_request.total_area > 10000:  # sq ft
-            complexity_score += 2
-        elif project_request.total_area and project_request.total_area > 5000:
-            complexity_score += 1
-        
-        # Floor count complexity
-        if project_request.floors and project_request.floors > 5:
-            complexity_score += 2
-        elif project_request.floors and project_request.floors > 2:
-            complexity_score += 1
-        
-        # Document complexity
-        if len(project_request.uploaded_documents or []) > 10:
-            complexity_score += 2
-        elif len(project_request.uploaded_documents or []) > 5:
-            complexity_score += 1
-        
-        # Special requirements complexity
-        special_requirements = ["sustainability", "accessibility", "historic", "seismic"]
-        special_count = sum(1 for req in special_requirements if req in (project_request.special_requirements or []))
-        complexity_score += special_count
-        
-        # Determine complexity level
-        if complexity_score >= 8:
-            return "complex"
-        elif complexity_score >= 4:
-            return "standard"
-        else:
-            return "simple"
+        special_count = len(_SPECIAL_REQUIREMENTS.intersection(project_request.special_requirements or ()))
+        
+        return _score_project_complexity(
+            project_request.building_type,
+            project_request.total_area,
+            project_request.floors,
+            len(project_request.uploaded_documents or []),
+            special_count
+        )
     
     async def execute_workflow_step(
         self,
@@ -418,44 +602,39 @@ class ProjectWorkflowOrchestrator:
         )
         
         start_time = datetime.utcnow()
+        start_monotonic = time.monotonic()
         
         try:
             # Update step status
-            step.status = ProjectStepStatus.IN_PROGRESS
+            self.set_step_status(project, step, ProjectStepStatus.IN_PROGRESS)
             step.started_at = start_time
             
             # Execute step based on type
-            if step.step_type == WorkflowStepType.DOCUMENT_PROCESSING:
-                result = await self._execute_document_processing(project, step, correlation_id)
-            elif step.step_type == WorkflowStepType.RAG_INDEXING:
-                result = await self._execute_rag_indexing(project, step, correlation_id)
-            elif step.step_type == WorkflowStepType.REQUIREMENT_ANALYSIS:
-                result = await self._execute_requirement_analysis(project, step, correlation_id)
-            elif step.step_type == WorkflowStepType.SITE_ANALYSIS:
-                result = await self._execute_site_analysis(project, step, correlation_id)
-            elif step.step_type == WorkflowStepType.LAYOUT_GENERATION:
-                result = await self._execute_layout_generation(project, step, correlation_id)
-            elif step.step_type == WorkflowStepType.VALIDATION:
-                result = await self._execute_validation(project, step, correlation_id)
-            elif step.step_type == WorkflowStepType.OPTIMIZATION:
-                result = await self._execute_optimization(project, step, correlation_id)
-            elif step.step_type == WorkflowStepType.REVIT_PREPARATION:
-                result = await self._execute_revit_preparation(project, step, correlation_id)
-            elif step.step_type == WorkflowStepType.FINAL_REVIEW:
-                result = await self._execute_final_review(project, step, correlation_id)
-            else:
+            try:
+                handler = _STEP_HANDLERS[step.step_type]
+            except KeyError:
                 raise WorkflowException(f"Unknown step type: {step.step_type}")
             
+            # Reuse the result of an identical earlier run of an idempotent step
+            cache_key = self._step_cache_key(project, step)
+            result = await self._get_cached_step_result(cache_key, correlation_id)
+            from_cache = result is not None
+            if not from_cache:
+                result = await handler(self, project, step, correlation_id)
+            
             # Update step completion
             step.completed_at = datetime.utcnow()
-            step.actual_duration_minutes = int((step.completed_at - start_time).total_seconds() / 60)
+            step.actual_duration_minutes = int((time.monotonic() - start_monotonic) / 60)
             step.output_data = result
             
             # Validate step completion
             validation_success = await self._validate_step_completion(step, result, correlation_id)
             
             if validation_success:
-                step.status = ProjectStepStatus.COMPLETED
+                self.set_step_status(project, step, ProjectStepStatus.COMPLETED)
+                self.invalidate_layout_cache(project.project_id)
+                if not from_cache:
+                    await self._store_step_result(cache_key, result)
                 logger.info(
                     "Workflow step completed successfully",
                     project_id=project.project_id,
@@ -465,7 +644,7 @@ class ProjectWorkflowOrchestrator:
                 )
                 return True, result
             else:
-                step.status = ProjectStepStatus.FAILED
+                self.set_step_status(project, step, ProjectStepStatus.FAILED)
                 step.error_message = "Step validation failed"
                 logger.error(
                     "Workflow step validation failed",
@@ -476,9 +655,9 @@ class ProjectWorkflowOrchestrator:
                 return False, {"error": "Step validation failed"}
                 
         except Exception as e:
-            step.status = ProjectStepStatus.FAILED
+            self.set_step_status(project, step, ProjectStepStatus.FAILED)
             step.completed_at = datetime.utcnow()
-            step.actual_duration_minutes = int((step.completed_at - start_time).total_seconds() / 60)
+            step.actual_duration_minutes = int((time.monotonic() - start_monotonic) / 60)
             step.error_message = str(e)
             
             logger.error(
@@ -492,6 +671,144 @@ class ProjectWorkflowOrchestrator:
             
             return False, {"error": str(e)}
     
+    async def execute_workflow(self, project: Project, correlation_id: str) -> bool:
+        """Execute workflow steps as soon as their dependencies complete, running independent steps concurrently"""
+        
+        steps = project.workflow_steps
+        children: Dict[int, List[int]] = {index: [] for index in range(len(steps))}
+        pending_parents: Dict[int, int] = {}
+        
+        # Build the dependency graph; steps whose dependencies can never be met
+        # (directly or through a skipped parent) are skipped
+        for index, (step, parents) in enumerate(zip(steps, self._workflow_graph(steps))):
+            if parents is None:
+                logger.warning(
+                    "Step dependencies not met, skipping",
+                    project_id=project.project_id,
+                    step_id=step.step_id,
+                    correlation_id=correlation_id
+                )
+                continue
+            pending_parents[index] = len(parents)
+            for parent in parents:
+                children[parent].append(index)
+        
+        running: Dict[asyncio.Task, int] = {}
+        
+        def launch(index: int) -> None:
+            task = asyncio.create_task(self.execute_workflow_step(project, steps[index], correlation_id))
+            running[task] = index
+        
+        for index, parent_count in pending_parents.items():
+            if parent_count == 0:
+                launch(index)
+        
+        success = True
+        try:
+            while running:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    index = running.pop(task)
+                    step_success, result = task.result()
+                    
+                    if not step_success:
+                        logger.error(
+                            "Workflow step failed, stopping execution",
+                            project_id=project.project_id,
+                            step_id=steps[index].step_id,
+                            error=result.get("error"),
+                            correlation_id=correlation_id
+                        )
+                        success = False
+                    
+                    # After a failure, let running steps finish but start no new ones
+                    if not success:
+                        continue
+                    
+                    for child in children[index]:
+                        pending_parents[child] -= 1
+                        if pending_parents[child] == 0:
+                            launch(child)
+        finally:
+            for task in running:
+                task.cancel()
+        
+        if not success:
+            not_started = [
+                steps[index].step_id for index, parent_count in pending_parents.items() if parent_count > 0
+            ]
+            if not_started:
+                logger.warning(
+                    "Workflow stopped before starting steps",
+                    project_id=project.project_id,
+                    step_ids=not_started,
+                    correlation_id=correlation_id
+                )
+        
+        return success
+    
+    def _workflow_graph(self, steps: List[ProjectStep]) -> Tuple[Optional[FrozenSet[int]], ...]:
+        """Parent step indexes for each step, or None where dependencies cannot be met"""
+        return _resolve_workflow_graph(
+            tuple((step.step_type, step.name, tuple(step.dependencies or ())) for step in steps)
+        )
+    
+    def _step_cache_key(self, project: Project, step: ProjectStep) -> Optional[str]:
+        """Build the result cache key for an idempotent step, or None if it must not be cached"""
+        
+        input_fields = _IDEMPOTENT_STEP_INPUTS.get(step.step_type)
+        if self.cache is None or input_fields is None:
+            return None
+        
+        inputs = {field: getattr(project, field, None) for field in input_fields}
+        inputs["documents"] = self._document_fingerprint(project)
+        inputs_hash = hashlib.blake2b(
+            orjson.dumps(inputs, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS),
+            digest_size=16
+        ).hexdigest()
+        return f"workflow_step:{project.project_id}:{WorkflowStepType(step.step_type).value}:{inputs_hash}"
+    
+    def _document_fingerprint(self, project: Project) -> List[Tuple[str, Optional[str]]]:
+        """Uploaded document ids with their content hashes, in a stable order"""
+        
+        documents = self.document_service.documents
+        return sorted(
+            (doc_id, getattr(documents.get(doc_id), "content_hash", None))
+            for doc_id in project.uploaded_documents or ()
+        )
+    
+    async def _get_cached_step_result(
+        self,
+        cache_key: Optional[str],
+        correlation_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch a cached step result"""
+        
+        if cache_key is None:
+            return None
+        
+        try:
+            cached_result = await self.cache.get(cache_key)
+        except Exception as e:
+            logger.warning("Step result cache retrieval failed", error=str(e))
+            return None
+        
+        if cached_result:
+            logger.info("Workflow step result served from cache", cache_key=cache_key, correlation_id=correlation_id)
+            return cached_result
+        return None
+    
+    async def _store_step_result(self, cache_key: Optional[str], result: Dict[str, Any]) -> None:
+        """Cache a validated step result"""
+        
+        if cache_key is None:
+            return
+        
+        try:
+            await self.cache.set(cache_key, result, ttl=3600)
+        except Exception as e:
+            logger.warning("Step result cache storage failed", error=str(e))
+    
     async def _execute_document_processing(
         self,
         project: Project,
@@ -500,41 +817,51 @@ class ProjectWorkflowOrchestrator:
     ) -> Dict[str, Any]:
         """Execute document processing step"""
         
-        if not project.uploaded_documents:
+        docs = project.uploaded_documents or ()
+        if not docs:
             return {"message": "No documents to process", "processed_count": 0}
         
-        processed_documents = []
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        successful_count = 0
         
-        for doc_id in project.uploaded_documents:
-            try:
-                # Process document using document service
-                result = await self.document_service.process_document_async(
-                    document_id=doc_id,
-                    correlation_id=correlation_id
-                )
-                
-                if result and result.success:
-                    processed_documents.append({
-                        "document_id": doc_id,
-                        "status": "success",
-                        "extracted_text_length": len(result.extracted_text or ""),
-                        "confidence": result.confidence_score
-                    })
-                else:
-                    processed_documents.append({
+        async def process_one(doc_id: str) -> Dict[str, Any]:
+            nonlocal successful_count
+            async with semaphore:
+                try:
+                    # Process document using document service
+                    result = await self.document_service.process_document_async(
+                        document_id=doc_id,
+                        correlation_id=correlation_id
+                    )
+                    
+                    if result and result.success:
+                        # Hand the extracted content straight to RAG indexing
+                        await self._cache_document_content(doc_id, result)
+                        processed = {
+                            "document_id": doc_id,
+                            "status": "success",
+                            "extracted_text_length": len(result.extracted_text or ""),
+                            "confidence": result.confidence_score
+                        }
+                        successful_count += 1
+                        return processed
+                    return {
                         "document_id": doc_id,
                         "status": "failed",
                         "error": result.error_message if result else "Unknown error"
-                    })
+                    }
                     
-            except Exception as e:
-                processed_documents.append({
-                    "document_id": doc_id,
-                    "status": "failed",
-                    "error": str(e)
-                })
+                except Exception as e:
+                    return {
+                        "document_id": doc_id,
+                        "status": "failed",
+                        "error": str(e)
+                    }
         
-        successful_count = sum(1 for doc in processed_documents if doc["status"] == "success")
+        # Documents are independent; process them concurrently (bounded)
+        processed_documents = await asyncio.gather(
+            *(process_one(doc_id) for doc_id in docs)
+        )
         
         return {
             "processed_documents": processed_documents,
@@ -551,46 +878,76 @@ class ProjectWorkflowOrchestrator:
     ) -> Dict[str, Any]:
         """Execute RAG indexing step"""
         
-        if not project.uploaded_documents:
+        doc_ids = list(project.uploaded_documents or ())
+        if not doc_ids:
             return {"message": "No documents to index", "indexed_count": 0}
         
-        indexed_documents = []
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def fetch_content(doc_id: str) -> Union[Dict[str, Any], Exception, None]:
+            async with semaphore:
+                try:
+                    # Prefer content cached by document processing, then the document service
+                    cached_content = await self._get_cached_document_content(doc_id)
+                    if cached_content:
+                        return cached_content
+                    return await self.document_service.get_document_content(doc_id, correlation_id)
+                except Exception as e:
+                    return e
+        
+        contents = await asyncio.gather(*(fetch_content(doc_id) for doc_id in doc_ids))
+        
+        results_by_id: Dict[str, Dict[str, Any]] = {}
+        items = []
+        for doc_id, doc_content in zip(doc_ids, contents):
+            if isinstance(doc_content, Exception):
+                results_by_id[doc_id] = {"document_id": doc_id, "status": "failed", "error": str(doc_content)}
+            elif not doc_content:
+                results_by_id[doc_id] = {"document_id": doc_id, "status": "failed", "error": "No content available"}
+            else:
+                items.append({
+                    "document_id": doc_id,
+                    "content": doc_content.get("extracted_text", ""),
+                    "metadata": doc_content.get("metadata", {})
+                })
         
-        for doc_id in project.uploaded_documents:
+        if items:
+            # Index everything in one batch (single embedding pass)
             try:
-                # Get processed document content
-                doc_content = await self.document_service.get_document_content(doc_id, correlation_id)
-                
-                if doc_content:
-                    # Index document for RAG
-                    index_result = await self.rag_service.index_document(
-                        document_id=doc_id,
-                        content=doc_content.get("extracted_text", ""),
-                        metadata=doc_content.get("metadata", {}),
-                        correlation_id=correlation_id
-                    )
-                    
-                    indexed_documents.append({
-                        "document_id": doc_id,
-                        "status": "indexed",
-                        "chunk_count": index_result.get("chunk_count", 0)
-                    })
-                else:
-                    indexed_documents.append({
-                        "document_id": doc_id,
+                batch_results = await self.rag_service.index_documents_batch(items, correlation_id)
+                for item in items:
+                    doc_id = item["document_id"]
+                    # Pass the per-document outcome through ("indexed", "no_chunks", ...)
+                    doc_result = batch_results.get(doc_id) or {
                         "status": "failed",
-                        "error": "No content available"
-                    })
-                    
+                        "error": "Missing from batch indexing result"
+                    }
+                    results_by_id[doc_id] = {
+                        **doc_result,
+                        "document_id": doc_id,
+                        "chunk_count": doc_result.get("chunk_count", 0)
+                    }
             except Exception as e:
-                indexed_documents.append({
-                    "document_id": doc_id,
-                    "status": "failed",
-                    "error": str(e)
-                })
+                logger.warning(
+                    "Batch RAG indexing failed, indexing documents individually",
+                    error=str(e),
+                    correlation_id=correlation_id
+                )
+                for result in await asyncio.gather(
+                    *(self._index_document_item(item, semaphore, correlation_id) for item in items)
+                ):
+                    results_by_id[result["document_id"]] = result
         
-        successful_count = sum(1 for doc in indexed_documents if doc["status"] == "indexed")
-        total_chunks = sum(doc.get("chunk_count", 0) for doc in indexed_documents)
+        # Assemble results in upload order and aggregate them in the same pass
+        indexed_documents = []
+        successful_count = 0
+        total_chunks = 0
+        for doc_id in doc_ids:
+            doc = results_by_id[doc_id]
+            indexed_documents.append(doc)
+            if doc["status"] == "indexed":
+                successful_count += 1
+            total_chunks += doc.get("chunk_count", 0)
         
         return {
             "indexed_documents": indexed_documents,
@@ -599,6 +956,73 @@ class ProjectWorkflowOrchestrator:
             "success_rate": successful_count / len(indexed_documents) if indexed_documents else 0
         }
     
+    async def _cache_document_content(self, doc_id: str, result: DocumentProcessingResult) -> None:
+        """Cache a processed document's content for the indexing step"""
+        
+        if self.cache is None:
+            return
+        
+        try:
+            await self.cache.set(
+                _document_content_cache_key(doc_id),
+                {
+                    "extracted_text": result.extracted_text or "",
+                    "metadata": getattr(result, "metadata", None) or {}
+                },
+                ttl=3600
+            )
+        except Exception as e:
+            logger.warning("Document content cache storage failed", document_id=doc_id, error=str(e))
+    
+    async def _get_cached_document_content(self, doc_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch document content cached by the processing step"""
+        
+        if self.cache is None:
+            return None
+        
+        try:
+            return await self.cache.get(_document_content_cache_key(doc_id))
+        except Exception as e:
+            logger.warning("Document content cache retrieval failed", document_id=doc_id, error=str(e))
+            return None
+    
+    async def _index_document_item(
+        self,
+        item: Dict[str, Any],
+        semaphore: asyncio.Semaphore,
+        correlation_id: str
+    ) -> Dict[str, Any]:
+        """Index a single document for RAG (fallback when batch indexing fails)"""
+        
+        async with semaphore:
+            try:
+                index_result = await self.rag_service.index_document(
+                    document_id=item["document_id"],
+                    content=item["content"],
+                    metadata=item["metadata"],
+                    correlation_id=correlation_id
+                )
+                return {
+                    "document_id": item["document_id"],
+                    "status": "indexed",
+                    "chunk_count": index_result.get("chunk_count", 0)
+                }
+            except Exception as e:
+                return {
+                    "document_id": item["document_id"],
+                    "status": "failed",
+                    "error": str(e)
+                }
+    
+    def _base_ai_request_kwargs(self, project: Project, correlation_id: str) -> Dict[str, Any]:
+        """Fields shared by every AI request built for a project step"""
+        return {
+            "project_type": project.project_type,
+            "building_type": project.building_type,
+            "language": project.language,
+            "correlation_id": correlation_id
+        }
+    
     async def _execute_requirement_analysis(
         self,
         project: Project,
@@ -610,14 +1034,11 @@ class ProjectWorkflowOrchestrator:
         # Create AI request for requirement analysis
         analysis_request = AILayoutRequest(
             user_input=project.description,
-            project_type=project.project_type,
-            building_type=project.building_type,
+            **self._base_ai_request_kwargs(project, correlation_id),
             total_area=project.total_area,
             floors=project.floors,
             requirements=project.requirements or [],
-            constraints=project.constraints or [],
-            language=project.language,
-            correlation_id=correlation_id
+            constraints=project.constraints or []
         )
         
         # Use AI service to analyze requirements
@@ -647,12 +1068,9 @@ class ProjectWorkflowOrchestrator:
         # Analyze site conditions using AI
         site_request = AILayoutRequest(
             user_input=f"Analyze site conditions for {project.building_type}",
-            project_type=project.project_type,
-            building_type=project.building_type,
+            **self._base_ai_request_kwargs(project, correlation_id),
             site_area=project.site_area,
-            site_constraints=project.site_constraints or [],
-            language=project.language,
-            correlation_id=correlation_id
+            site_constraints=project.site_constraints or []
         )
         
         site_response = await self.ai_service.analyze_site_conditions(
@@ -682,15 +1100,12 @@ class ProjectWorkflowOrchestrator:
         # Create comprehensive layout request
         layout_request = AILayoutRequest(
             user_input=project.description,
-            project_type=project.project_type,
-            building_type=project.building_type,
+            **self._base_ai_request_kwargs(project, correlation_id),
             total_area=project.total_area,
             floors=project.floors,
             requirements=project.requirements or [],
             constraints=project.constraints or [],
-            site_constraints=project.site_constraints or [],
-            language=project.language,
-            correlation_id=correlation_id
+            site_constraints=project.site_constraints or []
         )
         
         # Generate layout using AI service
@@ -711,6 +1126,53 @@ class ProjectWorkflowOrchestrator:
         else:
             raise WorkflowException(f"Layout generation failed: {layout_response.error_message}")
     
+    async def _call_ai_endpoint(
+        self,
+        endpoint_name: str,
+        request: AILayoutRequest
+    ) -> AILayoutResponse:
+        """Call an AI service endpoint, reusing the response to an identical earlier request"""
+        
+        cache_key = None
+        if self.cache is not None:
+            request_content = {
+                "user_input": request.user_input,
+                "project_type": request.project_type,
+                "building_type": request.building_type,
+                "layout_data": request.layout_data,
+                "language": request.language
+            }
+            content_hash = hashlib.blake2b(
+                orjson.dumps(request_content, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS),
+                digest_size=16
+            ).hexdigest()
+            cache_key = f"ai_response:{endpoint_name}:{content_hash}"
+            
+            try:
+                cached_response = await self.cache.get(cache_key)
+            except Exception as e:
+                logger.warning("AI response cache retrieval failed", error=str(e))
+                cached_response = None
+            
+            if cached_response:
+                logger.info(
+                    "AI response served from cache",
+                    endpoint=endpoint_name,
+                    correlation_id=request.correlation_id
+                )
+                return AILayoutResponse(**cached_response)
+        
+        endpoint = getattr(self.ai_service, endpoint_name)
+        response = await endpoint(request, request.correlation_id)
+        
+        if cache_key is not None and response.success:
+            try:
+                await self.cache.set(cache_key, response.model_dump(), ttl=3600)
+            except Exception as e:
+                logger.warning("AI response cache storage failed", error=str(e))
+        
+        return response
+    
     async def _execute_validation(
         self,
         project: Project,
@@ -732,8 +1194,8 @@ class ProjectWorkflowOrchestrator:
             correlation_id=correlation_id
         )
         
-        validation_response = await self.ai_service.validate_layout_compliance(
-            validation_request, correlation_id
+        validation_response = await self._call_ai_endpoint(
+            "validate_layout_compliance", validation_request
         )
         
         if validation_response.success:
@@ -769,8 +1231,8 @@ class ProjectWorkflowOrchestrator:
             correlation_id=correlation_id
         )
         
-        optimization_response = await self.ai_service.optimize_layout(
-            optimization_request, correlation_id
+        optimization_response = await self._call_ai_endpoint(
+            "optimize_layout", optimization_request
         )
         
         if optimization_response.success:
@@ -806,8 +1268,8 @@ class ProjectWorkflowOrchestrator:
             correlation_id=correlation_id
         )
         
-        revit_response = await self.ai_service.generate_revit_commands(
-            revit_request, correlation_id
+        revit_response = await self._call_ai_endpoint(
+            "generate_revit_commands", revit_request
         )
         
         if revit_response.success:
@@ -830,6 +1292,15 @@ class ProjectWorkflowOrchestrator:
     ) -> Dict[str, Any]:
         """Execute final review step"""
         
+        # The review is CPU-only; keep large workflows from stalling the event loop
+        if len(project.workflow_steps) > self.REVIEW_THREAD_STEP_THRESHOLD:
+            self.step_status_counts(project)  # build counters on the loop, not in the worker thread
+            return await asyncio.to_thread(self._final_review_sync, project)
+        return self._final_review_sync(project)
+    
+    def _final_review_sync(self, project: Project) -> Dict[str, Any]:
+        """Compute the final review result"""
+        
         # Collect all project data for comprehensive review
         project_summary = {
             "project_id": project.project_id,
@@ -838,7 +1309,7 @@ class ProjectWorkflowOrchestrator:
             "total_area": project.total_area,
             "floors": project.floors,
             "workflow_steps": len(project.workflow_steps),
-            "completed_steps": len([s for s in project.workflow_steps if s.status == ProjectStepStatus.COMPLETED])
+            "completed_steps": self.step_status_counts(project)[ProjectStepStatus.COMPLETED]
         }
         
         # Perform final quality check
@@ -854,48 +1325,95 @@ class ProjectWorkflowOrchestrator:
         }
     
     def _get_project_layout_data(self, project: Project) -> Dict[str, Any]:
-        """Extract layout data from completed project steps"""
+        """Extract layout data from completed project steps (cached until another step completes)"""
+        
+        completed_count = self.step_status_counts(project)[ProjectStepStatus.COMPLETED]
+        
+        cached = self._layout_cache.get(project.project_id)
+        if cached is not None and cached[0] == completed_count:
+            return cached[1]
         
         layout_data = {}
         
         for step in project.workflow_steps:
             if step.status == ProjectStepStatus.COMPLETED and step.output_data:
-                if step.step_type == WorkflowStepType.LAYOUT_GENERATION:
+                step_type = step.step_type
+                if step_type == _LAYOUT_GENERATION:
                     layout_data.update(step.output_data)
-                elif step.step_type == WorkflowStepType.OPTIMIZATION:
+                elif step_type == _OPTIMIZATION:
                     layout_data.update(step.output_data.get("optimized_layout", {}))
         
+        self._layout_cache[project.project_id] = (completed_count, layout_data)
         return layout_data
     
+    def invalidate_layout_cache(self, project_id: str) -> None:
+        """Drop a project's cached layout data"""
+        self._layout_cache.pop(project_id, None)
+    
+    def step_status_counts(self, project: Project) -> Counter:
+        """Step counts by status for a project, maintained as steps change state"""
+        
+        counts = self._status_counts.get(project.project_id)
+        if counts is None:
+            counts = Counter(step.status for step in project.workflow_steps)
+            self._status_counts[project.project_id] = counts
+        return counts
+    
+    def set_step_status(self, project: Project, step: ProjectStep, status: ProjectStepStatus) -> None:
+        """Transition a step to a new status, keeping the project's status counts in sync"""
+        
+        counts = self.step_status_counts(project)
+        counts[step.status] -= 1
+        counts[status] += 1
+        step.status = status
+    
+    def reset_step_status_counts(self, project_id: str) -> None:
+        """Drop a project's status counts so they are recounted from its steps"""
+        self._status_counts.pop(project_id, None)
+    
+    def forget_project(self, project_id: str) -> None:
+        """Drop all per-project state held by the orchestrator"""
+        self.invalidate_layout_cache(project_id)
+        self.reset_step_status_counts(project_id)
+    
     def _calculate_project_quality_score(self, project: Project) -> float:
         """Calculate overall project quality score"""
         
         if not project.workflow_steps:
             return 0.0
         
-        completed_steps = [s for s in project.workflow_steps if s.status == ProjectStepStatus.COMPLETED]
-        completion_rate = len(completed_steps) / len(project.workflow_steps)
-        
-        # Average confidence scores
-        confidence_scores = []
-        for step in completed_steps:
-            if step.output_data and "confidence" in step.output_data:
-                confidence_scores.append(step.output_data["confidence"])
-        
-        avg_confidence = sum(confidence_scores) / len(confidence_scores) if confidence_scores else 0.5
+        completion_rate = self._completion_rate(project)
+        avg_confidence = self._average_step_confidence(project)
         
         # Calculate quality score
         quality_score = (completion_rate * 0.6) + (avg_confidence * 0.4)
         
         return round(quality_score, 2)
     
+    def _completion_rate(self, project: Project) -> float:
+        """Fraction of a project's steps that are completed"""
+        
+        if not project.workflow_steps:
+            return 0.0
+        return self.step_status_counts(project)[ProjectStepStatus.COMPLETED] / len(project.workflow_steps)
+    
+    def _average_step_confidence(self, project: Project) -> float:
+        """Average confidence reported by completed steps (0.5 when none reported)"""
+        
+        confidence_scores = []
+        for step in project.workflow_steps:
+            if step.status == ProjectStepStatus.COMPLETED and step.output_data and "confidence" in step.output_data:
+                confidence_scores.append(step.output_data["confidence"])
+        
+        return sum(confidence_scores) / len(confidence_scores) if confidence_scores else 0.5
+    
     def _calculate_project_completeness(self, project: Project) -> float:
         """Calculate project completeness percentage"""
         
         if not project.workflow_steps:
             return 0.0
         
-        completed_count = len([s for s in project.workflow_steps if s.status == ProjectStepStatus.COMPLETED])
+        completed_count = self.step_status_counts(project)[ProjectStepStatus.COMPLETED]
         total_count = len(project.workflow_steps)
         
         return round((completed_count / total_count) * 100, 1)
@@ -911,9 +1429,9 @@ class ProjectWorkflowOrchestrator:
             recommendations.append(f"Project is {completeness}% complete. Consider completing remaining steps.")
         
         # Check for failed steps
-        failed_steps = [s for s in project.workflow_steps if s.status == ProjectStepStatus.FAILED]
-        if failed_steps:
-            recommendations.append(f"Review and retry {len(failed_steps)} failed workflow steps.")
+        failed_count = self.step_status_counts(project)[ProjectStepStatus.FAILED]
+        if failed_count:
+            recommendations.append(f"Review and retry {failed_count} failed workflow steps.")
         
         # Check quality score
         quality_score = self._calculate_project_quality_score(project)
@@ -937,20 +1455,16 @@ class ProjectWorkflowOrchestrator:
             if not step.validation_criteria:
                 return True  # No specific criteria to validate
             
-            validation_results = []
+            exact_criteria, suffix_counts = _classify_validation_criteria(tuple(step.validation_criteria))
             
-            for criterion in step.validation_criteria:
-                if criterion in result:
-                    validation_results.append(True)
-                elif criterion.endswith("_generated") and any(key.endswith("_generated") for key in result.keys()):
-                    validation_results.append(True)
-                elif criterion.endswith("_analyzed") and any(key.endswith("_analyzed") for key in result.keys()):
-                    validation_results.append(True)
-                else:
-                    validation_results.append(False)
+            # Suffix criteria are met as a group when any result key carries the suffix
+            met_count = sum(1 for criterion in exact_criteria if criterion in result)
+            for suffix, count in suffix_counts:
+                if any(key.endswith(suffix) for key in result):
+                    met_count += count
             
             # Require at least 70% of criteria to be met
-            success_rate = sum(validation_results) / len(validation_results)
+            success_rate = met_count / len(step.validation_criteria)
             return success_rate >= 0.7
             
         except Exception as e:
@@ -963,9 +1477,168 @@ class ProjectWorkflowOrchestrator:
             return False
 
 
+# Criteria suffixes satisfied by any result key with the same suffix
+_VALIDATION_SUFFIXES = ("_generated", "_analyzed")
+
+
+@lru_cache(maxsize=256)
+def _classify_validation_criteria(
+    criteria: Tuple[str, ...]
+) -> Tuple[Tuple[str, ...], Tuple[Tuple[str, int], ...]]:
+    """Split validation criteria into exact-key criteria and per-suffix counts"""
+    
+    exact: List[str] = []
+    suffix_counts = Counter()
+    for criterion in criteria:
+        suffix = next((suffix for suffix in _VALIDATION_SUFFIXES if criterion.endswith(suffix)), None)
+        if suffix is None:
+            exact.append(criterion)
+        else:
+            suffix_counts[suffix] += 1
+    
+    return tuple(exact), tuple(suffix_counts.items())
+
+
+# Step executors by workflow step type
+_STEP_HANDLERS = MappingProxyType({
+    _DOCUMENT_PROCESSING: ProjectWorkflowOrchestrator._execute_document_processing,
+    _RAG_INDEXING: ProjectWorkflowOrchestrator._execute_rag_indexing,
+    _REQUIREMENT_ANALYSIS: ProjectWorkflowOrchestrator._execute_requirement_analysis,
+    _SITE_ANALYSIS: ProjectWorkflowOrchestrator._execute_site_analysis,
+    _LAYOUT_GENERATION: ProjectWorkflowOrchestrator._execute_layout_generation,
+    _VALIDATION: ProjectWorkflowOrchestrator._execute_validation,
+    _OPTIMIZATION: ProjectWorkflowOrchestrator._execute_optimization,
+    _REVIT_PREPARATION: ProjectWorkflowOrchestrator._execute_revit_preparation,
+    _FINAL_REVIEW: ProjectWorkflowOrchestrator._execute_final_review
+})
+
+
+@lru_cache(maxsize=4096)
+def _isoformat(value: datetime) -> str:
+    """ISO-format a project timestamp once; status polls reuse the string"""
+    return value.isoformat()
+
+
+@dataclass(slots=True)
+class ProjectSummary:
+    """Listing view of a project, maintained as the project is stored and changes status"""
+    project_id: str
+    name: str
+    project_type: Any
+    building_type: Any
+    status: ProjectStatus
+    progress_percentage: float
+    created_at: str
+    estimated_duration_minutes: Optional[int]
+    total_steps: int
+    
+    @classmethod
+    def from_project(cls, project: Project) -> "ProjectSummary":
+        return cls(
+            project_id=project.project_id,
+            name=project.name,
+            project_type=project.project_type,
+            building_type=project.building_type,
+            status=project.status,
+            progress_percentage=0.0,
+            created_at=project.created_at.isoformat(),
+            estimated_duration_minutes=project.estimated_duration_minutes,
+            total_steps=len(project.workflow_steps)
+        )
+
+
+class ProjectStore:
+    """In-memory project storage indexed by creation order and by status
+    
+    Projects are kept in insertion (creation) order, plus one bucket per
+    status, so listings page from the newest end and status filters only
+    touch matching projects. Status changes must go through set_status to
+    keep the buckets in sync. Mutations never await, so they are atomic
+    with respect to other tasks on the event loop. on_store is called with
+    the project id whenever a project is stored, so derived per-project
+    state held elsewhere can be dropped.
+    """
+    
+    def __init__(self, on_store: Optional[Callable[[str], None]] = None):
+        self._on_store = on_store
+        self._projects: Dict[str, Project] = {}
+        self._by_status: Dict[ProjectStatus, Dict[str, Project]] = {}
+        self._summaries: Dict[str, ProjectSummary] = {}
+        self._steps_by_id: Dict[str, Dict[str, ProjectStep]] = {}
+    
+    def __len__(self) -> int:
+        return len(self._projects)
+    
+    def __contains__(self, project_id: str) -> bool:
+        return project_id in self._projects
+    
+    def __getitem__(self, project_id: str) -> Project:
+        return self._projects[project_id]
+    
+    def __setitem__(self, project_id: str, project: Project) -> None:
+        # The stored status may have been changed directly, so clear every bucket
+        for bucket in self._by_status.values():
+            bucket.pop(project_id, None)
+        # Replacing an existing key keeps its original creation-order position
+        self._projects[project_id] = project
+        self._by_status.setdefault(project.status, {})[project_id] = project
+        self._summaries[project_id] = ProjectSummary.from_project(project)
+        self._steps_by_id[project_id] = {step.step_id: step for step in project.workflow_steps}
+        if self._on_store is not None:
+            self._on_store(project_id)
+    
+    def __delitem__(self, project_id: str) -> None:
+        project = self._projects.pop(project_id)
+        self._summaries.pop(project_id, None)
+        self._steps_by_id.pop(project_id, None)
+        bucket = self._by_status.get(project.status)
+        if bucket is not None:
+            bucket.pop(project_id, None)
+    
+    def get(self, project_id: str) -> Optional[Project]:
+        return self._projects.get(project_id)
+    
+    def values(self) -> Iterable[Project]:
+        return self._projects.values()
+    
+    def set_status(self, project: Project, status: ProjectStatus) -> None:
+        """Change a project's status and move it to the matching bucket"""
+        
+        bucket = self._by_status.get(project.status)
+        if bucket is not None:
+            bucket.pop(project.project_id, None)
+        project.status = status
+        if project.project_id in self._projects:
+            self._by_status.setdefault(status, {})[project.project_id] = project
+            self._summaries[project.project_id].status = status
+    
+    def with_status(self, status: ProjectStatus) -> Iterable[Project]:
+        """Projects currently in the given status"""
+        return self._by_status.get(status, {}).values()
+    
+    def count_with_status(self, status: ProjectStatus) -> int:
+        """Number of projects currently in the given status"""
+        return len(self._by_status.get(status, ()))
+    
+    def get_step(self, project_id: str, step_id: str) -> Optional[ProjectStep]:
+        """Look up a stored project's workflow step by id"""
+        return self._steps_by_id.get(project_id, {}).get(step_id)
+    
+    def summary(self, project_id: str) -> ProjectSummary:
+        """The maintained listing summary of a stored project"""
+        return self._summaries[project_id]
+    
+    def newest(self, offset: int, limit: int) -> List[Project]:
+        """A page of projects, newest first, without materializing the rest"""
+        return list(islice(reversed(self._projects.values()), offset, offset + limit))
+
+
 class ProjectService:
     """Main project service for managing architectural design projects"""
     
+    # Concurrent RAG index removals when deleting a project
+    RAG_REMOVAL_CONCURRENCY = 16
+    
     def __init__(
         self,
         ai_service: AIService,
@@ -986,8 +1659,12 @@ class ProjectService:
             ai_service, document_service, rag_service, cache
         )
         
-        # Project storage (in production, this would be a database)
-        self.projects: Dict[str, Project] = {}
+        # Project storage (in production, this would be a database); storing a
+        # project drops the orchestrator's cached counts and layout data for it
+        self.projects = ProjectStore(on_store=self.workflow_orchestrator.forget_project)
+        
+        # Monotonic workflow start times, for elapsed-time math immune to clock changes
+        self._workflow_started: Dict[str, float] = {}
         
         logger.info("Project Service initialized")
     
@@ -1084,55 +1761,33 @@ class ProjectService:
             if not project:
                 raise ProjectServiceException(f"Project {project_id} not found")
             
+            # Recount step statuses, picking up any changes made outside set_step_status
+            self.workflow_orchestrator.reset_step_status_counts(project_id)
+            
             # Update project status
-            project.status = ProjectStatus.IN_PROGRESS
+            self.projects.set_status(project, ProjectStatus.IN_PROGRESS)
             project.started_at = datetime.utcnow()
+            self._workflow_started[project_id] = time.monotonic()
             
-            # Execute workflow steps
-            for step in project.workflow_steps:
-                # Check dependencies
-                if not self._are_dependencies_completed(step, project.workflow_steps):
-                    logger.warning(
-                        "Step dependencies not met, skipping",
-                        project_id=project_id,
-                        step_id=step.step_id,
-                        correlation_id=correlation_id
-                    )
-                    continue
-                
-                # Execute step
-                success, result = await self.workflow_orchestrator.execute_workflow_step(
-                    project, step, correlation_id
-                )
-                
-                if not success:
-                    logger.error(
-                        "Workflow step failed, stopping execution",
-                        project_id=project_id,
-                        step_id=step.step_id,
-                        error=result.get("error"),
-                        correlation_id=correlation_id
-                    )
-                    project.status = ProjectStatus.FAILED
-                    break
+            # Execute workflow steps as their dependencies complete
+            if not await self.workflow_orchestrator.execute_workflow(project, correlation_id):
+                self.projects.set_status(project, ProjectStatus.FAILED)
             
             # Update project completion
+            status_counts = self.workflow_orchestrator.step_status_counts(project)
             if project.status != ProjectStatus.FAILED:
-                completed_steps = [s for s in project.workflow_steps if s.status == ProjectStepStatus.COMPLETED]
-                if len(completed_steps) == len(project.workflow_steps):
-                    project.status = ProjectStatus.COMPLETED
+                if status_counts[ProjectStepStatus.COMPLETED] == len(project.workflow_steps):
+                    self.projects.set_status(project, ProjectStatus.COMPLETED)
                     project.completed_at = datetime.utcnow()
-                    project.actual_duration_minutes = int(
-                        (project.completed_at - project.started_at).total_seconds() / 60
-                    )
+                    project.actual_duration_minutes = self._elapsed_workflow_minutes(project)
                 else:
-                    project.status = ProjectStatus.PARTIALLY_COMPLETED
+                    self.projects.set_status(project, ProjectStatus.PARTIALLY_COMPLETED)
             
             logger.info(
                 "Project workflow execution completed",
                 project_id=project_id,
                 final_status=project.status,
-                completed_steps=len([s for s in project.workflow_steps if s.status == ProjectStepStatus.COMPLETED]),
+                completed_steps=status_counts[ProjectStepStatus.COMPLETED],
                 total_steps=len(project.workflow_steps),
                 correlation_id=correlation_id
             )
@@ -1150,7 +1805,7 @@ class ProjectService:
             
             # Update project status
             if project_id in self.projects:
-                self.projects[project_id].status = ProjectStatus.FAILED
+                self.projects.set_status(self.projects[project_id], ProjectStatus.FAILED)
             
             raise ProjectServiceException(
                 f"Failed to execute project workflow for {project_id}",
@@ -1159,36 +1814,6 @@ class ProjectService:
                 inner_exception=e
             )
     
-    def _are_dependencies_completed(
-        self,
-        step: ProjectStep,
-        all_steps: List[ProjectStep]
-    ) -> bool:
-        """Check if all step dependencies are completed"""
-        
-        if not step.dependencies:
-            return True
-        
-        # Create lookup of completed step types
-        completed_step_types = set()
-        for completed_step in all_steps:
-            if completed_step.status == ProjectStepStatus.COMPLETED:
-                completed_step_types.add(completed_step.step_type)
-        
-        # Check if all dependencies are satisfied
-        for dependency in step.dependencies:
-            # Convert dependency string to step type
-            dependency_type = None
-            for step_type in WorkflowStepType:
-                if dependency.replace('_', '') in step_type.value.replace('_', ''):
-                    dependency_type = step_type
-                    break
-            
-            if dependency_type and dependency_type not in completed_step_types:
-                return False
-        
-        return True
-    
     async def get_project_status(
         self,
         project_id: str,
@@ -1202,32 +1827,40 @@ class ProjectService:
                 raise ProjectServiceException(f"Project {project_id} not found")
             
             # Calculate progress metrics
-            completed_steps = [s for s in project.workflow_steps if s.status == ProjectStepStatus.COMPLETED]
-            in_progress_steps = [s for s in project.workflow_steps if s.status == ProjectStepStatus.IN_PROGRESS]
-            failed_steps = [s for s in project.workflow_steps if s.status == ProjectStepStatus.FAILED]
+            status_counts = self.workflow_orchestrator.step_status_counts(project)
+            completed_count = status_counts[ProjectStepStatus.COMPLETED]
+            in_progress_count = status_counts[ProjectStepStatus.IN_PROGRESS]
             
-            progress_percentage = (len(completed_steps) / len(project.workflow_steps)) * 100 if project.workflow_steps else 0
+            progress_percentage = (completed_count / len(project.workflow_steps)) * 100 if project.workflow_steps else 0
+            
+            current_step = None
+            if in_progress_count:
+                current_step = next(
+                    (s.name for s in project.workflow_steps if s.status == ProjectStepStatus.IN_PROGRESS),
+                    None
+                )
             
             # Calculate time metrics
             actual_duration = 0
-            if project.started_at:
-                end_time = project.completed_at or datetime.utcnow()
-                actual_duration = int((end_time - project.started_at).total_seconds() / 60)
+            if project.completed_at and project.actual_duration_minutes is not None:
+                actual_duration = project.actual_duration_minutes
+            elif project.started_at:
+                actual_duration = self._elapsed_workflow_minutes(project)
             
             return {
                 "project_id": project_id,
                 "status": project.status,
                 "progress_percentage": round(progress_percentage, 1),
                 "total_steps": len(project.workflow_steps),
-                "completed_steps": len(completed_steps),
-                "in_progress_steps": len(in_progress_steps),
-                "failed_steps": len(failed_steps),
+                "completed_steps": completed_count,
+                "in_progress_steps": in_progress_count,
+                "failed_steps": status_counts[ProjectStepStatus.FAILED],
                 "estimated_duration_minutes": project.estimated_duration_minutes,
                 "actual_duration_minutes": actual_duration,
-                "created_at": project.created_at.isoformat(),
-                "started_at": project.started_at.isoformat() if project.started_at else None,
-                "completed_at": project.completed_at.isoformat() if project.completed_at else None,
-                "current_step": in_progress_steps[0].name if in_progress_steps else None,
+                "created_at": self.projects.summary(project_id).created_at,
+                "started_at": _isoformat(project.started_at) if project.started_at else None,
+                "completed_at": _isoformat(project.completed_at) if project.completed_at else None,
+                "current_step": current_step,
                 "next_step": self._get_next_pending_step(project.workflow_steps)
             }
             
@@ -1240,6 +1873,17 @@ class ProjectService:
             )
             raise
     
+    def _elapsed_workflow_minutes(self, project: Project) -> int:
+        """Minutes since the project's workflow started, from the monotonic clock when available"""
+        
+        started = self._workflow_started.get(project.project_id)
+        if started is not None:
+            return int((time.monotonic() - started) / 60)
+        
+        # Started outside this process; fall back to wall-clock timestamps
+        end_time = project.completed_at or datetime.utcnow()
+        return int((end_time - project.started_at).total_seconds() / 60)
+    
     def _get_next_pending_step(self, workflow_steps: List[ProjectStep]) -> Optional[str]:
         """Get the next pending step name"""
         
@@ -1261,37 +1905,11 @@ class ProjectService:
             if not project:
                 raise ProjectServiceException(f"Project {project_id} not found")
             
-            # Calculate step metrics
-            step_statuses = {}
-            step_durations = {}
-            
-            for step in project.workflow_steps:
-                step_statuses[step.step_type] = step.status
-                if step.actual_duration_minutes:
-                    step_durations[step.step_type] = step.actual_duration_minutes
-            
-            # Calculate efficiency metrics
-            total_estimated = sum(step.estimated_duration_minutes for step in project.workflow_steps)
-            total_actual = sum(step.actual_duration_minutes or 0 for step in project.workflow_steps)
-            
-            efficiency_ratio = (total_estimated / total_actual) if total_actual > 0 else 1.0
-            
-            # Calculate quality metrics
-            quality_score = self.workflow_orchestrator._calculate_project_quality_score(project)
-            
-            return ProjectMetrics(
-                project_id=project_id,
-                total_steps=len(project.workflow_steps),
-                completed_steps=len([s for s in project.workflow_steps if s.status == ProjectStepStatus.COMPLETED]),
-                failed_steps=len([s for s in project.workflow_steps if s.status == ProjectStepStatus.FAILED]),
-                estimated_duration_minutes=total_estimated,
-                actual_duration_minutes=total_actual,
-                efficiency_ratio=round(efficiency_ratio, 2),
-                quality_score=quality_score,
-                step_statuses=step_statuses,
-                step_durations=step_durations,
-                last_updated=datetime.utcnow()
-            )
+            # Metrics are CPU-only; keep large workflows from stalling the event loop
+            status_counts = self.workflow_orchestrator.step_status_counts(project)
+            if len(project.workflow_steps) > self.workflow_orchestrator.REVIEW_THREAD_STEP_THRESHOLD:
+                return await asyncio.to_thread(self._project_metrics_sync, project, status_counts)
+            return self._project_metrics_sync(project, status_counts)
             
         except Exception as e:
             logger.error(
@@ -1302,6 +1920,41 @@ class ProjectService:
             )
             raise
     
+    def _project_metrics_sync(self, project: Project, status_counts: Counter) -> ProjectMetrics:
+        """Compute detailed project metrics"""
+        
+        # Calculate step metrics
+        step_statuses = {}
+        step_durations = {}
+        
+        for step in project.workflow_steps:
+            step_statuses[step.step_type] = step.status
+            if step.actual_duration_minutes:
+                step_durations[step.step_type] = step.actual_duration_minutes
+        
+        # Calculate efficiency metrics
+        total_estimated = sum(step.estimated_duration_minutes for step in project.workflow_steps)
+        total_actual = sum(step.actual_duration_minutes or 0 for step in project.workflow_steps)
+        
+        efficiency_ratio = (total_estimated / total_actual) if total_actual > 0 else 1.0
+        
+        # Calculate quality metrics
+        quality_score = self.workflow_orchestrator._calculate_project_quality_score(project)
+        
+        return ProjectMetrics(
+            project_id=project.project_id,
+            total_steps=len(project.workflow_steps),
+            completed_steps=status_counts[ProjectStepStatus.COMPLETED],
+            failed_steps=status_counts[ProjectStepStatus.FAILED],
+            estimated_duration_minutes=total_estimated,
+            actual_duration_minutes=total_actual,
+            efficiency_ratio=round(efficiency_ratio, 2),
+            quality_score=quality_score,
+            step_statuses=step_statuses,
+            step_durations=step_durations,
+            last_updated=datetime.utcnow()
+        )
+    
     async def retry_failed_step(
         self,
         project_id: str,
@@ -1323,11 +1976,7 @@ class ProjectService:
                 raise ProjectServiceException(f"Project {project_id} not found")
             
             # Find the failed step
-            target_step = None
-            for step in project.workflow_steps:
-                if step.step_id == step_id:
-                    target_step = step
-                    break
+            target_step = self.projects.get_step(project_id, step_id)
             
             if not target_step:
                 raise ProjectServiceException(f"Step {step_id} not found")
@@ -1335,8 +1984,10 @@ class ProjectService:
             if target_step.status != ProjectStepStatus.FAILED:
                 raise ProjectServiceException(f"Step {step_id} is not in failed state")
             
+            self.workflow_orchestrator.reset_step_status_counts(project_id)
+            
             # Reset step status
-            target_step.status = ProjectStepStatus.PENDING
+            self.workflow_orchestrator.set_step_status(project, target_step, ProjectStepStatus.PENDING)
             target_step.error_message = None
             target_step.started_at = None
             target_step.completed_at = None
@@ -1378,33 +2029,23 @@ class ProjectService:
         """List projects with optional filtering"""
         
         try:
-            projects = list(self.projects.values())
-            
-            # Apply status filter
             if status_filter:
-                projects = [p for p in projects if p.status == status_filter]
-            
-            # Sort by creation date (newest first)
-            projects.sort(key=lambda p: p.created_at, reverse=True)
-            
-            # Apply pagination
-            paginated_projects = projects[offset:offset + limit]
+                # Select only the newest offset + limit projects of the matching status bucket
+                paginated_projects = nlargest(
+                    offset + limit,
+                    self.projects.with_status(status_filter),
+                    key=attrgetter("created_at")
+                )[offset:]
+            else:
+                # Storage is in creation order, so page straight from the newest end
+                paginated_projects = self.projects.newest(offset, limit)
             
-            # Convert to summary format
+            # Convert the maintained summaries; only progress is refreshed, from the status counters
             project_summaries = []
             for project in paginated_projects:
-                summary = {
-                    "project_id": project.project_id,
-                    "name": project.name,
-                    "project_type": project.project_type,
-                    "building_type": project.building_type,
-                    "status": project.status,
-                    "progress_percentage": self._calculate_progress_percentage(project),
-                    "created_at": project.created_at.isoformat(),
-                    "estimated_duration_minutes": project.estimated_duration_minutes,
-                    "total_steps": len(project.workflow_steps)
-                }
-                project_summaries.append(summary)
+                summary = self.projects.summary(project.project_id)
+                summary.progress_percentage = self._calculate_progress_percentage(project)
+                project_summaries.append(asdict(summary))
             
             return project_summaries
             
@@ -1422,7 +2063,7 @@ class ProjectService:
         if not project.workflow_steps:
             return 0.0
         
-        completed_count = len([s for s in project.workflow_steps if s.status == ProjectStepStatus.COMPLETED])
+        completed_count = self.workflow_orchestrator.step_status_counts(project)[ProjectStepStatus.COMPLETED]
         total_count = len(project.workflow_steps)
         
         return round((completed_count / total_count) * 100, 1)
@@ -1446,21 +2087,32 @@ class ProjectService:
             
             project = self.projects[project_id]
             
-            # Clean up associated documents from RAG index
-            if project.uploaded_documents:
-                for doc_id in project.uploaded_documents:
-                    try:
+            # Clean up associated documents from RAG index; removals are independent
+            doc_ids = list(project.uploaded_documents or ())
+            if doc_ids:
+                semaphore = asyncio.Semaphore(self.RAG_REMOVAL_CONCURRENCY)
+                
+                async def remove_document(doc_id: str) -> None:
+                    async with semaphore:
                         await self.rag_service.remove_document(doc_id, correlation_id)
-                    except Exception as e:
+                
+                results = await asyncio.gather(
+                    *(remove_document(doc_id) for doc_id in doc_ids),
+                    return_exceptions=True
+                )
+                for doc_id, result in zip(doc_ids, results):
+                    if isinstance(result, Exception):
                         logger.warning(
                             "Failed to remove document from RAG index",
                             project_id=project_id,
                             document_id=doc_id,
-                            error=str(e)
+                            error=str(result)
                         )
             
             # Remove from project storage
             del self.projects[project_id]
+            self.workflow_orchestrator.forget_project(project_id)
+            self._workflow_started.pop(project_id, None)
             
             logger.info(
                 "Project deleted successfully",
@@ -1486,7 +2138,7 @@ class ProjectService:
             return {
                 "status": "healthy",
                 "total_projects": len(self.projects),
-                "active_projects": len([p for p in self.projects.values() if p.status == ProjectStatus.IN_PROGRESS]),
+                "active_projects": self.projects.count_with_status(ProjectStatus.IN_PROGRESS),
                 "service_uptime": "available",
                 "last_check": datetime.utcnow().isoformat()
             }
@@ -963,6 +963,94 @@ class RAGService:
                 inner_exception=e
             )
     
+    async def index_documents_batch(
+        self,
+        items: List[Dict[str, Any]],
+        correlation_id: str
+    ) -> Dict[str, Dict[str, Any]]:
+        """Index several documents with a single embedding pass over all their chunks"""
+        
+        start_time = datetime.utcnow()
+        
+        logger.info(
+            "Starting batch document indexing",
+            document_count=len(items),
+            correlation_id=correlation_id
+        )
+        
+        try:
+            # Chunk all documents concurrently
+            chunk_lists = await asyncio.gather(*(
+                self.chunker.chunk_document(
+                    item["content"], item["document_id"], item.get("metadata", {}), correlation_id
+                )
+                for item in items
+            ))
+            
+            all_chunks = [chunk for chunks in chunk_lists for chunk in chunks]
+            
+            # One embedding call and one index update for the whole batch
+            if all_chunks:
+                embeddings = await self.embedding_generator.generate_embeddings(
+                    all_chunks, correlation_id
+                )
+                await self.search_engine.index_chunks(all_chunks, embeddings, correlation_id)
+            
+            results = {}
+            for item, chunks in zip(items, chunk_lists):
+                document_id = item["document_id"]
+                self.documents[document_id] = {
+                    "metadata": item.get("metadata", {}),
+                    "content_length": len(item["content"]),
+                    "indexed_at": start_time,
+                    "correlation_id": correlation_id
+                }
+                
+                if chunks:
+                    self.document_chunks[document_id] = chunks
+                    results[document_id] = {"status": "indexed", "chunk_count": len(chunks)}
+                else:
+                    results[document_id] = {"status": "no_chunks", "chunk_count": 0}
+            
+            processing_time = (datetime.utcnow() - start_time).total_seconds() * 1000
+            
+            logger.info(
+                "Batch document indexing completed",
+                document_count=len(items),
+                chunk_count=len(all_chunks),
+                processing_time_ms=processing_time,
+                correlation_id=correlation_id
+            )
+            
+            log_ai_operation(
+                operation="document_indexing",
+                model_used="tfidf-512d",
+                input_tokens=sum(len(item["content"].split()) for item in items),
+                correlation_id=correlation_id,
+                metadata={
+                    "document_count": len(items),
+                    "chunk_count": len(all_chunks),
+                    "processing_time_ms": int(processing_time)
+                }
+            )
+            
+            return results
+            
+        except Exception as e:
+            logger.error(
+                "Batch document indexing failed",
+                document_count=len(items),
+                error=str(e),
+                correlation_id=correlation_id,
+                exc_info=True
+            )
+            raise RAGServiceException(
+                "Failed to index document batch",
+                "DOCUMENT_INDEXING_FAILED",
+                correlation_id,
+                inner_exception=e
+            )
+    
     async def query_knowledge_base(
         self,
         query: str,
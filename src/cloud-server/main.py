@@ -14,7 +14,7 @@ import uvicorn
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from app.api.auth import router as auth_router
 from app.api.ai import router as ai_router
@@ -23,11 +23,12 @@ from app.api.projects import router as projects_router
 from app.api.system import router as system_router
 from app.api.regional import router as regional_router
 from app.api.billing import router as billing_router
-from app.api.notifications import router as notifications_router
+from app.api.notifications import router as notifications_router, close_email_service
 from app.core.config import get_settings
 from app.core.database import init_db
 from app.core.logging import configure_logging, set_correlation_id, get_correlation_id
 from app.core.middleware import add_middleware
+from app.services.document_service import document_service
 from app.core.exceptions import RevitAutoPlanException, ValidationException, AIModelUnavailableException, NetworkException
 
 # Task queue imports
@@ -67,6 +68,12 @@ async def lifespan(app: FastAPI):
     await init_db()
     logger.info("Database initialized")
     
+    # Restore document metadata written by the write-behind persistence layer
+    try:
+        await document_service.load_persisted_documents()
+    except Exception as e:
+        logger.warning("Failed to load persisted documents", error=str(e))
+    
     # Initialize task queue system
     if TASK_QUEUE_AVAILABLE:
         try:
@@ -124,6 +131,18 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.warning("Error during task queue cleanup", error=str(e))
     
+    # Close pooled SMTP connections
+    try:
+        await close_email_service()
+    except Exception as e:
+        logger.warning("Error during email service shutdown", error=str(e))
+    
+    # Flush pending document persistence
+    try:
+        await document_service.shutdown()
+    except Exception as e:
+        logger.warning("Error during document service shutdown", error=str(e))
+    
     # Cleanup performance monitoring
     if PERFORMANCE_AVAILABLE:
         try:
@@ -142,6 +161,7 @@ def create_app() -> FastAPI:
         version="1.0.0",
         docs_url="/docs",  # Always enable for development
         redoc_url="/redoc",  # Always enable for development
+        default_response_class=ORJSONResponse,  # orjson encoder for large document/metadata payloads
         lifespan=lifespan,
     )
     
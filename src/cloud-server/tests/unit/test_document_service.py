@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Dict, Any, List
 import io
 import uuid
+import asyncio
 
 from app.services.document_service import DocumentService
 from app.models.documents import (
@@ -679,4 +680,215 @@ class TestDocumentServiceIntegration:
             
             assert result.processing_status == ProcessingStatus.COMPLETED
             assert len(result.extracted_text) > 1000
-            assert result.processing_time_ms == 5000
\ No newline at end of file
+            assert result.processing_time_ms == 5000
+
+class TestDocumentContentCache:
+    """Test serialized document content caching"""
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.document_service = DocumentService()
+        self.metadata = Mock(processed_content={"sections": [{"title": "Scope"}]})
+        self.document_service.documents["doc-1"] = self.metadata
+    
+    @pytest.mark.asyncio
+    async def test_content_json_is_cached_per_version(self):
+        """Test repeated reads reuse the serialized payload until the version changes"""
+        first = await self.document_service.get_document_content_json("doc-1", "corr-1")
+        second = await self.document_service.get_document_content_json("doc-1", "corr-2")
+        
+        assert first is second
+        
+        self.metadata.processed_content = {"sections": [{"title": "Updated"}]}
+        self.document_service._doc_versions["doc-1"] = 1
+        
+        third = await self.document_service.get_document_content_json("doc-1", "corr-3")
+        
+        assert third is not first
+        assert b"Updated" in third
+    
+    @pytest.mark.asyncio
+    async def test_content_cache_is_bounded(self):
+        """Test least recently used payloads are evicted"""
+        self.document_service.SERIALIZED_CACHE_MAXSIZE = 2
+        for index in range(3):
+            self.document_service.documents[f"doc-{index}"] = Mock(processed_content={"index": index})
+            await self.document_service.get_document_content_json(f"doc-{index}", "corr")
+        
+        assert len(self.document_service._meta_cache) == 2
+        assert ("content", "doc-0") not in self.document_service._meta_cache
+
+
+class TestDocumentBatchProcessing:
+    """Test bounded concurrent batch processing"""
+    
+    @pytest.mark.asyncio
+    async def test_process_documents_batch_bounds_concurrency(self):
+        """Test at most max_concurrency documents are processed at once"""
+        document_service = DocumentService(max_concurrency=2)
+        in_flight = 0
+        peak = 0
+        
+        async def fake_process(request, correlation_id):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return request.document_id
+        
+        requests = [Mock(document_id=f"doc-{index}") for index in range(6)]
+        with patch.object(document_service, 'process_document', side_effect=fake_process):
+            results = await document_service.process_documents_batch(requests, "corr-batch")
+        
+        assert results == [f"doc-{index}" for index in range(6)]
+        assert peak == 2
+    
+    @pytest.mark.asyncio
+    async def test_process_documents_batch_isolates_failures(self):
+        """Test a failing document becomes a failed response without failing the batch"""
+        document_service = DocumentService()
+        
+        async def fake_process(request, correlation_id):
+            if request.document_id == "doc-bad":
+                raise RuntimeError("parser crashed")
+            return request.document_id
+        
+        requests = [Mock(document_id="doc-ok"), Mock(document_id="doc-bad")]
+        with patch.object(document_service, 'process_document', side_effect=fake_process), \
+                patch.object(document_service, '_processing_failed_response', return_value="failed") as mock_failed:
+            results = await document_service.process_documents_batch(requests, "corr-batch")
+        
+        assert results == ["doc-ok", "failed"]
+        assert str(mock_failed.call_args.args[2]) == "parser crashed"
+
+
+class TestDocumentDeletion:
+    """Test document deletion ordering between storage and RAG"""
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.rag_service = Mock()
+        self.rag_service.remove_document = AsyncMock()
+        self.document_service = DocumentService(rag_service=self.rag_service)
+        self.document_service.documents["doc-1"] = Mock(
+            storage_path="/uploads/doc-1.pdf",
+            rag_processed=True
+        )
+    
+    @pytest.mark.asyncio
+    async def test_failed_unlink_keeps_rag_entry(self):
+        """Test the RAG entry is kept when the file cannot be removed"""
+        with patch('app.services.document_service._remove_file_if_exists', side_effect=PermissionError("busy")):
+            deleted = await self.document_service.delete_document("doc-1", "corr-1")
+        
+        assert deleted is False
+        assert "doc-1" in self.document_service.documents
+        self.rag_service.remove_document.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_delete_removes_file_then_rag_entry(self):
+        """Test a successful delete removes the RAG entry and the metadata"""
+        with patch('app.services.document_service._remove_file_if_exists', return_value=True):
+            deleted = await self.document_service.delete_document("doc-1", "corr-1")
+        
+        assert deleted is True
+        assert "doc-1" not in self.document_service.documents
+        self.rag_service.remove_document.assert_awaited_once_with("doc-1", "corr-1")
+
+
+class TestDocumentListing:
+    """Test document listing filters"""
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.document_service = DocumentService()
+        self.document_service.documents = {
+            "doc-pdf": Mock(
+                file_type=DocumentType.PDF,
+                processing_status=ProcessingStatus.COMPLETED,
+                upload_timestamp=1
+            ),
+            "doc-dwg": Mock(
+                file_type=DocumentType.DWG,
+                processing_status=ProcessingStatus.COMPLETED,
+                upload_timestamp=2
+            )
+        }
+    
+    @pytest.mark.asyncio
+    async def test_filters_accept_plain_string_values(self):
+        """Test filtering by the enum's string value matches like the enum itself"""
+        by_enum = await self.document_service.list_documents(document_type=DocumentType.PDF)
+        by_value = await self.document_service.list_documents(document_type=DocumentType.PDF.value)
+        
+        assert by_value == by_enum
+        assert by_value == [self.document_service.documents["doc-pdf"]]
+    
+    @pytest.mark.asyncio
+    async def test_limit_returns_newest_first(self):
+        """Test bounded listings keep newest-first order"""
+        documents = await self.document_service.list_documents(
+            status=ProcessingStatus.COMPLETED.value,
+            limit=1
+        )
+        
+        assert documents == [self.document_service.documents["doc-dwg"]]
+
+
+class TestDocumentPersistence:
+    """Test write-behind persistence of document metadata"""
+    
+    @pytest.mark.asyncio
+    async def test_document_round_trips_through_persistence(self, tmp_path):
+        """Test a stored document is restored by a new service instance"""
+        persistence_path = str(tmp_path / "documents.db")
+        metadata = DocumentMetadata(
+            filename="floor_plan.pdf",
+            file_type=DocumentType.PDF,
+            file_size_bytes=2048,
+            content_hash="b" * 64
+        )
+        
+        writer = DocumentService(persistence_path=persistence_path)
+        writer.documents["doc-1"] = metadata
+        writer._bump_version("doc-1")
+        await writer.shutdown()
+        
+        reader = DocumentService(persistence_path=persistence_path)
+        loaded = await reader.load_persisted_documents()
+        
+        assert loaded == 1
+        assert reader.documents["doc-1"] == metadata
+    
+    @pytest.mark.asyncio
+    async def test_deleted_document_is_removed_from_persistence(self, tmp_path):
+        """Test deletions are written through as well"""
+        persistence_path = str(tmp_path / "documents.db")
+        writer = DocumentService(persistence_path=persistence_path)
+        writer.documents["doc-1"] = DocumentMetadata(
+            filename="section.pdf",
+            file_type=DocumentType.PDF,
+            file_size_bytes=1024,
+            content_hash="c" * 64
+        )
+        writer._bump_version("doc-1")
+        del writer.documents["doc-1"]
+        writer._schedule_persist("doc-1")
+        await writer.shutdown()
+        
+        reader = DocumentService(persistence_path=persistence_path)
+        
+        assert await reader.load_persisted_documents() == 0
+    
+    @pytest.mark.asyncio
+    async def test_writer_failure_stops_enqueuing(self, tmp_path):
+        """Test an unusable database disables persistence instead of growing the queue"""
+        document_service = DocumentService(persistence_path=str(tmp_path))  # a directory
+        document_service._schedule_persist("doc-1")
+        await asyncio.wait_for(document_service._persist_task, timeout=5.0)
+        
+        document_service._schedule_persist("doc-2")
+        
+        assert document_service._persist_disabled is True
+        assert document_service._persist_queue is None
@@ -0,0 +1,153 @@
+"""
+Unit tests for Email Service functionality
+Tests SMTP connection pooling, delivery results and template personalization
+"""
+
+import pytest
+import structlog
+import structlog.testing
+from unittest.mock import Mock, AsyncMock, patch
+
+from app.core.logging import setup_logging
+from app.services.notifications import email_service as email_service_module
+from app.services.notifications.email_service import (
+    EmailService, EmailConfig, EmailMessage, EmailRecipient, EmailTemplate
+)
+
+
+def _smtp_client_mock() -> Mock:
+    """Create a connected-looking SMTP client mock"""
+    smtp = Mock()
+    smtp.is_connected = True
+    smtp.connect = AsyncMock()
+    smtp.login = AsyncMock()
+    smtp.quit = AsyncMock()
+    smtp.send_message = AsyncMock(return_value=({}, "250 OK"))
+    return smtp
+
+
+class TestEmailService:
+    """Test Email Service main functionality"""
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.config = EmailConfig(
+            smtp_server="smtp.example.com",
+            smtp_port=587,
+            username="noreply@example.com",
+            password="secret",
+            from_email="noreply@example.com",
+            max_concurrency=2
+        )
+        self.email_service = EmailService(self.config)
+        self.message = EmailMessage(
+            template=EmailTemplate.WELCOME,
+            recipients=[
+                EmailRecipient(email="a@example.com", name="A"),
+                EmailRecipient(email="b@example.org", name="B")
+            ],
+            subject="Welcome"
+        )
+    
+    @pytest.mark.asyncio
+    async def test_failed_smtp_result_is_reported_as_failed(self):
+        """Test a {"success": False} send result is not counted as delivered"""
+        send_results = {
+            "a@example.com": {"success": True, "message_id": "<1@example.com>"},
+            "b@example.org": {"success": False, "error": "550 mailbox unavailable"}
+        }
+        
+        async def fake_send(message, recipient, smtp=None):
+            return send_results[recipient.email]
+        
+        with patch.object(self.email_service, '_render_template',
+                          AsyncMock(return_value=("<html><body></body></html>", "text"))), \
+                patch.object(self.email_service, '_acquire_smtp', AsyncMock(return_value=_smtp_client_mock())), \
+                patch.object(self.email_service, '_release_smtp'), \
+                patch.object(self.email_service, '_send_smtp_email', side_effect=fake_send):
+            summary = await self.email_service.send_email(self.message)
+        
+        assert summary["successful"] == 1
+        assert summary["failed"] == 1
+        failed = [r for r in summary["results"] if r["status"] == "failed"]
+        assert failed[0]["recipient"] == "b@example.org"
+        assert failed[0]["error"] == "550 mailbox unavailable"
+    
+    @pytest.mark.asyncio
+    async def test_pooled_connection_is_reused_and_closed(self):
+        """Test released connections are reused and quit on aclose"""
+        smtp = _smtp_client_mock()
+        
+        with patch.object(self.email_service, '_new_smtp_client', return_value=smtp) as mock_new:
+            first = await self.email_service._acquire_smtp()
+            await self.email_service._release_smtp(first)
+            second = await self.email_service._acquire_smtp()
+            await self.email_service._release_smtp(second)
+        
+        assert first is second
+        assert mock_new.call_count == 1
+        smtp.connect.assert_awaited_once()
+        smtp.login.assert_awaited_once_with("noreply@example.com", "secret")
+        
+        await self.email_service.aclose()
+        
+        smtp.quit.assert_awaited_once()
+        assert self.email_service._smtp_open_connections == 0
+    
+    @pytest.mark.asyncio
+    async def test_connection_released_after_aclose_is_closed(self):
+        """Test a connection held across aclose is quit on release, not queued on a closed pool"""
+        smtp = _smtp_client_mock()
+        
+        with patch.object(self.email_service, '_new_smtp_client', return_value=smtp):
+            held = await self.email_service._acquire_smtp()
+        
+        await self.email_service.aclose()
+        smtp.quit.assert_not_awaited()
+        
+        await self.email_service._release_smtp(held)
+        
+        smtp.quit.assert_awaited_once()
+        assert self.email_service._smtp_open_connections == 0
+        assert self.email_service._smtp_pool is None
+    
+    def test_render_error_falls_back_to_generic_content(self):
+        """Test a template render error yields fallback content instead of raising"""
+        broken_template = Mock()
+        broken_template.render.side_effect = TypeError("unsupported operand")
+        recipient = self.message.recipients[0]
+        
+        html = self.email_service._personalize_content(
+            broken_template, recipient, {}, self.message
+        )
+        text = self.email_service._personalize_content(
+            broken_template, recipient, {}, self.message, is_html=False
+        )
+        
+        assert html == self.email_service._create_fallback_html(self.message)
+        assert text == self.email_service._create_fallback_text(self.message)
+
+
+class TestEmailLogging:
+    """Test email service log rendering"""
+    
+    def test_email_events_use_the_shared_structlog_pipeline(self):
+        """Test email service INFO events go through the application's structlog configuration"""
+        with structlog.testing.capture_logs() as captured:
+            email_service_module.logger.bind(service="email").info(
+                "Email sent successfully", recipient="a@example.com"
+            )
+        
+        assert captured == [{
+            "event": "Email sent successfully",
+            "recipient": "a@example.com",
+            "service": "email",
+            "log_level": "info"
+        }]
+    
+    def test_setup_logging_leaves_global_structlog_config_unchanged(self):
+        """Test application logging setup does not reconfigure structlog globally"""
+        structlog.reset_defaults()
+        setup_logging()
+        
+        assert not structlog.is_configured()
@@ -0,0 +1,163 @@
+"""
+Unit tests for Notification Scheduler functionality
+Tests rule dispatch, pending/retry heaps and history cleanup
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+from datetime import datetime, timedelta
+
+from app.services.notifications.email_service import EmailTemplate, EmailPriority
+from app.services.notifications.notification_scheduler import (
+    NotificationScheduler, NotificationRule, NotificationType
+)
+
+
+def _rule(rule_id: str, conditions=None, trigger_event: str = "project_completed") -> NotificationRule:
+    """Create a notification rule for tests"""
+    return NotificationRule(
+        id=rule_id,
+        name=f"Rule {rule_id}",
+        trigger_event=trigger_event,
+        template=EmailTemplate.PROJECT_COMPLETED,
+        notification_type=NotificationType.EMAIL,
+        priority=EmailPriority.NORMAL,
+        conditions=conditions or {},
+        target_selector="user"
+    )
+
+
+class TestNotificationRules:
+    """Test automation rule registration and dispatch"""
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.scheduler = NotificationScheduler(Mock())
+        self.event_data = {"user_email": "user@example.com", "tier": "professional"}
+    
+    @pytest.mark.asyncio
+    async def test_added_rule_fires_for_matching_event(self):
+        """Test rules added through add_notification_rule are compiled and dispatched"""
+        await self.scheduler.add_notification_rule(_rule("rule-1", {"tier": "professional"}))
+        await self.scheduler.add_notification_rule(_rule("rule-2", {"tier": "enterprise"}))
+        
+        triggered = await self.scheduler.trigger_event("project_completed", self.event_data)
+        
+        assert triggered == 1
+        assert len(self.scheduler._pending_by_id) == 1
+    
+    @pytest.mark.asyncio
+    async def test_failing_rule_does_not_stop_other_rules(self):
+        """Test an exception in one rule's processing still lets later rules fire"""
+        await self.scheduler.add_notification_rule(_rule("rule-1"))
+        await self.scheduler.add_notification_rule(_rule("rule-2"))
+        generate = self.scheduler._generate_rule_recipients
+        
+        def flaky_recipients(rule, event_data):
+            if rule.id == "rule-1":
+                raise KeyError("user_id")
+            return generate(rule, event_data)
+        
+        with patch.object(self.scheduler, '_generate_rule_recipients', side_effect=flaky_recipients):
+            triggered = await self.scheduler.trigger_event("project_completed", self.event_data)
+        
+        assert triggered == 1
+    
+    def test_condition_errors_evaluate_to_false(self):
+        """Test any predicate error is treated as a non-matching condition"""
+        rule = _rule("rule-1", {"tier": "professional"})
+        rule.compiled_conditions = [Mock(key="tier", predicate=Mock(side_effect=ValueError("bad value")))]
+        
+        assert self.scheduler._evaluate_rule_conditions(rule, self.event_data) is False
+    
+    def test_rule_list_is_read_only(self):
+        """Test rules cannot bypass add_notification_rule (they would never fire)"""
+        with pytest.raises(AttributeError):
+            self.scheduler.notification_rules.append(_rule("rule-1"))
+
+
+class TestNotificationCleanup:
+    """Test completed notification history cleanup"""
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.scheduler = NotificationScheduler(Mock())
+        self.now = datetime(2025, 6, 1)
+    
+    @pytest.mark.asyncio
+    async def test_old_entries_behind_newer_ones_are_removed(self):
+        """Test cleanup does not stop at the first recent entry (completion order != creation order)"""
+        recent = Mock(created_at=self.now - timedelta(days=1))
+        old_retried = Mock(created_at=self.now - timedelta(days=45))
+        old = Mock(created_at=self.now - timedelta(days=40))
+        self.scheduler.completed_notifications.extend([recent, old_retried, old])
+        
+        await self.scheduler._cleanup_old_notifications(self.now)
+        
+        assert list(self.scheduler.completed_notifications) == [recent]
+        assert self.scheduler.completed_notifications.maxlen == 10_000
+
+
+class TestNotificationHeaps:
+    """Test pending and retry heap ordering"""
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.scheduler = NotificationScheduler(Mock())
+        self.now = datetime(2025, 6, 1, 12, 0)
+        self.recipient = Mock(email="user@example.com")
+    
+    async def _schedule(self, minutes: int, data=None) -> str:
+        return await self.scheduler.schedule_notification(
+            template=EmailTemplate.PROJECT_COMPLETED,
+            recipients=[self.recipient],
+            template_data=data or {"minutes": minutes},
+            scheduled_for=self.now + timedelta(minutes=minutes)
+        )
+    
+    @pytest.mark.asyncio
+    async def test_due_notifications_are_released_in_schedule_order(self):
+        """Test only due notifications leave the heap, earliest first"""
+        late = await self._schedule(30)
+        first = await self._schedule(-10)
+        second = await self._schedule(-5)
+        
+        await self.scheduler._process_pending_notifications(self.now)
+        
+        released = []
+        while not self.scheduler._send_queue.empty():
+            batch, _ = self.scheduler._send_queue.get_nowait()
+            released.extend(notification.id for notification in batch)
+        
+        assert released == [first, second]
+        assert list(self.scheduler._pending_by_id) == [late]
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_notifications_are_never_released(self):
+        """Test cancelled heap entries are dropped as tombstones"""
+        cancelled = await self._schedule(-10)
+        kept = await self._schedule(-5)
+        
+        assert await self.scheduler.cancel_notification(cancelled) is True
+        await self.scheduler._process_pending_notifications(self.now)
+        
+        batch, _ = self.scheduler._send_queue.get_nowait()
+        
+        assert [notification.id for notification in batch] == [kept]
+        assert self.scheduler._send_queue.empty()
+        assert self.scheduler._pending_tombstones == 0
+    
+    @pytest.mark.asyncio
+    async def test_retry_heap_moves_due_retries_back_to_pending(self):
+        """Test retries become pending only once their retry time has passed"""
+        due = Mock(id="notif-due", scheduled_for=self.now - timedelta(minutes=1))
+        later = Mock(id="notif-later", scheduled_for=self.now + timedelta(minutes=5))
+        self.scheduler._retry_heap[:] = [
+            (due.scheduled_for, 0, due),
+            (later.scheduled_for, 1, later)
+        ]
+        
+        await self.scheduler._retry_failed_notifications(self.now)
+        
+        assert list(self.scheduler._pending_by_id) == ["notif-due"]
+        assert [entry[2] for entry in self.scheduler._retry_heap] == [later]
@@ -0,0 +1,353 @@
+"""
+Unit tests for Project Service functionality
+Tests workflow orchestration, step execution and project storage
+"""
+
+import asyncio
+from collections import Counter
+
+import pytest
+from unittest.mock import Mock, AsyncMock, patch
+from typing import Dict, Any, List
+
+from app.models.projects import ProjectStatus, ProjectStepStatus
+from app.services.project_service import (
+    ProjectService, ProjectStore, ProjectWorkflowOrchestrator, WorkflowStepType, _WORKFLOW_TEMPLATES
+)
+
+
+def _orchestrator(**kwargs) -> ProjectWorkflowOrchestrator:
+    """Create an orchestrator with mocked services"""
+    return ProjectWorkflowOrchestrator(
+        ai_service=kwargs.pop("ai_service", Mock()),
+        document_service=kwargs.pop("document_service", Mock()),
+        rag_service=kwargs.pop("rag_service", Mock()),
+        **kwargs
+    )
+
+
+class TestRagIndexingStep:
+    """Test the RAG indexing workflow step"""
+    
+    @pytest.mark.asyncio
+    async def test_batch_indexing_reports_per_document_status(self):
+        """Test documents the batch could not chunk are not reported as indexed"""
+        document_service = Mock()
+        document_service.get_document_content = AsyncMock(return_value={"extracted_text": "Room schedule"})
+        rag_service = Mock()
+        rag_service.index_documents_batch = AsyncMock(return_value={
+            "doc-1": {"status": "indexed", "chunk_count": 3},
+            "doc-2": {"status": "no_chunks", "chunk_count": 0}
+        })
+        orchestrator = _orchestrator(document_service=document_service, rag_service=rag_service)
+        project = Mock(uploaded_documents=["doc-1", "doc-2"])
+        
+        result = await orchestrator._execute_rag_indexing(project, Mock(), "corr-1")
+        
+        assert [doc["status"] for doc in result["indexed_documents"]] == ["indexed", "no_chunks"]
+        assert result["indexed_count"] == 1
+        assert result["total_chunks"] == 3
+
+
+class TestStepResultCache:
+    """Test result cache keys of idempotent steps"""
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.document_service = Mock(documents={"doc-1": Mock(content_hash="a" * 64)})
+        self.orchestrator = _orchestrator(document_service=self.document_service, cache=Mock())
+        self.step = Mock(step_type=WorkflowStepType.REQUIREMENT_ANALYSIS)
+    
+    def _project(self, documents: List[str]) -> Mock:
+        return Mock(
+            project_id="proj-1",
+            description="Two-storey clinic",
+            uploaded_documents=documents,
+            **{field: None for field in (
+                "project_type", "building_type", "total_area", "floors",
+                "requirements", "constraints", "language"
+            )}
+        )
+    
+    def test_cache_key_covers_uploaded_documents(self):
+        """Test identical form fields with different documents get different keys"""
+        without_documents = self.orchestrator._step_cache_key(self._project([]), self.step)
+        with_documents = self.orchestrator._step_cache_key(self._project(["doc-1"]), self.step)
+        
+        assert without_documents != with_documents
+    
+    def test_cache_key_changes_with_document_content(self):
+        """Test re-processed document content invalidates cached analysis"""
+        project = self._project(["doc-1"])
+        before = self.orchestrator._step_cache_key(project, self.step)
+        
+        self.document_service.documents["doc-1"].content_hash = "b" * 64
+        
+        assert self.orchestrator._step_cache_key(project, self.step) != before
+
+
+_LAYOUT_READERS = {WorkflowStepType.VALIDATION, WorkflowStepType.OPTIMIZATION, WorkflowStepType.REVIT_PREPARATION}
+_LAYOUT_WRITERS = {WorkflowStepType.LAYOUT_GENERATION, WorkflowStepType.OPTIMIZATION}
+
+
+def _workflow_steps(template: List[Dict[str, Any]]) -> List[Mock]:
+    """Create pending workflow steps from template entries"""
+    steps = []
+    for index, entry in enumerate(template):
+        step = Mock(
+            step_id=f"step-{index}",
+            step_type=entry["step_type"],
+            dependencies=list(entry["dependencies"]),
+            status=ProjectStepStatus.PENDING
+        )
+        step.name = entry["name"]  # name is a Mock constructor argument
+        steps.append(step)
+    return steps
+
+
+class TestWorkflowScheduling:
+    """Test dependency-driven launch order of workflow steps"""
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.orchestrator = _orchestrator()
+        self.events: List[tuple] = []
+        self.failing_step_id = None
+    
+    async def _fake_step(self, project, step, correlation_id):
+        self.events.append(("start", step.step_id))
+        await asyncio.sleep(0)
+        self.events.append(("end", step.step_id))
+        if step.step_id == self.failing_step_id:
+            return False, {"error": "step failed"}
+        return True, {}
+    
+    async def _run(self, steps: List[Mock]) -> bool:
+        project = Mock(project_id="proj-1", workflow_steps=steps)
+        with patch.object(self.orchestrator, 'execute_workflow_step', side_effect=self._fake_step):
+            return await self.orchestrator.execute_workflow(project, "corr-1")
+    
+    def _position(self, event: str, step: Mock) -> int:
+        return self.events.index((event, step.step_id))
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("complexity", ["simple", "standard", "complex"])
+    async def test_layout_steps_keep_template_order(self, complexity):
+        """Test layout readers start after every earlier writer, and writers after every earlier reader"""
+        steps = _workflow_steps(_WORKFLOW_TEMPLATES[complexity])
+        
+        assert await self._run(steps) is True
+        
+        assert len(self.events) == 2 * len(steps)
+        for later_index, later in enumerate(steps):
+            for earlier in steps[:later_index]:
+                reads_after_write = later.step_type in _LAYOUT_READERS and earlier.step_type in _LAYOUT_WRITERS
+                writes_after_read = later.step_type in _LAYOUT_WRITERS and earlier.step_type in _LAYOUT_READERS
+                if reads_after_write or writes_after_read:
+                    assert self._position("end", earlier) < self._position("start", later), (later.name, earlier.name)
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("complexity", ["simple", "standard", "complex"])
+    async def test_final_review_starts_after_all_other_steps(self, complexity):
+        """Test final review waits for every scheduled step"""
+        steps = _workflow_steps(_WORKFLOW_TEMPLATES[complexity])
+        
+        await self._run(steps)
+        
+        assert self.events[-2:] == [("start", steps[-1].step_id), ("end", steps[-1].step_id)]
+    
+    @pytest.mark.asyncio
+    async def test_named_dependency_resolves_to_named_step(self):
+        """Test "cost_optimization" waits for the "Cost optimization" step, not the previous step"""
+        steps = _workflow_steps(_WORKFLOW_TEMPLATES["standard"])
+        by_name = {step.name: step for step in steps}
+        
+        await self._run(steps)
+        
+        assert self._position("end", by_name["Cost optimization"]) < self._position(
+            "start", by_name["Validate against building codes"]
+        )
+    
+    @pytest.mark.asyncio
+    async def test_consecutive_validations_run_concurrently(self):
+        """Test validation steps with no layout writer between them start together"""
+        steps = _workflow_steps(_WORKFLOW_TEMPLATES["complex"])
+        validations = [
+            step for step in steps
+            if step.name in ("Structural feasibility check", "Accessibility compliance",
+                             "MEP systems integration")
+        ]
+        
+        await self._run(steps)
+        
+        first_end = min(self._position("end", step) for step in validations)
+        assert all(self._position("start", step) < first_end for step in validations)
+    
+    @pytest.mark.asyncio
+    async def test_unmet_dependency_skips_step_and_its_dependents(self):
+        """Test steps depending on a skipped step are skipped too"""
+        steps = _workflow_steps(_WORKFLOW_TEMPLATES["simple"])
+        steps[2].dependencies = ["revit_preparation"]
+        
+        with patch('app.services.project_service.logger') as mock_logger:
+            assert await self._run(steps) is True
+        
+        started = [step_id for event, step_id in self.events if event == "start"]
+        assert started == [steps[0].step_id, steps[1].step_id, steps[-1].step_id]
+        skipped = [
+            call.kwargs["step_id"] for call in mock_logger.warning.call_args_list
+            if call.args[0] == "Step dependencies not met, skipping"
+        ]
+        assert skipped == [step.step_id for step in steps[2:-1]]
+    
+    @pytest.mark.asyncio
+    async def test_failure_stops_launching_dependents(self):
+        """Test no new steps start after a failure and unstarted steps are logged"""
+        steps = _workflow_steps(_WORKFLOW_TEMPLATES["simple"])
+        self.failing_step_id = steps[1].step_id
+        
+        with patch('app.services.project_service.logger') as mock_logger:
+            assert await self._run(steps) is False
+        
+        assert [step_id for event, step_id in self.events if event == "start"] == [
+            steps[0].step_id, steps[1].step_id
+        ]
+        not_started = mock_logger.warning.call_args.kwargs["step_ids"]
+        assert not_started == [step.step_id for step in steps[2:]]
+
+
+class TestStepStatusCounts:
+    """Test step status counters across retries and re-execution"""
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.service = ProjectService(ai_service=Mock(), document_service=Mock(), rag_service=Mock())
+        self.steps = _workflow_steps([
+            {"step_type": WorkflowStepType.DOCUMENT_PROCESSING, "name": "Process documents", "dependencies": []},
+            {"step_type": WorkflowStepType.RAG_INDEXING, "name": "Index documents",
+             "dependencies": ["document_processing"]}
+        ])
+        self.project = Mock(project_id="proj-1", status=ProjectStatus.CREATED, workflow_steps=self.steps)
+        self.service.projects["proj-1"] = self.project
+        self.indexing_failures = 1
+    
+    async def _process(self, orchestrator, project, step, correlation_id):
+        return {"documents": []}
+    
+    async def _index(self, orchestrator, project, step, correlation_id):
+        if self.indexing_failures:
+            self.indexing_failures -= 1
+            raise RuntimeError("index unavailable")
+        return {"indexed_documents": []}
+    
+    def _counts(self) -> Counter:
+        return +self.service.workflow_orchestrator.step_status_counts(self.project)
+    
+    def _actual_counts(self) -> Counter:
+        return Counter(step.status for step in self.steps)
+    
+    def _patch_steps(self):
+        handlers = {
+            WorkflowStepType.DOCUMENT_PROCESSING: self._process,
+            WorkflowStepType.RAG_INDEXING: self._index
+        }
+        return patch('app.services.project_service._STEP_HANDLERS', handlers), patch.object(
+            self.service.workflow_orchestrator, '_validate_step_completion', AsyncMock(return_value=True)
+        )
+    
+    async def _execute(self) -> None:
+        handlers_patch, validation_patch = self._patch_steps()
+        with handlers_patch, validation_patch:
+            await self.service.execute_project_workflow("proj-1", "corr-1")
+    
+    @pytest.mark.asyncio
+    async def test_retry_then_re_execute_keeps_counts_in_sync(self):
+        """Test counts match step statuses after a failure, a retry and a second run"""
+        await self._execute()
+        assert self.project.status == ProjectStatus.FAILED
+        assert self._counts() == self._actual_counts() == Counter({
+            ProjectStepStatus.COMPLETED: 1, ProjectStepStatus.FAILED: 1
+        })
+        
+        handlers_patch, validation_patch = self._patch_steps()
+        with handlers_patch, validation_patch:
+            assert await self.service.retry_failed_step("proj-1", self.steps[1].step_id, "corr-1") is True
+        assert self._counts() == self._actual_counts() == Counter({ProjectStepStatus.COMPLETED: 2})
+        
+        await self._execute()
+        
+        assert self.project.status == ProjectStatus.COMPLETED
+        assert self._counts() == self._actual_counts()
+    
+    @pytest.mark.asyncio
+    async def test_direct_status_changes_are_recounted_on_execution(self):
+        """Test statuses set outside set_step_status do not leave stale counts"""
+        self.indexing_failures = 0
+        await self._execute()
+        
+        self.steps[1].status = ProjectStepStatus.FAILED
+        self.indexing_failures = 1
+        await self._execute()
+        
+        assert self._counts() == self._actual_counts()
+    
+    def test_storing_a_project_resets_its_counts(self):
+        """Test re-storing a project recounts its steps instead of keeping old counts"""
+        assert self._counts() == Counter({ProjectStepStatus.PENDING: 2})
+        
+        for step in self.steps:
+            step.status = ProjectStepStatus.COMPLETED
+        self.service.projects["proj-1"] = self.project
+        
+        assert self._counts() == Counter({ProjectStepStatus.COMPLETED: 2})
+
+
+class TestProjectStore:
+    """Test in-memory project storage indexes"""
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.on_store = Mock()
+        self.store = ProjectStore(on_store=self.on_store)
+        for project_id in ("proj-1", "proj-2", "proj-3"):
+            self.store[project_id] = self._project(project_id, ProjectStatus.CREATED)
+    
+    def _project(self, project_id: str, status: ProjectStatus, name: str = "Clinic") -> Mock:
+        project = Mock(project_id=project_id, status=status, workflow_steps=[], estimated_duration_minutes=30)
+        project.name = name
+        project.created_at.isoformat.return_value = "2025-06-01T12:00:00"
+        return project
+    
+    def test_updating_a_project_keeps_its_position(self):
+        """Test re-storing an existing project does not make it the newest"""
+        self.store["proj-1"] = self._project("proj-1", ProjectStatus.IN_PROGRESS)
+        
+        assert [project.project_id for project in self.store.newest(0, 10)] == ["proj-3", "proj-2", "proj-1"]
+        assert [project.project_id for project in self.store.with_status(ProjectStatus.IN_PROGRESS)] == ["proj-1"]
+        assert self.store.count_with_status(ProjectStatus.CREATED) == 2
+    
+    def test_summary_is_refreshed_on_every_store(self):
+        """Test the listing summary reflects the latest stored project"""
+        self.store["proj-2"] = self._project("proj-2", ProjectStatus.COMPLETED, name="Library")
+        
+        summary = self.store.summary("proj-2")
+        
+        assert summary.name == "Library"
+        assert summary.status == ProjectStatus.COMPLETED
+    
+    def test_direct_status_change_is_reindexed_on_store(self):
+        """Test storing a project whose status was set directly moves it to the right bucket"""
+        project = self.store["proj-3"]
+        project.status = ProjectStatus.FAILED
+        
+        self.store["proj-3"] = project
+        
+        assert list(self.store.with_status(ProjectStatus.FAILED)) == [project]
+        assert project not in list(self.store.with_status(ProjectStatus.CREATED))
+        assert self.store.summary("proj-3").status == ProjectStatus.FAILED
+    
+    def test_on_store_is_called_for_each_store(self):
+        """Test the on_store callback sees every stored project id"""
+        self.store["proj-1"] = self.store["proj-1"]
+        
+        assert [call.args[0] for call in self.on_store.call_args_list] == ["proj-1", "proj-2", "proj-3", "proj-1"]